@@ -1,38 +1,89 @@
 """Checkpoint management for recovery from interruptions."""
 
+import atexit
+import hashlib
 import json
 import os
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class CheckpointManager:
-    """Manages checkpoint state for resumable processing."""
+    """
+    Manages checkpoint state for resumable processing.
+
+    Claude CLI calls are spawned with close_fds=False, so the journal and
+    snapshot handles opened here must stay non-inheritable (the default
+    for Python's open()) to avoid leaking into child processes.
+    """
+
+    # Repeated per-page/per-record data key prefixes, interned to short
+    # codes in the snapshot file (expanded again on load)
+    KEY_PREFIXES = ('ocr_page_', 'cat_disb_', 'parsed_group_')
+    KEY_CODE_SIGIL = '@'
+
+    # State fields set once at creation, so their snapshot lines are cached
+    STATIC_FIELDS = ('job_id', 'created_at')
+
+    # Step results larger than this (serialized bytes) go to sidecar files
+    BLOB_THRESHOLD = 4096
 
-    def __init__(self, checkpoint_dir: Path, job_id: str):
+    def __init__(
+        self,
+        checkpoint_dir: Path,
+        job_id: str,
+        compact_every: int = 50,
+        flush_interval: float = 0.1
+    ):
         """
         Initialize checkpoint manager.
 
         Args:
             checkpoint_dir: Directory to store checkpoint files
             job_id: Unique identifier for this processing job
+            compact_every: Journaled mutations between full snapshot rewrites
+            flush_interval: Seconds to coalesce journal appends in a background
+                writer (0 writes each mutation immediately)
         """
         self.checkpoint_dir = Path(checkpoint_dir)
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
         self.job_id = job_id
         self.checkpoint_file = self.checkpoint_dir / f"{job_id}.json"
+        self.journal_file = self.checkpoint_dir / f"{job_id}.jsonl"
+        self.blob_dir = self.checkpoint_dir / f"{job_id}_blobs"
+        self.compact_every = compact_every
+        self._pending_mutations = 0
+        self.flush_interval = flush_interval
+        self._journal_fh = None
+        self._pending_lines = []
+        self._lock = threading.RLock()
+        self._dirty = threading.Event()
+        self._writer_thread = None
+        self._static_lines = {}  # field -> encoded snapshot line, for fields set once
+        self._now_cache = (0, '')
         self.state = self._load_or_create()
+        # Mirror of completed_steps for O(1) membership checks
+        self._completed_set = set(self.state['completed_steps'])
 
     def _load_or_create(self) -> dict:
-        """Load existing checkpoint or create new one."""
+        """Load existing checkpoint (snapshot + journal) or create new one."""
         if self.checkpoint_file.exists():
-            with open(self.checkpoint_file, 'r') as f:
-                return json.load(f)
+            state = self._expand_keys(self._loads(self.checkpoint_file.read_bytes()))
+            self._replay_journal(state)
+            return state
+        now = self._now_iso()
         return {
             'job_id': self.job_id,
-            'created_at': datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat(),
+            'created_at': now,
+            'updated_at': now,
             'status': 'initialized',
             'current_step': None,
             'completed_steps': [],
@@ -41,52 +92,330 @@ class CheckpointManager:
             'errors': []
         }
 
-    def save(self):
-        """Save current state to checkpoint file."""
-        self.state['updated_at'] = datetime.now().isoformat()
-        with open(self.checkpoint_file, 'w') as f:
-            json.dump(self.state, f, indent=2, default=str)
+    def _now_iso(self) -> str:
+        """Current time as an ISO string, reformatted at most once per millisecond."""
+        now_ns = time.time_ns()
+        if now_ns - self._now_cache[0] >= 1_000_000:
+            self._now_cache = (now_ns, datetime.fromtimestamp(now_ns / 1e9).isoformat())
+        return self._now_cache[1]
+
+    def _key_codes(self) -> dict:
+        """Map interned data key prefixes to their snapshot codes."""
+        if any(key.startswith(self.KEY_CODE_SIGIL) for key in self.state['data']):
+            return {}  # Can't encode unambiguously; write keys as-is
+        return {
+            prefix: f"{self.KEY_CODE_SIGIL}{i}:"
+            for i, prefix in enumerate(self.KEY_PREFIXES)
+        }
+
+    @staticmethod
+    def _compact_key(key: str, codes: dict) -> str:
+        """Replace a known data key prefix with its snapshot code."""
+        for prefix, code in codes.items():
+            if key.startswith(prefix):
+                return code + key[len(prefix):]
+        return key
+
+    def _snapshot_bytes(self) -> bytes:
+        """
+        Serialize the full state as an indented JSON snapshot.
+
+        Only the fields that never change after creation are encoded once
+        and reused. Data values are re-encoded every time, because callers
+        may have changed them in place since they were set.
+        """
+        codes = self._key_codes()
+
+        data_lines = []
+        for key, value in self.state['data'].items():
+            fragment = self._dumps(value).replace(b'\n', b'\n    ')
+            data_key = self._dumps(self._compact_key(key, codes), indent=False)
+            data_lines.append(b'    ' + data_key + b': ' + fragment)
+        data_block = b'{\n' + b',\n'.join(data_lines) + b'\n  }' if data_lines else b'{}'
+
+        fields = dict(self.state)
+        if codes:
+            fields['_codes'] = {code: prefix for prefix, code in codes.items()}
+        lines = []
+        for key, value in fields.items():
+            if key in self.STATIC_FIELDS:
+                line = self._static_lines.get(key)
+                if line is None:
+                    line = b'  ' + self._dumps(key, indent=False) + b': ' + self._dumps(value)
+                    self._static_lines[key] = line
+                lines.append(line)
+                continue
+            if key == 'data':
+                value_bytes = data_block
+            else:
+                value_bytes = self._dumps(value).replace(b'\n', b'\n  ')
+            lines.append(b'  ' + self._dumps(key, indent=False) + b': ' + value_bytes)
+        return b'{\n' + b',\n'.join(lines) + b'\n}'
+
+    def _expand_keys(self, state: dict) -> dict:
+        """Expand data keys interned in a snapshot, in place."""
+        codes = state.pop('_codes', None)
+        if not codes:
+            return state
+
+        expanded = {}
+        for key, value in state['data'].items():
+            if key.startswith(self.KEY_CODE_SIGIL):
+                code, sep, rest = key.partition(':')
+                if sep and code + sep in codes:
+                    key = codes[code + sep] + rest
+            expanded[key] = value
+        state['data'] = expanded
+        return state
+
+    def _replay_journal(self, state: dict):
+        """
+        Apply journaled mutations recorded since the last snapshot.
+
+        Every _mutate ends with its updated_at line, so ops are applied a
+        whole mutation at a time: a mutation cut short by a crash is
+        dropped entirely rather than half-applied.
+        """
+        if not self.journal_file.exists():
+            return
+        data = self.journal_file.read_bytes()
+        offset = committed = 0
+        ops = []
+        for line in data.splitlines(keepends=True):
+            try:
+                entry = self._loads(line)
+            except ValueError:
+                break  # Torn final line from an interrupted append
+            offset += len(line)
+            ops.append(entry)
+            if entry['path'] == ['updated_at']:
+                for op in ops:
+                    self._apply(state, op['op'], op['path'], op['value'])
+                ops = []
+                committed = offset
+                self._pending_mutations += 1
+        if committed < len(data):
+            # Drop the incomplete tail so later appends start on a clean line
+            os.truncate(self.journal_file, committed)
+
+    @staticmethod
+    def _apply(state: dict, op: str, path: list, value: Any):
+        """Apply a single 'set' or 'append' operation at path within state."""
+        target = state
+        for key in path[:-1]:
+            target = target[key]
+        if op == 'append':
+            target[path[-1]].append(value)
+        else:
+            target[path[-1]] = value
+
+    def _mutate(self, *ops: tuple, fsync: bool = False):
+        """
+        Apply (op, path, value) operations and append them to the journal.
+
+        Only the changed values are written. The full snapshot is rewritten
+        (and the journal truncated) every `compact_every` mutations.
+
+        Args:
+            ops: (op, path, value) tuples, op being 'set' or 'append'
+            fsync: Flush the write to disk before returning
+        """
+        ops += (('set', ['updated_at'], self._now_iso()),)
+        lines = []
+        for op, path, value in ops:
+            self._apply(self.state, op, path, value)
+            lines.append(self._dumps({'op': op, 'path': path, 'value': value}, indent=False))
+            lines.append(b'\n')
+
+        with self._lock:
+            if not self.checkpoint_file.exists() or self._pending_mutations + 1 >= self.compact_every:
+                self.save(fsync=fsync)
+                return
+
+            self._pending_lines.extend(lines)
+            self._pending_mutations += 1
+            if fsync or self.flush_interval <= 0:
+                self.flush(fsync=fsync)
+                return
+
+        # Let the background writer coalesce appends within flush_interval
+        if self._writer_thread is None:
+            self._start_writer()
+        self._dirty.set()
+
+    def _start_writer(self):
+        """Start the background thread that flushes buffered journal lines."""
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop,
+            name=f"checkpoint-{self.job_id}",
+            daemon=True
+        )
+        self._writer_thread.start()
+        atexit.register(self.flush)
+
+    def _writer_loop(self):
+        """Flush buffered journal lines at most once per flush_interval."""
+        while True:
+            self._dirty.wait()
+            time.sleep(self.flush_interval)
+            self._dirty.clear()
+            self.flush()
+
+    def flush(self, fsync: bool = False):
+        """
+        Write buffered journal lines to disk.
+
+        Args:
+            fsync: Flush the journal to disk before returning
+        """
+        with self._lock:
+            if not self._pending_lines:
+                return
+            # Keep the journal open between flushes so each one is a
+            # single unbuffered write() rather than open/write/close
+            if self._journal_fh is None:
+                self._journal_fh = open(self.journal_file, 'ab', buffering=0)
+            self._journal_fh.write(b''.join(self._pending_lines))
+            self._pending_lines = []
+            if fsync:
+                os.fsync(self._journal_fh.fileno())
+
+    def _close_journal(self):
+        """Close the open journal handle, if any."""
+        if self._journal_fh is not None:
+            self._journal_fh.close()
+            self._journal_fh = None
+
+    def save(self, fsync: bool = False):
+        """
+        Save full state snapshot to checkpoint file and reset the journal.
+
+        The snapshot is written to a temp file and swapped in with
+        os.replace, so an interrupted save never leaves a torn checkpoint.
+
+        Args:
+            fsync: Flush the snapshot to disk before the swap
+        """
+        with self._lock:
+            self.state['updated_at'] = self._now_iso()
+            tmp_file = self.checkpoint_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'wb', buffering=1 << 20) as f:
+                f.write(self._snapshot_bytes())
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_file, self.checkpoint_file)
+            # Buffered journal lines are already reflected in the snapshot
+            self._pending_lines = []
+            self._close_journal()
+            if self.journal_file.exists():
+                self.journal_file.unlink()
+            self._pending_mutations = 0
+
+    @staticmethod
+    def _dumps(obj: Any, indent: bool = True) -> bytes:
+        """Serialize to JSON bytes, using orjson when available."""
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, default=str, option=option)
+        return json.dumps(obj, indent=2 if indent else None, default=str).encode('utf-8')
+
+    @staticmethod
+    def _loads(data: bytes) -> Any:
+        """Deserialize JSON bytes, using orjson when available."""
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
 
     def start_step(self, step_name: str, metadata: Optional[dict] = None):
         """Mark a step as started."""
-        self.state['current_step'] = step_name
-        self.state['status'] = 'processing'
+        ops = [
+            ('set', ['current_step'], step_name),
+            ('set', ['status'], 'processing'),
+        ]
         if metadata:
-            self.state['data'][f'{step_name}_metadata'] = metadata
-        self.save()
+            ops.append(('set', ['data', f'{step_name}_metadata'], metadata))
+        self._mutate(*ops)
 
     def complete_step(self, step_name: str, result: Optional[Any] = None):
         """Mark a step as completed."""
-        if step_name not in self.state['completed_steps']:
-            self.state['completed_steps'].append(step_name)
-        self.state['current_step'] = None
+        ops = []
+        if step_name not in self._completed_set:
+            self._completed_set.add(step_name)
+            ops.append(('append', ['completed_steps'], step_name))
+        ops.append(('set', ['current_step'], None))
         if result is not None:
-            self.state['data'][f'{step_name}_result'] = result
-        self.save()
+            ops.append(('set', ['data', f'{step_name}_result'], self._store_blob(result)))
+        self._mutate(*ops)
+
+    def _store_blob(self, value: Any) -> Any:
+        """
+        Move a large value into a content-addressed sidecar file.
+
+        Returns:
+            The value itself if small, else a {"$ref": sha1} reference
+        """
+        data = self._dumps(value, indent=False)
+        if len(data) <= self.BLOB_THRESHOLD:
+            return value
+
+        digest = hashlib.sha1(data).hexdigest()
+        blob_file = self.blob_dir / f"{digest}.json"
+        if not blob_file.exists():
+            self.blob_dir.mkdir(exist_ok=True)
+            tmp_file = blob_file.with_suffix('.json.tmp')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, blob_file)
+        return {'$ref': digest}
+
+    def _load_blob(self, value: Any) -> Any:
+        """Resolve a {"$ref": sha1} reference written by _store_blob."""
+        if isinstance(value, dict) and len(value) == 1 and '$ref' in value:
+            return self._loads((self.blob_dir / f"{value['$ref']}.json").read_bytes())
+        return value
 
     def fail_step(self, step_name: str, error: str):
         """Mark a step as failed."""
-        self.state['failed_steps'].append({
-            'step': step_name,
-            'error': error,
-            'timestamp': datetime.now().isoformat()
-        })
-        self.state['errors'].append(error)
-        self.state['status'] = 'failed'
-        self.save()
+        self._mutate(
+            ('append', ['failed_steps'], {
+                'step': step_name,
+                'error': error,
+                'timestamp': self._now_iso()
+            }),
+            ('append', ['errors'], error),
+            ('set', ['status'], 'failed'),
+        )
 
     def is_step_completed(self, step_name: str) -> bool:
         """Check if a step has been completed."""
-        return step_name in self.state['completed_steps']
+        return step_name in self._completed_set
 
     def get_step_result(self, step_name: str) -> Optional[Any]:
         """Get the result of a completed step."""
-        return self.state['data'].get(f'{step_name}_result')
+        return self._load_blob(self.state['data'].get(f'{step_name}_result'))
 
     def set_data(self, key: str, value: Any):
-        """Store arbitrary data in checkpoint."""
-        self.state['data'][key] = value
-        self.save()
+        """
+        Store arbitrary data in checkpoint.
+
+        The value is journaled as it is at this call; later in-place
+        changes to it are not persisted until it is set again.
+        """
+        self._mutate(('set', ['data', key], value))
+
+    def update_data(self, values: Dict[str, Any]):
+        """
+        Store several data keys in one journaled mutation.
+
+        Use this to persist a changed list together with the key marking
+        its work done, so a resume never sees the mark without the data.
+
+        Args:
+            values: Data keys and their values
+        """
+        self._mutate(*(('set', ['data', key], value) for key, value in values.items()))
 
     def get_data(self, key: str, default: Any = None) -> Any:
         """Retrieve data from checkpoint."""
@@ -94,15 +423,19 @@ class CheckpointManager:
 
     def mark_complete(self):
         """Mark the entire job as complete."""
-        self.state['status'] = 'completed'
-        self.state['completed_at'] = datetime.now().isoformat()
-        self.save()
+        self._mutate(
+            ('set', ['status'], 'completed'),
+            ('set', ['completed_at'], self._now_iso()),
+            fsync=True
+        )
 
     def mark_token_limit(self):
         """Mark that we hit token limits - can resume later."""
-        self.state['status'] = 'token_limit'
-        self.state['token_limit_at'] = datetime.now().isoformat()
-        self.save()
+        self._mutate(
+            ('set', ['status'], 'token_limit'),
+            ('set', ['token_limit_at'], self._now_iso()),
+            fsync=True
+        )
 
     def can_resume(self) -> bool:
         """Check if this job can be resumed."""
@@ -110,9 +443,17 @@ class CheckpointManager:
 
     def clear(self):
         """Clear checkpoint and start fresh."""
-        if self.checkpoint_file.exists():
-            self.checkpoint_file.unlink()
-        self.state = self._load_or_create()
+        with self._lock:
+            if self.checkpoint_file.exists():
+                self.checkpoint_file.unlink()
+            self._pending_lines = []
+            self._close_journal()
+            if self.journal_file.exists():
+                self.journal_file.unlink()
+            self._pending_mutations = 0
+            self._static_lines = {}
+            self.state = self._load_or_create()
+            self._completed_set = set(self.state['completed_steps'])
 
     def summary(self) -> str:
         """Get a human-readable summary of checkpoint state."""
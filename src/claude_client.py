@@ -1,14 +1,90 @@
 """Claude CLI wrapper for text parsing and image OCR."""
 
+import binascii
+import functools
+import hashlib
 import json
+import os
+import re
+import shutil
 import subprocess
+import textwrap
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Union
+from typing import BinaryIO, Callable, Optional, Union
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Phrases in CLI output that indicate rate/token limits
+_TOKEN_LIMIT_RE = re.compile(
+    r"rate limit|token limit|quota exceeded|too many requests|capacity",
+    re.IGNORECASE
+)
+
+# Page types accepted from batch classification, in fallback match order
+_PAGE_TYPES = (
+    'balance_sheet', 'disbursements', 'invoice',
+    'investment_listing', 'income_statement', 'expense_trend',
+    'accounts_receivable', 'bank_reconciliation',
+    'scanned_image', 'unknown'
+)
+_PAGE_TYPE_SET = frozenset(_PAGE_TYPES)
+
+# Markdown code fences in a response; the closing fence is optional so a
+# truncated response still unwraps. A "json"-tagged fence wins over others.
+_JSON_FENCE_RE = re.compile(r"```json\s*(.*?)(?:```|$)", re.DOTALL)
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL)
+
+
+def _extract_json(response: str) -> str:
+    """Return the JSON text from a Claude response, unwrapping a markdown fence."""
+    match = _JSON_FENCE_RE.search(response) or _FENCE_RE.search(response)
+    if match:
+        return match.group(1).strip()
+    return response.strip()
+
+
+def _loads_json(json_str: str):
+    """Parse JSON text, using orjson when available."""
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    # catch the same exception either way
+    if orjson is not None:
+        return orjson.loads(json_str)
+    return json.loads(json_str)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_prompt_prefix(schema_description: str, example: Optional[str]) -> str:
+    """
+    Build the fixed part of a parse_text_to_json prompt, ahead of the text.
+
+    Each parser passes the same schema and example on every call, so the
+    prefix is built once per pair. The parsers' triple-quoted blocks are
+    dedented, which drops their source indentation from every prompt's
+    input tokens without changing the JSON layout of the example.
+    """
+    schema_description = textwrap.dedent(schema_description).strip()
+    example_block = ''
+    if example:
+        example_block = f"Example output format:\n{textwrap.dedent(example).strip()}\n"
+    return f"""Parse the following financial report text into structured JSON.
+
+{schema_description}
+
+{example_block}
+Return ONLY valid JSON, no explanations or markdown.
+
+TEXT TO PARSE:
+"""
+
 
 class TokenLimitError(Exception):
     """Raised when Claude CLI indicates token/rate limits."""
@@ -18,34 +94,47 @@ class TokenLimitError(Exception):
 class ClaudeClient:
     """Wrapper for Claude CLI to handle parsing and OCR tasks."""
 
-    def __init__(self, max_retries: int = 3, retry_delay: float = 5.0):
+    # Resolved path to the Claude CLI, shared by all instances once verified
+    _bin: Optional[str] = None
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        retry_delay: float = 5.0,
+        cache_dir: Optional[Path] = None
+    ):
         """
         Initialize Claude client.
 
         Args:
             max_retries: Number of retries on transient failures
             retry_delay: Seconds to wait between retries
+            cache_dir: Optional directory for parse_text_to_json results,
+                keyed by a hash of the prompt so reruns skip the CLI
         """
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self._verify_claude_cli()
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if ClaudeClient._bin is None:
+            self._verify_claude_cli()
 
     def _verify_claude_cli(self):
-        """Verify Claude CLI is available."""
-        try:
-            result = subprocess.run(
-                ['claude', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode != 0:
-                raise RuntimeError("Claude CLI not working properly")
-            logger.info(f"Claude CLI available: {result.stdout.strip()}")
-        except FileNotFoundError:
+        """Verify Claude CLI is available and cache its resolved path."""
+        claude_bin = shutil.which('claude')
+        if claude_bin is None:
             raise RuntimeError(
                 "Claude CLI not found. Install from: https://claude.ai/code"
             )
+        result = subprocess.run(
+            [claude_bin, '--version'],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        if result.returncode != 0:
+            raise RuntimeError("Claude CLI not working properly")
+        logger.info(f"Claude CLI available: {result.stdout.strip()}")
+        ClaudeClient._bin = claude_bin
 
     def _run_claude(
         self,
@@ -70,12 +159,10 @@ class ClaudeClient:
             TokenLimitError: If rate/token limited
             RuntimeError: On other failures
         """
-        use_stdin = False
-        stdin_content = None
+        stdin_writer = None
 
-        # Handle image input by embedding base64 in prompt
+        # Handle image input by embedding base64 in prompt, streamed via stdin
         if image_path and Path(image_path).exists():
-            import base64
             import mimetypes
             image_path = Path(image_path)
 
@@ -84,23 +171,20 @@ class ClaudeClient:
             if not mime_type:
                 mime_type = 'image/png'
 
-            # Read and encode image
-            with open(image_path, 'rb') as f:
-                image_data = base64.b64encode(f.read()).decode('utf-8')
-
-            # Embed as data URI in prompt - use stdin for large content
-            data_uri = f"data:{mime_type};base64,{image_data}"
-            prompt = f"[Image: {data_uri}]\n\n{prompt}"
-            logger.debug(f"Embedded image ({len(image_data)} bytes base64) in prompt")
-            use_stdin = True
-            stdin_content = prompt
+            stdin_writer = functools.partial(
+                self._write_image_prompt,
+                image_path=image_path,
+                mime_type=mime_type,
+                prompt=prompt
+            )
+            logger.debug(f"Streaming image ({image_path.stat().st_size} bytes) in prompt")
 
         # Build command - use -p for print (non-interactive) mode
-        if use_stdin:
+        if stdin_writer:
             # For large prompts with images, use stdin
-            cmd = ['claude', '-p', '-']
+            cmd = [self._bin, '-p', '-']
         else:
-            cmd = ['claude', '-p', prompt]
+            cmd = [self._bin, '-p', prompt]
 
         if output_format == 'json':
             cmd.extend(['--output-format', 'json'])
@@ -108,20 +192,11 @@ class ClaudeClient:
         for attempt in range(self.max_retries):
             try:
                 logger.debug(f"Running Claude CLI (attempt {attempt + 1})")
-                result = subprocess.run(
-                    cmd,
-                    input=stdin_content if use_stdin else None,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout
-                )
+                result = self._exec(cmd, timeout, stdin_writer)
 
                 # Check for token/rate limit indicators
-                output = result.stdout + result.stderr
-                if any(phrase in output.lower() for phrase in [
-                    'rate limit', 'token limit', 'quota exceeded',
-                    'too many requests', 'capacity'
-                ]):
+                if (_TOKEN_LIMIT_RE.search(result.stdout)
+                        or _TOKEN_LIMIT_RE.search(result.stderr)):
                     raise TokenLimitError(
                         "Claude rate/token limit reached. "
                         "Save checkpoint and retry later."
@@ -145,6 +220,98 @@ class ClaudeClient:
 
         raise RuntimeError("Claude CLI failed after all retries")
 
+    @staticmethod
+    def _exec(
+        cmd: list,
+        timeout: int,
+        stdin_writer: Optional[Callable[[BinaryIO], None]] = None
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a command, optionally streaming its stdin, and capture output.
+
+        Args:
+            cmd: Command and arguments
+            timeout: Command timeout in seconds
+            stdin_writer: Optional callable that writes bytes to the child's stdin
+
+        Returns:
+            CompletedProcess with decoded stdout/stderr
+
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish in time
+        """
+        # close_fds=False (with the absolute CLI path in cmd[0]) lets
+        # subprocess use posix_spawn instead of fork + closing every fd.
+        # Safe because fds opened by Python are non-inheritable (PEP 446);
+        # don't pass inheritable handles (e.g. os.set_inheritable) around this.
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE if stdin_writer else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=False
+        )
+        writer = None
+        writer_errors = []
+        if stdin_writer:
+            # Stream stdin on a helper thread while communicate() drains
+            # stdout/stderr, so the timeout also covers the write and a child
+            # filling its output pipes can't deadlock against it. The thread
+            # owns the pipe, so communicate() must not flush or close it.
+            stdin, proc.stdin = proc.stdin, None
+
+            def feed():
+                try:
+                    stdin_writer(stdin)
+                except BrokenPipeError:
+                    pass  # Child exited early; its stderr explains why
+                except Exception as e:
+                    writer_errors.append(e)
+                finally:
+                    try:
+                        stdin.close()
+                    except BrokenPipeError:
+                        pass
+
+            writer = threading.Thread(target=feed, name='claude-stdin', daemon=True)
+            writer.start()
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            # Killing the child also unblocks a stalled stdin write
+            proc.kill()
+            proc.communicate()
+            raise
+        finally:
+            if writer:
+                writer.join()
+        if writer_errors:
+            raise writer_errors[0]
+        return subprocess.CompletedProcess(
+            cmd,
+            proc.returncode,
+            stdout.decode('utf-8', errors='replace'),
+            stderr.decode('utf-8', errors='replace')
+        )
+
+    @staticmethod
+    def _write_image_prompt(
+        stream: BinaryIO,
+        image_path: Path,
+        mime_type: str,
+        prompt: str
+    ):
+        """Write an image data URI followed by the prompt as bytes to stream."""
+        stream.write(b"[Image: data:" + mime_type.encode('ascii') + b";base64,")
+        # Chunk size is a multiple of 3 so encoded chunks need no padding.
+        # One read buffer is reused for the whole file.
+        buf = bytearray(3 * 16384)
+        view = memoryview(buf)
+        with open(image_path, 'rb') as f:
+            while n := f.readinto(buf):
+                stream.write(binascii.b2a_base64(view[:n], newline=False))
+        stream.write(b"]\n\n" + prompt.encode('utf-8'))
+
     def parse_text_to_json(
         self,
         text: str,
@@ -162,33 +329,42 @@ class ClaudeClient:
         Returns:
             Parsed data as dictionary
         """
-        prompt = f"""Parse the following financial report text into structured JSON.
-
-{schema_description}
-
-{f'Example output format:{chr(10)}{example}{chr(10)}' if example else ''}
-
-Return ONLY valid JSON, no explanations or markdown.
+        prompt = f"{_parse_prompt_prefix(schema_description, example)}{text}\n"
+        # The prompt carries the schema and example, so editing either
+        # misses the cache instead of returning stale results
+        cache_file = None
+        if self.cache_dir is not None:
+            digest = hashlib.blake2b(prompt.encode('utf-8'), digest_size=20).hexdigest()
+            cache_file = self.cache_dir / f"{digest}.json"
+            try:
+                result = _loads_json(cache_file.read_bytes())
+                logger.debug(f"Using cached Claude parse {digest}")
+                return result
+            except FileNotFoundError:
+                pass
+            except json.JSONDecodeError:
+                logger.warning(f"Ignoring corrupt Claude cache entry: {cache_file}")
 
-TEXT TO PARSE:
-{text}
-"""
         response = self._run_claude(prompt, output_format='text')
 
         # Extract JSON from response (handle if wrapped in markdown)
-        json_str = response
-        if '```json' in response:
-            json_str = response.split('```json')[1].split('```')[0]
-        elif '```' in response:
-            json_str = response.split('```')[1].split('```')[0]
+        json_str = _extract_json(response)
 
         try:
-            return json.loads(json_str.strip())
+            result = _loads_json(json_str)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse Claude response as JSON: {e}")
             logger.debug(f"Response was: {response}")
             raise RuntimeError(f"Invalid JSON from Claude: {e}")
 
+        if cache_file is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Per-thread temp name; concurrent parses may share a prompt
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{threading.get_ident()}.tmp")
+            tmp_file.write_text(json_str, encoding='utf-8')
+            os.replace(tmp_file, cache_file)
+        return result
+
     def ocr_image(
         self,
         image_path: Path,
@@ -305,13 +481,7 @@ Return ONLY valid JSON."""
         response = self._run_claude(prompt)
         try:
             # Handle markdown wrapped JSON
-            json_str = response
-            if '```' in response:
-                json_str = response.split('```')[1]
-                if json_str.startswith('json'):
-                    json_str = json_str[4:]
-                json_str = json_str.split('```')[0]
-            return json.loads(json_str.strip())
+            return _loads_json(_extract_json(response))
         except json.JSONDecodeError:
             return {
                 "category": "Unknown",
@@ -366,32 +536,34 @@ Return ONLY the report type (one of the options above), nothing else."""
     def batch_detect_page_types(
         self,
         page_samples: dict,
-        batch_size: int = 20
+        batch_size: int = 20,
+        max_workers: int = 4
     ) -> dict:
         """
         Classify multiple pages in batched Claude calls.
 
+        Batches are sent to Claude concurrently; each call spends nearly all
+        of its time waiting on the CLI subprocess.
+
         Args:
             page_samples: Dict mapping page_id to text sample (first ~500 chars)
             batch_size: Number of pages per Claude call
+            max_workers: Maximum number of concurrent Claude calls
 
         Returns:
             Dict mapping page_id to report type
         """
-        all_results = {}
         page_ids = list(page_samples.keys())
+        jobs = []
 
         for i in range(0, len(page_ids), batch_size):
             batch_ids = page_ids[i:i + batch_size]
-            batch_data = {pid: page_samples[pid] for pid in batch_ids}
-
-            logger.info(f"  Classifying pages {batch_ids[0]} to {batch_ids[-1]}...")
 
             # Build the prompt with all pages in this batch
-            pages_text = ""
-            for pid in batch_ids:
-                sample = batch_data[pid][:600]  # First 600 chars per page
-                pages_text += f"\n--- {pid} ---\n{sample}\n"
+            # (first 600 chars per page)
+            pages_text = ''.join(
+                f"\n--- {pid} ---\n{page_samples[pid][:600]}\n" for pid in batch_ids
+            )
 
             prompt = f"""Classify each page by its financial report type.
 
@@ -417,43 +589,52 @@ Return a JSON object mapping each page ID to its type. Example:
 
 Return ONLY valid JSON, nothing else."""
 
-            response = self._run_claude(prompt)
+            jobs.append((batch_ids, prompt))
 
-            # Parse the JSON response
-            try:
-                json_str = response
-                if '```' in response:
-                    json_str = response.split('```')[1]
-                    if json_str.startswith('json'):
-                        json_str = json_str[4:]
-                    json_str = json_str.split('```')[0]
-
-                batch_results = json.loads(json_str.strip())
-
-                # Validate and normalize results
-                valid_types = [
-                    'balance_sheet', 'disbursements', 'invoice',
-                    'investment_listing', 'income_statement', 'expense_trend',
-                    'accounts_receivable', 'bank_reconciliation',
-                    'scanned_image', 'unknown'
-                ]
-                for pid in batch_ids:
-                    result = batch_results.get(pid, 'unknown').lower()
-                    # Find matching valid type
-                    matched = 'unknown'
-                    for vt in valid_types:
-                        if vt in result:
-                            matched = vt
-                            break
-                    all_results[pid] = matched
-
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse batch response: {e}")
-                # Fall back to unknown for this batch
-                for pid in batch_ids:
-                    all_results[pid] = 'unknown'
-
-        return all_results
+        all_results = {}
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [
+                executor.submit(self._classify_batch, batch_ids, prompt)
+                for batch_ids, prompt in jobs
+            ]
+            for future in as_completed(futures):
+                all_results.update(future.result())
+        finally:
+            # If any batch failed, don't start the ones not yet picked up
+            executor.shutdown(cancel_futures=True)
+
+        # Preserve page order regardless of batch completion order
+        return {pid: all_results[pid] for pid in page_ids}
+
+    def _classify_batch(self, batch_ids: list, prompt: str) -> dict:
+        """Run one page-classification prompt and normalize its result."""
+        logger.info(f"  Classifying pages {batch_ids[0]} to {batch_ids[-1]}...")
+        response = self._run_claude(prompt)
+        results = {}
+
+        # Parse the JSON response
+        try:
+            batch_results = _loads_json(_extract_json(response))
+
+            # Validate and normalize results
+            for pid in batch_ids:
+                result = batch_results.get(pid, 'unknown').strip().lower()
+                if result in _PAGE_TYPE_SET:
+                    results[pid] = result
+                else:
+                    # Fall back to finding a valid type within the answer
+                    results[pid] = next(
+                        (vt for vt in _PAGE_TYPES if vt in result), 'unknown'
+                    )
+
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to parse batch response: {e}")
+            # Fall back to unknown for this batch
+            for pid in batch_ids:
+                results[pid] = 'unknown'
+
+        return results
 
     def group_consecutive_pages(self, page_types: dict) -> list:
         """
@@ -469,12 +650,13 @@ Return ONLY valid JSON, nothing else."""
             return []
 
         # Sort by page number
-        sorted_pages = sorted(page_types.keys(), key=lambda x: int(x.split('_')[1]))
+        indexed = [(int(page_id.rsplit('_', 1)[1]), page_id) for page_id in page_types]
+        indexed.sort()
 
         groups = []
         current_group = None
 
-        for page_id in sorted_pages:
+        for _, page_id in indexed:
             page_type = page_types[page_id]
 
             if current_group is None or current_group['type'] != page_type:
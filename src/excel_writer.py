@@ -1,15 +1,221 @@
 """Excel output with multiple tabs for different report types."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice, repeat, zip_longest
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Iterable, Optional, Sequence
 from datetime import datetime
 import logging
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 logger = logging.getLogger(__name__)
 
+# Data rows inspected per sheet when estimating column widths
+WIDTH_SAMPLE_ROWS = 50
+
+# Expense trend records per vectorized variance computation
+VARIANCE_CHUNK_ROWS = 1024
+
+CURRENCY_FORMAT = '$#,##0.00'
+PERCENT_FORMAT = '0.00%'
+
+# Column kinds: default value for missing fields and number format
+COLUMN_KINDS = {
+    'text': ('', None),
+    'label': ('', None),  # text repeated across rows, stored once per writer
+    'currency': (0, CURRENCY_FORMAT),
+    'percent': (0, PERCENT_FORMAT),
+}
+
+# Sheet schemas: (header, record field, column kind) in column order
+BALANCE_SHEET_SCHEMA = (
+    ("Account Code", 'account_code', 'text'),
+    ("Account Name", 'account_name', 'text'),
+    ("Category", 'category', 'text'),
+    ("Subcategory", 'subcategory', 'text'),
+    ("Current Balance", 'current_balance', 'currency'),
+    ("Prior Balance", 'prior_balance', 'currency'),
+    ("Change", 'change', 'currency'),
+)
+DISBURSEMENT_SCHEMA = (
+    ("Check #", 'check_number', 'text'),
+    ("Date", 'check_date', 'text'),
+    ("Vendor", 'vendor', 'label'),
+    ("Account Code", 'account_code', 'text'),
+    ("Account Name", 'account_name', 'label'),
+    ("Description", 'description', 'text'),
+    ("Amount", 'amount', 'currency'),
+    ("Category", 'category', 'label'),
+)
+INVOICE_SCHEMA = (
+    ("Invoice ID", 'invoice_id', 'text'),
+    ("Date", 'invoice_date', 'text'),
+    ("Vendor", 'vendor', 'label'),
+    ("Description", 'description', 'text'),
+    ("Amount", 'amount', 'currency'),
+    ("Source Page", 'source_page', 'text'),
+    ("OCR Confidence", 'ocr_confidence', 'text'),
+)
+INVESTMENT_SCHEMA = (
+    ("Account Code", 'account_code', 'text'),
+    ("Account Name", 'account_name', 'label'),
+    ("Institution", 'institution', 'label'),
+    ("Account #", 'account_number', 'text'),
+    ("Type", 'type', 'label'),
+    ("Balance", 'balance', 'currency'),
+    ("Rate %", 'rate', 'percent'),
+)
+BANK_RECONCILIATION_SCHEMA = (
+    ("Account Code", 'account_code', 'text'),
+    ("Account Name", 'account_name', 'text'),
+    ("Type", 'account_type', 'text'),
+    ("Bank Balance", 'balance_per_bank', 'currency'),
+    ("Outstanding Deposits", 'total_outstanding_deposits', 'currency'),
+    ("Outstanding Checks", 'total_outstanding_checks', 'currency'),
+    ("GL Balance", 'ending_balance_gl', 'currency'),
+    ("Difference", 'difference', 'currency'),
+    ("Reconciled", 'is_reconciled', 'text'),
+)
+ACCOUNTS_RECEIVABLE_SCHEMA = (
+    ("Account ID", 'account_id', 'text'),
+    ("Name", 'name', 'text'),
+    ("Address", 'address', 'text'),
+    ("Status", 'section', 'label'),
+    ("Current", 'day_30', 'currency'),
+    ("31-60 Days", 'day_31_60', 'currency'),
+    ("61-90 Days", 'day_61_90', 'currency'),
+    ("91-120 Days", 'day_91_120', 'currency'),
+    ("120+ Days", 'day_120_plus', 'currency'),
+    ("Total Balance", 'total_balance', 'currency'),
+)
+INCOME_STATEMENT_SCHEMA = (
+    ("Account", 'account_code', 'text'),
+    ("Name", 'account_name', 'label'),
+    ("Section", 'section', 'label'),
+    ("Category", 'category', 'label'),
+    ("Curr Actual", 'current_actual', 'currency'),
+    ("Curr Budget", 'current_budget', 'currency'),
+    ("Curr Var", 'current_variance', 'currency'),
+    ("YTD Actual", 'ytd_actual', 'currency'),
+    ("YTD Budget", 'ytd_budget', 'currency'),
+    ("YTD Var", 'ytd_variance', 'currency'),
+    ("Annual Budget", 'annual_budget', 'currency'),
+    ("Remaining", 'budget_remaining', 'currency'),
+)
+EXPENSE_TREND_SCHEMA = (
+    ("Account", 'account_code', 'text'),
+    ("Name", 'account_name', 'text'),
+    ("Category", 'category', 'text'),
+    *((month.title(), month, 'currency') for month in (
+        'jan', 'feb', 'mar', 'apr', 'may', 'jun',
+        'jul', 'aug', 'sep', 'oct', 'nov'
+    )),
+    ("Full Year", 'full_year_actual', 'currency'),
+    ("Budget", 'total_budget', 'currency'),
+    ("Variance", 'variance', 'currency'),
+)
+
+
+def _build_row_function(schema: tuple) -> Callable:
+    """
+    Generate a row builder specialized to one sheet schema.
+
+    Parser records normally carry every schema field, so the generated
+    function first fetches them all with one C-level itemgetter call and
+    only falls back to per-field r.get() with constant defaults when a
+    field is missing. Label columns go through the intern callable
+    (dict.setdefault), e.g. for a two-column schema:
+
+        def build_row(r, intern):
+            try:
+                v0, v1 = fetch(r)
+            except KeyError:
+                get = r.get
+                v0 = get('account_code', '')
+                v1 = get('vendor', '')
+            return (v0, intern(v1, v1),)
+    """
+    names = [f"v{idx}" for idx in range(len(schema))]
+    lines = [
+        "def build_row(r, intern):",
+        "    try:",
+        f"        {', '.join(names)}, = fetch(r)",
+        "    except KeyError:",
+        "        get = r.get",
+    ]
+    columns = []
+    for name, (_, field, kind) in zip(names, schema):
+        lines.append(f"        {name} = get({field!r}, {COLUMN_KINDS[kind][0]!r})")
+        columns.append(f"intern({name}, {name})" if kind == 'label' else name)
+    lines.append(f"    return ({', '.join(columns)},)")
+
+    fields = [field for _, field, _ in schema]
+    if len(fields) == 1:
+        # itemgetter returns a bare value rather than a tuple for one field
+        fetch = lambda r: (r[fields[0]],)
+    else:
+        fetch = itemgetter(*fields)
+
+    namespace = {'fetch': fetch}
+    exec(compile("\n".join(lines) + "\n", f"<row builder: {schema[0][0]}...>", 'exec'), namespace)
+    return namespace['build_row']
+
+
+@lru_cache(maxsize=None)
+def _compile_schema(schema: tuple):
+    """
+    Build the pieces _write_table needs from a sheet schema.
+
+    Returns:
+        Tuple of (headers, row builder, number formats keyed by 1-based
+        column number)
+    """
+    headers = [header for header, _, _ in schema]
+    number_formats = {
+        col: COLUMN_KINDS[kind][1]
+        for col, (_, _, kind) in enumerate(schema, 1)
+        if COLUMN_KINDS[kind][1]
+    }
+    return headers, _build_row_function(schema), number_formats
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _budget_variances(full_year, budget):
+        """Budget - Full Year Actual per row, or 0 where either is zero."""
+        variance = np.zeros_like(full_year)
+        for i in range(full_year.shape[0]):
+            if budget[i] != 0.0 and full_year[i] != 0.0:
+                variance[i] = budget[i] - full_year[i]
+        return variance
+else:
+    def _budget_variances(full_year, budget):
+        """Budget - Full Year Actual per row, or 0 where either is zero."""
+        return np.where((budget != 0.0) & (full_year != 0.0), budget - full_year, 0.0)
+
 
 class ExcelWriter:
-    """Create multi-tab Excel files from parsed financial data."""
+    """
+    Create multi-tab Excel files from parsed financial data.
+
+    The add_* methods accept any iterable of records, including generators
+    straight from a parser; rows are streamed to the sheet one at a time.
+    """
+
+    # Set by save_async() until wait_saved() collects it
+    _save_future = None
 
     def __init__(self, output_path: Path):
         """
@@ -24,9 +230,14 @@ class ExcelWriter:
         # Import here to allow graceful failure
         try:
             import openpyxl
-            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+            from openpyxl.utils import get_column_letter
             from openpyxl.utils.dataframe import dataframe_to_rows
             self.openpyxl = openpyxl
+            self.WriteOnlyCell = WriteOnlyCell
+            self.get_column_letter = get_column_letter
+            self.dataframe_to_rows = dataframe_to_rows
             self.styles = {
                 'Font': Font,
                 'PatternFill': PatternFill,
@@ -37,10 +248,24 @@ class ExcelWriter:
         except ImportError:
             raise RuntimeError("openpyxl not installed. Run: pip install openpyxl")
 
-        self.workbook = self.openpyxl.Workbook()
-        # Remove default sheet
-        self.workbook.remove(self.workbook.active)
+        # Style objects are immutable, so build them once and share them
+        self._header_font = Font(bold=True, color='FFFFFF')
+        self._header_fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
+        self._header_align = Alignment(horizontal='center', wrap_text=True)
+        self._bold_font = Font(bold=True)
+
+        # Write-only workbooks stream each row to a temp file as it is
+        # appended instead of keeping every Cell alive until save(). Rows
+        # must be appended in order and columns sized before the first row.
+        self.workbook = self.openpyxl.Workbook(write_only=True)
         self.sheets = {}
+        self._str_cache = {}
+
+        # Number formats are registered once as named styles so every
+        # formatted cell shares a single style record in styles.xml
+        self._named_styles = {CURRENCY_FORMAT: 'currency', PERCENT_FORMAT: 'percent'}
+        for number_format, name in self._named_styles.items():
+            self.workbook.add_named_style(NamedStyle(name=name, number_format=number_format))
 
     def _get_or_create_sheet(self, name: str):
         """Get existing sheet or create new one."""
@@ -52,40 +277,214 @@ class ExcelWriter:
 
     def _apply_header_style(self, cell):
         """Apply header styling to a cell."""
-        Font = self.styles['Font']
-        PatternFill = self.styles['PatternFill']
-        Alignment = self.styles['Alignment']
-
-        cell.font = Font(bold=True, color='FFFFFF')
-        cell.fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-        cell.alignment = Alignment(horizontal='center', wrap_text=True)
+        cell.font = self._header_font
+        cell.fill = self._header_fill
+        cell.alignment = self._header_align
 
     def _apply_currency_format(self, cell):
         """Apply currency format to a cell."""
-        cell.number_format = '$#,##0.00'
-
-    def _auto_adjust_columns(self, sheet):
-        """Auto-adjust column widths based on content."""
-        from openpyxl.cell.cell import MergedCell
-        from openpyxl.utils import get_column_letter
-
-        for col_idx, column_cells in enumerate(sheet.columns, 1):
-            max_length = 0
-            for cell in column_cells:
-                # Skip merged cells
-                if isinstance(cell, MergedCell):
-                    continue
-                try:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                except:
-                    pass
-            # Cap at reasonable width
-            adjusted_width = min(max_length + 2, 50) if max_length > 0 else 10
-            column_letter = get_column_letter(col_idx)
-            sheet.column_dimensions[column_letter].width = adjusted_width
+        cell.style = 'currency'
+
+    def _header_row(self, sheet, headers: List[str]) -> List[Any]:
+        """Build a styled header row for appending to a write-only sheet."""
+        row = []
+        for header in headers:
+            cell = self.WriteOnlyCell(sheet, value=header)
+            self._apply_header_style(cell)
+            row.append(cell)
+        return row
+
+    def _number_cell(self, sheet, value: Any):
+        """
+        Build a cell for a numeric column.
+
+        Values go through openpyxl's public setter, so bools, numeric
+        strings and 'nan'/'inf' text keep their normal type handling
+        instead of being coerced to floats.
+        """
+        return self.WriteOnlyCell(sheet, value=value)
+
+    def _column_widths(self, headers: List[str], sample_rows: Iterable[Sequence[Any]] = ()) -> List[int]:
+        """Estimate column widths from the header text and a sample of rows."""
+        widths = [len(str(header)) for header in headers]
+        sample_rows = list(sample_rows)
+
+        lengths = None
+        if np is not None and sample_rows:
+            try:
+                # One C-level str() and length pass over the rectangular sample
+                lengths = np.char.str_len(np.array(sample_rows, dtype=str)).max(axis=0).tolist()
+            except (ValueError, TypeError):
+                # Ragged rows; measure them one value at a time below
+                lengths = None
+
+        if lengths is None:
+            # Ragged rows: measure column by column with C-level map/filter.
+            # filter(None) also drops 0, '' and False, all far narrower
+            # than the minimum width.
+            lengths = [
+                max(map(len, map(str, filter(None, column))), default=0)
+                for column in zip_longest(*sample_rows)
+            ]
+
+        widths.extend([0] * (len(lengths) - len(widths)))
+        widths = [max(width, length) for width, length in zip(widths, lengths)] + widths[len(lengths):]
+
+        # Cap at reasonable width
+        return [min(max(width + 2, 10), 50) for width in widths]
+
+    def _auto_adjust_columns(self, sheet, headers: List[str], sample_rows: Iterable[Sequence[Any]] = ()):
+        """
+        Set column widths from the header text and leading data rows.
+
+        Write-only sheets cannot be read back, so this must be called
+        before the first row is appended.
+
+        Args:
+            sheet: Worksheet to size
+            headers: Header text, in column order
+            sample_rows: First few data rows (at most WIDTH_SAMPLE_ROWS)
+        """
+        for col_idx, width in enumerate(self._column_widths(headers, sample_rows), 1):
+            column_letter = self.get_column_letter(col_idx)
+            sheet.column_dimensions[column_letter].width = width
+
+    def _write_rows(
+        self,
+        sheet_name: str,
+        headers: Optional[List[str]],
+        rows: Iterable[Sequence[Any]],
+        number_formats: Optional[Dict[int, str]] = None,
+        bold_rows: Optional[set] = None
+    ):
+        """
+        Write a styled header row followed by plain data rows.
+
+        Args:
+            sheet_name: Name for the sheet
+            headers: Header row, or None for no header
+            rows: Data rows as sequences of plain values
+            number_formats: Number format per 1-based column number
+            bold_rows: 0-based data row indexes whose formatted cells are bold
+
+        Returns:
+            Number of data rows written
+        """
+        sheet = self._get_or_create_sheet(sheet_name)
+        number_formats = number_formats or {}
+        # May be filled in while rows are consumed, so keep the same set
+        bold_rows = bold_rows if bold_rows is not None else set()
+
+        # Size columns from the leading rows, then write them back in order
+        rows = iter(rows)
+        sample = list(islice(rows, WIDTH_SAMPLE_ROWS))
+        self._auto_adjust_columns(sheet, headers or [], sample)
+
+        if headers:
+            sheet.append(self._header_row(sheet, headers))
+
+        # Bind hot attributes to locals for the per-row loop
+        append = sheet.append
+        number_cell = self._number_cell
+        named_styles = self._named_styles
+        bold_font = self._bold_font
+        formats = list(number_formats.items())
+
+        count = 0
+        for row_idx, row in enumerate(chain(sample, rows)):
+            count += 1
+            if formats:
+                row = list(row)
+                bold = row_idx in bold_rows
+                for col, number_format in formats:
+                    cell = number_cell(sheet, row[col - 1])
+                    if number_format in named_styles:
+                        cell.style = named_styles[number_format]
+                    else:
+                        cell.number_format = number_format
+                    if bold:
+                        cell.font = bold_font
+                    row[col - 1] = cell
+            append(row)
+
+        return count
+
+    def _dataframe_rows(self, df) -> Iterable[Sequence[Any]]:
+        """Iterate DataFrame rows as plain values, without index or header."""
+        return self.dataframe_to_rows(df, index=False, header=False)
+
+    def _write_table(
+        self,
+        sheet_name: str,
+        schema: tuple,
+        records: Iterable[Dict[str, Any]],
+        highlight_totals: bool = False
+    ):
+        """
+        Write records to a sheet laid out by a column schema.
+
+        Args:
+            sheet_name: Name for the sheet
+            schema: Sheet schema of (header, field, kind) columns
+            records: Records to write, one row each
+            highlight_totals: Bold the formatted cells of records with is_total set
 
-    def add_balance_sheet(self, data: List[Dict[str, Any]], sheet_name: str = "Balance Sheet"):
+        Returns:
+            Number of data rows written
+        """
+        headers, build_row, number_formats = _compile_schema(schema)
+        intern = self._str_cache.setdefault
+        bold_rows = set()
+
+        def rows():
+            for idx, record in enumerate(records):
+                # Filled in as rows are consumed, ahead of the writer's check
+                if highlight_totals and record.get('is_total', False):
+                    bold_rows.add(idx)
+                yield build_row(record, intern)
+
+        return self._write_rows(sheet_name, headers, rows(), number_formats, bold_rows)
+
+    @staticmethod
+    def _budget_variance(record: Dict[str, Any]) -> float:
+        """Variance = Budget - Full Year Actual, or 0 when either is missing."""
+        full_year = record.get('full_year_actual', 0)
+        budget = record.get('total_budget', 0)
+        return budget - full_year if budget and full_year else 0
+
+    def _with_budget_variance(self, data: Iterable[Dict[str, Any]]) -> Iterable[Dict[str, Any]]:
+        """
+        Yield expense trend records with a computed 'variance' field.
+
+        Records are taken VARIANCE_CHUNK_ROWS at a time and each chunk's
+        variances are computed in one array operation when numpy is
+        available, so streaming input stays bounded in memory.
+        """
+        data = iter(data)
+        while True:
+            chunk = list(islice(data, VARIANCE_CHUNK_ROWS))
+            if not chunk:
+                return
+
+            variances = None
+            if np is not None:
+                try:
+                    # None becomes NaN, which counts as missing (0)
+                    full_year = np.nan_to_num(np.array(
+                        [record.get('full_year_actual', 0) for record in chunk], dtype=float))
+                    budget = np.nan_to_num(np.array(
+                        [record.get('total_budget', 0) for record in chunk], dtype=float))
+                    variances = _budget_variances(full_year, budget).tolist()
+                except (TypeError, ValueError):
+                    variances = None
+
+            if variances is None:
+                variances = [self._budget_variance(record) for record in chunk]
+
+            for record, variance in zip(chunk, variances):
+                yield {**record, 'variance': variance}
+
+    def add_balance_sheet(self, data: Iterable[Dict[str, Any]], sheet_name: str = "Balance Sheet"):
         """
         Add balance sheet data to workbook.
 
@@ -103,33 +502,10 @@ class ExcelWriter:
             ...
         ]
         """
-        sheet = self._get_or_create_sheet(sheet_name)
-
-        headers = [
-            "Account Code", "Account Name", "Category", "Subcategory",
-            "Current Balance", "Prior Balance", "Change"
-        ]
+        count = self._write_table(sheet_name, BALANCE_SHEET_SCHEMA, data)
+        logger.info(f"Added {count} rows to {sheet_name}")
 
-        # Write headers
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
-        # Write data
-        for row_idx, record in enumerate(data, 2):
-            sheet.cell(row=row_idx, column=1, value=record.get('account_code', ''))
-            sheet.cell(row=row_idx, column=2, value=record.get('account_name', ''))
-            sheet.cell(row=row_idx, column=3, value=record.get('category', ''))
-            sheet.cell(row=row_idx, column=4, value=record.get('subcategory', ''))
-
-            for col, field in [(5, 'current_balance'), (6, 'prior_balance'), (7, 'change')]:
-                cell = sheet.cell(row=row_idx, column=col, value=record.get(field, 0))
-                self._apply_currency_format(cell)
-
-        self._auto_adjust_columns(sheet)
-        logger.info(f"Added {len(data)} rows to {sheet_name}")
-
-    def add_disbursements(self, data: List[Dict[str, Any]], sheet_name: str = "Disbursements"):
+    def add_disbursements(self, data: Iterable[Dict[str, Any]], sheet_name: str = "Disbursements"):
         """
         Add check disbursement data to workbook.
 
@@ -148,34 +524,10 @@ class ExcelWriter:
             ...
         ]
         """
-        sheet = self._get_or_create_sheet(sheet_name)
-
-        headers = [
-            "Check #", "Date", "Vendor", "Account Code", "Account Name",
-            "Description", "Amount", "Category"
-        ]
+        count = self._write_table(sheet_name, DISBURSEMENT_SCHEMA, data)
+        logger.info(f"Added {count} rows to {sheet_name}")
 
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
-        for row_idx, record in enumerate(data, 2):
-            sheet.cell(row=row_idx, column=1, value=record.get('check_number', ''))
-            sheet.cell(row=row_idx, column=2, value=record.get('check_date', ''))
-            sheet.cell(row=row_idx, column=3, value=record.get('vendor', ''))
-            sheet.cell(row=row_idx, column=4, value=record.get('account_code', ''))
-            sheet.cell(row=row_idx, column=5, value=record.get('account_name', ''))
-            sheet.cell(row=row_idx, column=6, value=record.get('description', ''))
-
-            amount_cell = sheet.cell(row=row_idx, column=7, value=record.get('amount', 0))
-            self._apply_currency_format(amount_cell)
-
-            sheet.cell(row=row_idx, column=8, value=record.get('category', ''))
-
-        self._auto_adjust_columns(sheet)
-        logger.info(f"Added {len(data)} rows to {sheet_name}")
-
-    def add_invoices(self, data: List[Dict[str, Any]], sheet_name: str = "Invoices"):
+    def add_invoices(self, data: Iterable[Dict[str, Any]], sheet_name: str = "Invoices"):
         """
         Add invoice data to workbook.
 
@@ -193,33 +545,10 @@ class ExcelWriter:
             ...
         ]
         """
-        sheet = self._get_or_create_sheet(sheet_name)
-
-        headers = [
-            "Invoice ID", "Date", "Vendor", "Description",
-            "Amount", "Source Page", "OCR Confidence"
-        ]
-
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
-        for row_idx, record in enumerate(data, 2):
-            sheet.cell(row=row_idx, column=1, value=record.get('invoice_id', ''))
-            sheet.cell(row=row_idx, column=2, value=record.get('invoice_date', ''))
-            sheet.cell(row=row_idx, column=3, value=record.get('vendor', ''))
-            sheet.cell(row=row_idx, column=4, value=record.get('description', ''))
+        count = self._write_table(sheet_name, INVOICE_SCHEMA, data)
+        logger.info(f"Added {count} rows to {sheet_name}")
 
-            amount_cell = sheet.cell(row=row_idx, column=5, value=record.get('amount', 0))
-            self._apply_currency_format(amount_cell)
-
-            sheet.cell(row=row_idx, column=6, value=record.get('source_page', ''))
-            sheet.cell(row=row_idx, column=7, value=record.get('ocr_confidence', ''))
-
-        self._auto_adjust_columns(sheet)
-        logger.info(f"Added {len(data)} rows to {sheet_name}")
-
-    def add_investments(self, data: List[Dict[str, Any]], sheet_name: str = "Investments"):
+    def add_investments(self, data: Iterable[Dict[str, Any]], sheet_name: str = "Investments"):
         """
         Add investment/bank account data to workbook.
 
@@ -237,34 +566,10 @@ class ExcelWriter:
             ...
         ]
         """
-        sheet = self._get_or_create_sheet(sheet_name)
+        count = self._write_table(sheet_name, INVESTMENT_SCHEMA, data)
+        logger.info(f"Added {count} rows to {sheet_name}")
 
-        headers = [
-            "Account Code", "Account Name", "Institution",
-            "Account #", "Type", "Balance", "Rate %"
-        ]
-
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
-        for row_idx, record in enumerate(data, 2):
-            sheet.cell(row=row_idx, column=1, value=record.get('account_code', ''))
-            sheet.cell(row=row_idx, column=2, value=record.get('account_name', ''))
-            sheet.cell(row=row_idx, column=3, value=record.get('institution', ''))
-            sheet.cell(row=row_idx, column=4, value=record.get('account_number', ''))
-            sheet.cell(row=row_idx, column=5, value=record.get('type', ''))
-
-            balance_cell = sheet.cell(row=row_idx, column=6, value=record.get('balance', 0))
-            self._apply_currency_format(balance_cell)
-
-            rate_cell = sheet.cell(row=row_idx, column=7, value=record.get('rate', 0))
-            rate_cell.number_format = '0.00%'
-
-        self._auto_adjust_columns(sheet)
-        logger.info(f"Added {len(data)} rows to {sheet_name}")
-
-    def add_bank_reconciliation(self, data: List[Dict[str, Any]], sheet_name: str = "Bank Reconciliation"):
+    def add_bank_reconciliation(self, data: Iterable[Dict[str, Any]], sheet_name: str = "Bank Reconciliation"):
         """
         Add bank reconciliation data to workbook.
 
@@ -284,40 +589,14 @@ class ExcelWriter:
             ...
         ]
         """
-        sheet = self._get_or_create_sheet(sheet_name)
-
-        headers = [
-            "Account Code", "Account Name", "Type", "Bank Balance",
-            "Outstanding Deposits", "Outstanding Checks", "GL Balance",
-            "Difference", "Reconciled"
-        ]
-
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
-        for row_idx, record in enumerate(data, 2):
-            sheet.cell(row=row_idx, column=1, value=record.get('account_code', ''))
-            sheet.cell(row=row_idx, column=2, value=record.get('account_name', ''))
-            sheet.cell(row=row_idx, column=3, value=record.get('account_type', ''))
-
-            for col, field in [
-                (4, 'balance_per_bank'),
-                (5, 'total_outstanding_deposits'),
-                (6, 'total_outstanding_checks'),
-                (7, 'ending_balance_gl'),
-                (8, 'difference')
-            ]:
-                cell = sheet.cell(row=row_idx, column=col, value=record.get(field, 0))
-                self._apply_currency_format(cell)
-
-            reconciled = record.get('is_reconciled', False)
-            sheet.cell(row=row_idx, column=9, value="Yes" if reconciled else "No")
-
-        self._auto_adjust_columns(sheet)
-        logger.info(f"Added {len(data)} rows to {sheet_name}")
-
-    def add_accounts_receivable(self, data: List[Dict[str, Any]], sheet_name: str = "Accounts Receivable"):
+        records = (
+            {**record, 'is_reconciled': "Yes" if record.get('is_reconciled', False) else "No"}
+            for record in data
+        )
+        count = self._write_table(sheet_name, BANK_RECONCILIATION_SCHEMA, records)
+        logger.info(f"Added {count} rows to {sheet_name}")
+
+    def add_accounts_receivable(self, data: Iterable[Dict[str, Any]], sheet_name: str = "Accounts Receivable"):
         """
         Add accounts receivable / delinquency data to workbook.
 
@@ -338,39 +617,11 @@ class ExcelWriter:
             ...
         ]
         """
-        sheet = self._get_or_create_sheet(sheet_name)
-
-        headers = [
-            "Account ID", "Name", "Address", "Status",
-            "Current", "31-60 Days", "61-90 Days", "91-120 Days",
-            "120+ Days", "Total Balance"
-        ]
-
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
-        for row_idx, record in enumerate(data, 2):
-            sheet.cell(row=row_idx, column=1, value=record.get('account_id', ''))
-            sheet.cell(row=row_idx, column=2, value=record.get('name', ''))
-            sheet.cell(row=row_idx, column=3, value=record.get('address', ''))
-            sheet.cell(row=row_idx, column=4, value=record.get('section', '').title())
-
-            for col, field in [
-                (5, 'day_30'),
-                (6, 'day_31_60'),
-                (7, 'day_61_90'),
-                (8, 'day_91_120'),
-                (9, 'day_120_plus'),
-                (10, 'total_balance')
-            ]:
-                cell = sheet.cell(row=row_idx, column=col, value=record.get(field, 0))
-                self._apply_currency_format(cell)
+        records = ({**record, 'section': record.get('section', '').title()} for record in data)
+        count = self._write_table(sheet_name, ACCOUNTS_RECEIVABLE_SCHEMA, records)
+        logger.info(f"Added {count} rows to {sheet_name}")
 
-        self._auto_adjust_columns(sheet)
-        logger.info(f"Added {len(data)} rows to {sheet_name}")
-
-    def add_income_statement(self, data: List[Dict[str, Any]], sheet_name: str = "Income Statement"):
+    def add_income_statement(self, data: Iterable[Dict[str, Any]], sheet_name: str = "Income Statement"):
         """
         Add income statement data to workbook.
 
@@ -393,47 +644,11 @@ class ExcelWriter:
             ...
         ]
         """
-        sheet = self._get_or_create_sheet(sheet_name)
-
-        headers = [
-            "Account", "Name", "Section", "Category",
-            "Curr Actual", "Curr Budget", "Curr Var",
-            "YTD Actual", "YTD Budget", "YTD Var",
-            "Annual Budget", "Remaining"
-        ]
-
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
-        for row_idx, record in enumerate(data, 2):
-            sheet.cell(row=row_idx, column=1, value=record.get('account_code', ''))
-            sheet.cell(row=row_idx, column=2, value=record.get('account_name', ''))
-            sheet.cell(row=row_idx, column=3, value=record.get('section', ''))
-            sheet.cell(row=row_idx, column=4, value=record.get('category', ''))
-
-            # Highlight total rows
-            is_total = record.get('is_total', False)
-
-            for col, field in [
-                (5, 'current_actual'),
-                (6, 'current_budget'),
-                (7, 'current_variance'),
-                (8, 'ytd_actual'),
-                (9, 'ytd_budget'),
-                (10, 'ytd_variance'),
-                (11, 'annual_budget'),
-                (12, 'budget_remaining')
-            ]:
-                cell = sheet.cell(row=row_idx, column=col, value=record.get(field, 0))
-                self._apply_currency_format(cell)
-                if is_total:
-                    cell.font = self.styles['Font'](bold=True)
+        # Highlight total rows
+        count = self._write_table(sheet_name, INCOME_STATEMENT_SCHEMA, data, highlight_totals=True)
+        logger.info(f"Added {count} rows to {sheet_name}")
 
-        self._auto_adjust_columns(sheet)
-        logger.info(f"Added {len(data)} rows to {sheet_name}")
-
-    def add_expense_trend(self, data: List[Dict[str, Any]], sheet_name: str = "Expense Trend"):
+    def add_expense_trend(self, data: Iterable[Dict[str, Any]], sheet_name: str = "Expense Trend"):
         """
         Add expense trend data (monthly breakdown) to workbook.
 
@@ -454,60 +669,42 @@ class ExcelWriter:
             ...
         ]
         """
-        sheet = self._get_or_create_sheet(sheet_name)
+        # Highlight total rows
+        count = self._write_table(sheet_name, EXPENSE_TREND_SCHEMA,
+                                  self._with_budget_variance(data), highlight_totals=True)
+        logger.info(f"Added {count} rows to {sheet_name}")
 
-        headers = [
-            "Account", "Name", "Category",
-            "Jan", "Feb", "Mar", "Apr", "May", "Jun",
-            "Jul", "Aug", "Sep", "Oct", "Nov",
-            "Full Year", "Budget", "Variance"
-        ]
-
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
+    def _summary_rows(self, summary_data: Dict[str, Any]):
+        """
+        Build the label/value rows shown below the summary title.
 
-        for row_idx, record in enumerate(data, 2):
-            sheet.cell(row=row_idx, column=1, value=record.get('account_code', ''))
-            sheet.cell(row=row_idx, column=2, value=record.get('account_name', ''))
-            sheet.cell(row=row_idx, column=3, value=record.get('category', ''))
+        Returns:
+            Tuple of (rows, indexes of rows whose value is a currency amount)
+        """
+        # Key metrics
+        metrics = [
+            ("Total Assets", 'total_assets'),
+            ("Total Liabilities", 'total_liabilities'),
+            ("Net Equity", 'net_equity'),
+            ("Operating Funds", 'operating_funds'),
+            ("Reserve Funds", 'reserve_funds'),
+            ("Accounts Receivable", 'accounts_receivable'),
+            ("Monthly Expenses", 'monthly_expenses'),
+        ]
 
-            # Highlight total rows
-            is_total = record.get('is_total', False)
+        rows = [
+            ["Report Date:", summary_data.get('report_date', '')],
+            ["Generated:", datetime.now().strftime('%Y-%m-%d %H:%M')],
+            [],
+        ]
+        currency_rows = set()
+        for label, key in metrics:
+            currency_rows.add(len(rows))
+            rows.append([label, summary_data.get(key, 0)])
 
-            # Monthly columns
-            month_fields = ['jan', 'feb', 'mar', 'apr', 'may', 'jun',
-                           'jul', 'aug', 'sep', 'oct', 'nov']
-            for col_offset, month in enumerate(month_fields):
-                cell = sheet.cell(row=row_idx, column=4 + col_offset,
-                                 value=record.get(month, 0))
-                self._apply_currency_format(cell)
-                if is_total:
-                    cell.font = self.styles['Font'](bold=True)
-
-            # Full Year Actual (column 15)
-            full_year = record.get('full_year_actual', 0)
-            cell = sheet.cell(row=row_idx, column=15, value=full_year)
-            self._apply_currency_format(cell)
-            if is_total:
-                cell.font = self.styles['Font'](bold=True)
-
-            # Budget (column 16)
-            budget = record.get('total_budget', 0)
-            cell = sheet.cell(row=row_idx, column=16, value=budget)
-            self._apply_currency_format(cell)
-            if is_total:
-                cell.font = self.styles['Font'](bold=True)
-
-            # Variance (column 17) = Budget - Actual
-            variance = budget - full_year if budget and full_year else 0
-            cell = sheet.cell(row=row_idx, column=17, value=variance)
-            self._apply_currency_format(cell)
-            if is_total:
-                cell.font = self.styles['Font'](bold=True)
-
-        self._auto_adjust_columns(sheet)
-        logger.info(f"Added {len(data)} rows to {sheet_name}")
+        # Count metrics
+        rows.append(["Checks Written", summary_data.get('checks_written', 0)])
+        return rows, currency_rows
 
     def add_summary(self, summary_data: Dict[str, Any], sheet_name: str = "Summary"):
         """
@@ -527,75 +724,536 @@ class ExcelWriter:
         }
         """
         sheet = self._get_or_create_sheet(sheet_name)
+        rows, currency_rows = self._summary_rows(summary_data)
+        self._auto_adjust_columns(sheet, [], rows)
 
         # Title
-        title_cell = sheet.cell(row=1, column=1, value="Financial Summary")
+        title_cell = self.WriteOnlyCell(sheet, value="Financial Summary")
         title_cell.font = self.styles['Font'](bold=True, size=14)
-        sheet.merge_cells('A1:B1')
+        sheet.append([title_cell])
+        sheet.merged_cells.add('A1:B1')
 
-        # Report date
-        sheet.cell(row=2, column=1, value="Report Date:")
-        sheet.cell(row=2, column=2, value=summary_data.get('report_date', ''))
+        for idx, row in enumerate(rows):
+            if idx in currency_rows:
+                cell = self._number_cell(sheet, row[1])
+                self._apply_currency_format(cell)
+                row = [row[0], cell]
+            sheet.append(row)
 
-        # Generated timestamp
-        sheet.cell(row=3, column=1, value="Generated:")
-        sheet.cell(row=3, column=2, value=datetime.now().strftime('%Y-%m-%d %H:%M'))
+        logger.info(f"Added summary sheet")
 
-        # Key metrics
-        metrics = [
-            ("Total Assets", 'total_assets'),
-            ("Total Liabilities", 'total_liabilities'),
-            ("Net Equity", 'net_equity'),
-            ("Operating Funds", 'operating_funds'),
-            ("Reserve Funds", 'reserve_funds'),
-            ("Accounts Receivable", 'accounts_receivable'),
-            ("Monthly Expenses", 'monthly_expenses'),
-        ]
+    def add_raw_data(self, data: Any, sheet_name: str, headers: Optional[List[str]] = None):
+        """
+        Add arbitrary tabular data to workbook.
 
-        row = 5
-        for label, key in metrics:
-            sheet.cell(row=row, column=1, value=label)
-            cell = sheet.cell(row=row, column=2, value=summary_data.get(key, 0))
-            self._apply_currency_format(cell)
-            row += 1
+        Args:
+            data: Iterable of rows (each row is a sequence of values) or a pandas DataFrame
+            sheet_name: Name for the sheet
+            headers: Optional header row (defaults to DataFrame columns)
+        """
+        rows = data
+        if hasattr(data, 'columns'):
+            # Stream DataFrame rows without building per-cell objects
+            if headers is None:
+                headers = [str(col) for col in data.columns]
+            rows = self._dataframe_rows(data)
 
-        # Count metrics
-        sheet.cell(row=row, column=1, value="Checks Written")
-        sheet.cell(row=row, column=2, value=summary_data.get('checks_written', 0))
+        count = self._write_rows(sheet_name, headers, rows)
+        logger.info(f"Added {count} rows to {sheet_name}")
+
+    def save(self):
+        """Save the workbook to disk."""
+        self.workbook.save(self.output_path)
+        logger.info(f"Saved workbook to {self.output_path}")
+
+    def save_async(self):
+        """
+        Start save() on a background thread.
+
+        zlib releases the GIL while compressing, so the caller can carry on
+        with other work (e.g. the markdown summary) while the file is
+        written. Call wait_saved() before relying on the file.
+        """
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._save_future = executor.submit(self.save)
+        executor.shutdown(wait=False)
+
+    def wait_saved(self):
+        """Block until a pending save_async() finishes, re-raising any error."""
+        future, self._save_future = self._save_future, None
+        if future is not None:
+            future.result()
+
+    def close(self):
+        """Close the workbook."""
+        self.wait_saved()
+        self.workbook.close()
+
+
+class FastExcelWriter(ExcelWriter):
+    """
+    ExcelWriter backed by PyExcelerate.
+
+    Each sheet is handed to PyExcelerate as a single 2-D list. Number
+    formats are set once per column as column styles; only header cells
+    and bold total rows get cell styles of their own.
+    """
+
+    def __init__(self, output_path: Path):
+        """
+        Initialize Excel writer.
+
+        Args:
+            output_path: Path for output .xlsx file
+        """
+        self.output_path = Path(output_path)
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            import pyexcelerate
+        except ImportError:
+            raise RuntimeError("pyexcelerate not installed. Run: pip install pyexcelerate")
+
+        self.pyexcelerate = pyexcelerate
+        self.workbook = pyexcelerate.Workbook()
+        self.sheets = {}
+        self._str_cache = {}
+        self._format_styles = {}
+
+        Style = pyexcelerate.Style
+        Color = pyexcelerate.Color
+        self._header_style = Style(
+            font=pyexcelerate.Font(bold=True, color=Color(255, 255, 255)),
+            fill=pyexcelerate.Fill(background=Color(0x44, 0x72, 0xC4)),
+            alignment=pyexcelerate.Alignment(horizontal='center', wrap_text=True)
+        )
+
+    def _get_or_create_sheet(self, name: str, data: Optional[List[List[Any]]] = None):
+        """Create a sheet, populated from data in one call."""
+        # Excel sheet names max 31 chars
+        name = name[:31]
+        self.sheets[name] = self.workbook.new_sheet(name, data=data)
+        return self.sheets[name]
+
+    def _format_style(self, number_format: str, bold: bool = False):
+        """Get the shared Style for a number format, created once per workbook."""
+        key = (number_format, bold)
+        if key not in self._format_styles:
+            self._format_styles[key] = self.pyexcelerate.Style(
+                font=self.pyexcelerate.Font(bold=True) if bold else None,
+                format=self.pyexcelerate.Format(number_format)
+            )
+        return self._format_styles[key]
+
+    def _auto_adjust_columns(
+        self,
+        sheet,
+        headers: List[str],
+        sample_rows: Iterable[Sequence[Any]] = (),
+        number_formats: Optional[Dict[int, str]] = None
+    ):
+        """
+        Set column widths from the header text and leading data rows.
+
+        A column's number format goes on the same column style, which
+        PyExcelerate applies to every cell in the column without a style
+        of its own.
+        """
+        number_formats = number_formats or {}
+        widths = self._column_widths(headers, sample_rows)
+        for col_idx in range(1, max(len(widths), max(number_formats, default=0)) + 1):
+            number_format = number_formats.get(col_idx)
+            sheet.set_col_style(col_idx, self.pyexcelerate.Style(
+                size=widths[col_idx - 1] if col_idx <= len(widths) else None,
+                format=self.pyexcelerate.Format(number_format) if number_format else None
+            ))
+
+    def _write_rows(
+        self,
+        sheet_name: str,
+        headers: Optional[List[str]],
+        rows: Iterable[Sequence[Any]],
+        number_formats: Optional[Dict[int, str]] = None,
+        bold_rows: Optional[set] = None
+    ):
+        """Write a header row and data rows as one 2-D array, returning the row count."""
+        table = [list(headers)] if headers else []
+        # PyExcelerate only takes the dense fast path for list rows
+        table.extend(map(list, rows))
+        sheet = self._get_or_create_sheet(sheet_name, data=table)
+        # May be filled in while rows are consumed, so keep the same set
+        bold_rows = bold_rows if bold_rows is not None else set()
+
+        first_data_row = 1
+        if headers:
+            for col in range(1, len(headers) + 1):
+                sheet.set_cell_style(1, col, self._header_style)
+            first_data_row = 2
+
+        sample = table[first_data_row - 1:first_data_row - 1 + WIDTH_SAMPLE_ROWS]
+        self._auto_adjust_columns(sheet, headers or [], sample, number_formats)
+
+        # Bold total rows override the column style in formatted columns
+        for col, number_format in (number_formats or {}).items():
+            bold_style = self._format_style(number_format, bold=True)
+            for row_idx in bold_rows:
+                sheet.set_cell_style(first_data_row + row_idx, col, bold_style)
+
+        return len(table) - first_data_row + 1
+
+    def _dataframe_rows(self, df) -> Iterable[Sequence[Any]]:
+        """Iterate DataFrame rows as plain values, without index or header."""
+        return ([self._plain_value(value) for value in row]
+                for row in df.itertuples(index=False, name=None))
+
+    @staticmethod
+    def _plain_value(value: Any) -> Any:
+        """Convert numpy scalars to Python values and NaN to an empty cell."""
+        if hasattr(value, 'item'):
+            value = value.item()
+        # NaN is the only value not equal to itself
+        return None if value != value else value
+
+    def add_summary(self, summary_data: Dict[str, Any], sheet_name: str = "Summary"):
+        """Add a summary sheet with key metrics."""
+        rows, currency_rows = self._summary_rows(summary_data)
+        sheet = self._get_or_create_sheet(sheet_name, data=[["Financial Summary"]] + rows)
+        self._auto_adjust_columns(sheet, [], rows)
+
+        # Title
+        sheet.set_cell_style(1, 1, self.pyexcelerate.Style(
+            font=self.pyexcelerate.Font(bold=True, size=14)
+        ))
+        sheet.range("A1", "B1").merge()
+
+        currency_style = self._format_style(CURRENCY_FORMAT)
+        for idx in currency_rows:
+            # Data rows start below the title row
+            sheet.set_cell_style(idx + 2, 2, currency_style)
 
-        self._auto_adjust_columns(sheet)
         logger.info(f"Added summary sheet")
 
-    def add_raw_data(self, data: List[List[Any]], sheet_name: str, headers: Optional[List[str]] = None):
+    def save(self):
+        """Save the workbook to disk."""
+        self.workbook.save(str(self.output_path))
+        logger.info(f"Saved workbook to {self.output_path}")
+
+    def close(self):
+        """Close the workbook (PyExcelerate holds no open handles)."""
+        self.wait_saved()
+
+
+class XlsxWriterExcelWriter(ExcelWriter):
+    """
+    ExcelWriter backed by xlsxwriter in constant_memory mode.
+
+    Each row is flushed to a temp file as soon as the next row is started,
+    so memory use stays flat however long the AR or disbursement tables
+    get. Formats are created once per workbook and shared by every cell.
+    """
+
+    def __init__(self, output_path: Path):
         """
-        Add arbitrary tabular data to workbook.
+        Initialize Excel writer.
 
         Args:
-            data: List of rows (each row is a list of values)
-            sheet_name: Name for the sheet
-            headers: Optional header row
+            output_path: Path for output .xlsx file
         """
+        self.output_path = Path(output_path)
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            import xlsxwriter
+        except ImportError:
+            raise RuntimeError("xlsxwriter not installed. Run: pip install xlsxwriter")
+
+        # Rows must be written in order once constant_memory is on
+        self.workbook = xlsxwriter.Workbook(str(self.output_path), {
+            'constant_memory': True,
+            'strings_to_numbers': False,
+            'strings_to_urls': False,
+        })
+        self.sheets = {}
+        self._str_cache = {}
+        self._formats = {}
+
+        self._header_format = self.workbook.add_format({
+            'bold': True,
+            'font_color': 'white',
+            'bg_color': '#4472C4',
+            'align': 'center',
+            'text_wrap': True
+        })
+
+    def _get_or_create_sheet(self, name: str):
+        """Get existing sheet or create new one."""
+        # Excel sheet names max 31 chars
+        name = name[:31]
+        if name not in self.sheets:
+            self.sheets[name] = self.workbook.add_worksheet(name)
+        return self.sheets[name]
+
+    def _format(self, number_format: str, bold: bool = False):
+        """Get the shared Format for a number format, created once per workbook."""
+        key = (number_format, bold)
+        if key not in self._formats:
+            properties = {'num_format': number_format}
+            if bold:
+                properties['bold'] = True
+            self._formats[key] = self.workbook.add_format(properties)
+        return self._formats[key]
+
+    def _auto_adjust_columns(self, sheet, headers: List[str], sample_rows: Iterable[Sequence[Any]] = ()):
+        """Set column widths from the header text and leading data rows."""
+        for col_idx, width in enumerate(self._column_widths(headers, sample_rows)):
+            sheet.set_column(col_idx, col_idx, width)
+
+    def _write_rows(
+        self,
+        sheet_name: str,
+        headers: Optional[List[str]],
+        rows: Iterable[Sequence[Any]],
+        number_formats: Optional[Dict[int, str]] = None,
+        bold_rows: Optional[set] = None
+    ):
+        """Write a header row and data rows in order, returning the row count."""
         sheet = self._get_or_create_sheet(sheet_name)
+        # May be filled in while rows are consumed, so keep the same set
+        bold_rows = bold_rows if bold_rows is not None else set()
+        rows = iter(rows)
+
+        sample = list(islice(rows, WIDTH_SAMPLE_ROWS))
+        self._auto_adjust_columns(sheet, headers or [], sample)
 
-        start_row = 1
+        row_num = 0
         if headers:
-            for col, header in enumerate(headers, 1):
-                cell = sheet.cell(row=1, column=col, value=header)
-                self._apply_header_style(cell)
-            start_row = 2
+            sheet.write_row(0, 0, headers, self._header_format)
+            row_num = 1
 
-        for row_idx, row_data in enumerate(data, start_row):
-            for col_idx, value in enumerate(row_data, 1):
-                sheet.cell(row=row_idx, column=col_idx, value=value)
+        # Zero-based column -> (plain, bold) format
+        column_formats = {
+            col - 1: (self._format(number_format), self._format(number_format, bold=True))
+            for col, number_format in (number_formats or {}).items()
+        }
+        write = sheet.write
+        write_row = sheet.write_row
+
+        count = 0
+        for row_idx, row in enumerate(chain(sample, rows)):
+            if column_formats:
+                bold = row_idx in bold_rows
+                for col_idx, value in enumerate(row):
+                    formats = column_formats.get(col_idx)
+                    if formats:
+                        write(row_num, col_idx, value, formats[bold])
+                    else:
+                        write(row_num, col_idx, value)
+            else:
+                write_row(row_num, 0, row)
+            row_num += 1
+            count += 1
+
+        return count
+
+    def _dataframe_rows(self, df) -> Iterable[Sequence[Any]]:
+        """Iterate DataFrame rows as plain values, without index or header."""
+        return ([FastExcelWriter._plain_value(value) for value in row]
+                for row in df.itertuples(index=False, name=None))
 
-        self._auto_adjust_columns(sheet)
-        logger.info(f"Added {len(data)} rows to {sheet_name}")
+    def add_summary(self, summary_data: Dict[str, Any], sheet_name: str = "Summary"):
+        """Add a summary sheet with key metrics."""
+        sheet = self._get_or_create_sheet(sheet_name)
+        rows, currency_rows = self._summary_rows(summary_data)
+        self._auto_adjust_columns(sheet, [], rows)
+
+        # Title
+        sheet.merge_range(0, 0, 0, 1, "Financial Summary",
+                          self.workbook.add_format({'bold': True, 'font_size': 14}))
+
+        currency_format = self._format(CURRENCY_FORMAT)
+        for idx, row in enumerate(rows):
+            # Data rows start below the title row
+            if idx in currency_rows:
+                sheet.write(idx + 1, 0, row[0])
+                sheet.write(idx + 1, 1, row[1], currency_format)
+            else:
+                sheet.write_row(idx + 1, 0, row)
+
+        logger.info(f"Added summary sheet")
 
     def save(self):
         """Save the workbook to disk."""
-        self.workbook.save(self.output_path)
+        self.workbook.close()
         logger.info(f"Saved workbook to {self.output_path}")
 
     def close(self):
-        """Close the workbook."""
-        self.workbook.close()
+        """Close the workbook (save() already finalized the file)."""
+        self.wait_saved()
+
+
+class RustExcelWriter(ExcelWriter):
+    """
+    ExcelWriter backed by rustpy-xlsxwriter.
+
+    Each sheet is queued as a list of header-keyed dicts, and cell
+    serialization and compression run in Rust on save(), with no
+    Python-level cell loop. Per-cell number formats take precedence over
+    row formats there, so highlighted total rows are bold only in their
+    text columns.
+    """
+
+    def __init__(self, output_path: Path):
+        """
+        Initialize Excel writer.
+
+        Args:
+            output_path: Path for output .xlsx file
+        """
+        self.output_path = Path(output_path)
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            from rustpy_xlsxwriter import FastExcel, Format
+        except ImportError:
+            raise RuntimeError("rustpy-xlsxwriter not installed. Run: pip install rustpy-xlsxwriter")
+
+        self.Format = Format
+        # Widths come from _column_widths, like the other backends
+        self.workbook = FastExcel(str(self.output_path), autofit=False)
+        self.sheets = {}
+        self._str_cache = {}
+        self._formats = {}
+        self._bold_format = Format().set_bold()
+
+        self._header_format = (
+            Format()
+            .set_bold()
+            .set_font_color('#FFFFFF')
+            .set_background_color('#4472C4')
+            .set_align('center')
+            .set_text_wrap()
+        )
+
+    def _format(self, number_format: str):
+        """Get the shared Format for a number format, created once per workbook."""
+        if number_format not in self._formats:
+            self._formats[number_format] = self.Format().set_num_format(number_format)
+        return self._formats[number_format]
+
+    def _write_rows(
+        self,
+        sheet_name: str,
+        headers: Optional[List[str]],
+        rows: Iterable[Sequence[Any]],
+        number_formats: Optional[Dict[int, str]] = None,
+        bold_rows: Optional[set] = None
+    ):
+        """Queue a sheet of header-keyed records, returning the row count."""
+        # Consuming the rows fills in bold_rows, which is needed up front
+        rows = list(rows)
+        bold_rows = bold_rows if bold_rows is not None else set()
+
+        if not headers:
+            # Records are keyed by header, so headerless data gets generic ones
+            headers = [f"Column {col}" for col in range(1, max(map(len, rows), default=0) + 1)]
+
+        number_formats = number_formats or {}
+        name = sheet_name[:31]
+        self.sheets[name] = list(map(dict, map(zip, repeat(headers), rows)))
+        if not self.sheets[name]:
+            # Record keys become the header row, so an empty table needs
+            # the columns spelled out to keep its headers
+            import pandas as pd
+            self.sheets[name] = pd.DataFrame(columns=headers)
+        self.workbook.sheet(
+            name,
+            self.sheets[name],
+            column_widths=self._column_widths(headers, rows[:WIDTH_SAMPLE_ROWS]),
+            column_formats=[
+                self._format(number_formats[col]) if col in number_formats else None
+                for col in range(1, len(headers) + 1)
+            ],
+            header_format=self._header_format,
+            # Sheet rows are 0-based with the header on row 0
+            row_formats={row_idx + 1: self._bold_format for row_idx in bold_rows}
+        )
+        return len(rows)
+
+    def _dataframe_rows(self, df) -> Iterable[Sequence[Any]]:
+        """Iterate DataFrame rows as plain values, without index or header."""
+        return ([FastExcelWriter._plain_value(value) for value in row]
+                for row in df.itertuples(index=False, name=None))
+
+    def add_summary(self, summary_data: Dict[str, Any], sheet_name: str = "Summary"):
+        """Add a summary sheet with key metrics."""
+        rows, currency_rows = self._summary_rows(summary_data)
+
+        # The first label/value pair doubles as the record keys, on the row
+        # below the merged title
+        keys = [str(value) for value in rows[0]]
+        name = sheet_name[:31]
+        self.sheets[name] = [dict(zip(keys, row)) for row in rows[1:]]
+
+        currency_format = self._format(CURRENCY_FORMAT)
+        self.workbook.sheet(
+            name,
+            self.sheets[name],
+            column_widths=self._column_widths([], rows),
+            header_row=1,
+            merge_ranges=[(0, 0, 0, 1, "Financial Summary", self.Format().set_bold().set_font_size(14))],
+            # Summary row idx sits on sheet row idx + 1, below the title
+            row_formats={idx + 1: currency_format for idx in currency_rows}
+        )
+
+        logger.info(f"Added summary sheet")
+
+    def save(self):
+        """Save the workbook to disk."""
+        self.workbook.save()
+        logger.info(f"Saved workbook to {self.output_path}")
+
+    def close(self):
+        """Close the workbook (save() already wrote the file)."""
+        self.wait_saved()
+
+
+def create_excel_writer(output_path: Path) -> ExcelWriter:
+    """
+    Create an Excel writer for the configured engine.
+
+    HOA_EXCEL_ENGINE selects 'pyexcelerate', 'xlsxwriter', 'rust' or
+    'openpyxl'. xlsxwriter runs in constant_memory mode, so it suits very
+    long AR or disbursement exports; 'rust' hands whole sheets to
+    rustpy-xlsxwriter. By default PyExcelerate is used when installed,
+    falling back to openpyxl.
+
+    Args:
+        output_path: Path for output .xlsx file
+
+    Returns:
+        ExcelWriter instance
+    """
+    engine = os.environ.get('HOA_EXCEL_ENGINE', '').strip().lower()
+
+    if engine == 'xlsxwriter':
+        try:
+            return XlsxWriterExcelWriter(output_path)
+        except RuntimeError as e:
+            logger.warning(f"{e}; falling back to openpyxl")
+            return ExcelWriter(output_path)
+
+    if engine == 'rust':
+        try:
+            return RustExcelWriter(output_path)
+        except RuntimeError as e:
+            logger.warning(f"{e}; falling back to openpyxl")
+            return ExcelWriter(output_path)
+
+    if engine != 'openpyxl':
+        try:
+            return FastExcelWriter(output_path)
+        except RuntimeError as e:
+            if engine == 'pyexcelerate':
+                logger.warning(f"{e}; falling back to openpyxl")
+
+    return ExcelWriter(output_path)
@@ -1,13 +1,106 @@
 """Extract images from PDF files for OCR processing."""
 
+import atexit
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import shutil
 import subprocess
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, repeat
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 import logging
 
+try:
+    import tesserocr
+    from PIL import Image
+except ImportError:
+    tesserocr = None
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _import_fitz():
+    """
+    Import PyMuPDF on first use.
+
+    Importing fitz takes tens of milliseconds, so processes that only use
+    the poppler tools never pay for it.
+    """
+    import fitz
+    return fitz
+
+
+@lru_cache(maxsize=None)
+def _probe_tool(cmd: str) -> bool:
+    """Check if a command is on PATH, once per process."""
+    return shutil.which(cmd) is not None
+
+
+def _page_chunks(start: int, end: int, workers: int) -> List[Tuple[int, int]]:
+    """Split the 1-indexed page range [start, end] into contiguous chunks, one per worker."""
+    count = end - start + 1
+    workers = max(1, min(workers, count))
+    size, extra = divmod(count, workers)
+
+    chunks = []
+    first = start
+    for idx in range(workers):
+        last = first + size - 1 + (1 if idx < extra else 0)
+        chunks.append((first, last))
+        first = last + 1
+    return chunks
+
+
+def _extract_page_images(
+    pdf_path: str,
+    output_dir: Path,
+    prefix: str,
+    first: int,
+    last: int,
+    min_size: int = 0
+) -> List[Path]:
+    """
+    Extract embedded images from pages [first, last] (1-indexed) with PyMuPDF.
+
+    Images under min_size pixels are skipped using the width and height in
+    the page's image list, before their streams are decoded.
+
+    Module-level so it can run in a worker process; each worker opens its
+    own document, since fitz documents cannot be pickled.
+    """
+    images = []
+    doc = _import_fitz().open(pdf_path)
+
+    for page_num in range(first - 1, last):
+        page = doc[page_num]
+        image_list = page.get_images(full=True)
+
+        for img_idx, img in enumerate(image_list):
+            # Logos and thumbnails are no use to OCR
+            if img[2] * img[3] < min_size:
+                continue
+            xref = img[0]
+            base_image = doc.extract_image(xref)
+            image_bytes = base_image["image"]
+            image_ext = base_image["ext"]
+
+            image_path = output_dir / f"{prefix}-p{page_num + 1}-{img_idx}.{image_ext}"
+            with open(image_path, "wb") as f:
+                f.write(image_bytes)
+            images.append(image_path)
+
+    doc.close()
+    return images
+
+
 class ImageExtractor:
     """Extract images from PDF files using poppler-utils or PyMuPDF."""
 
@@ -20,18 +113,28 @@ class ImageExtractor:
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Rendered pages and extracted images, keyed by PDF content hash
+        self.cache_dir = self.output_dir / ".cache"
+        self._hashes = {}
+        # PDF content hash -> stripped text length of each page
+        self._text_lengths = {}
+        # (path, mtime) -> open fitz.Document, shared by every call on that PDF
+        self._documents = {}
+        # libtesseract handles, one per OCR thread, created on first use when
+        # tesserocr is installed; _tess_apis tracks them all for release
+        self._tess_local = threading.local()
+        self._tess_apis = []
+        self._tess_lock = threading.Lock()
         self._check_tools()
 
     def _check_tools(self):
         """Check which extraction tools are available."""
-        self.has_pdfimages = self._command_exists('pdfimages')
-        self.has_pdftoppm = self._command_exists('pdftoppm')
-
-        try:
-            import fitz
-            self.has_pymupdf = True
-        except ImportError:
-            self.has_pymupdf = False
+        self.has_pdfimages = _probe_tool('pdfimages')
+        self.has_pdftoppm = _probe_tool('pdftoppm')
+        # Found without importing it; see _fitz
+        self.has_pymupdf = importlib.util.find_spec('fitz') is not None
+        # Fixed head of every pdftoppm command line; callers append the per-call args
+        self._pdftoppm_prefix = ('pdftoppm', '-png')
 
         if not any([self.has_pdfimages, self.has_pdftoppm, self.has_pymupdf]):
             raise RuntimeError(
@@ -44,23 +147,70 @@ class ImageExtractor:
             f"pdftoppm={self.has_pdftoppm}, pymupdf={self.has_pymupdf}"
         )
 
-    def _command_exists(self, cmd: str) -> bool:
-        """Check if a command exists."""
+    @property
+    def _fitz(self):
+        """The PyMuPDF module, imported on first access."""
+        return _import_fitz()
+
+    def _pdf_hash(self, pdf_path: Path) -> str:
+        """MD5 of a PDF's contents, streamed in 1 MiB blocks and memoized by path, size and mtime."""
+        stat = pdf_path.stat()
+        key = (str(pdf_path.resolve()), stat.st_size, stat.st_mtime_ns)
+        if key not in self._hashes:
+            digest = hashlib.md5()
+            with open(pdf_path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+            self._hashes[key] = digest.hexdigest()
+        return self._hashes[key]
+
+    def _open_document(self, pdf_path: Path):
+        """Get a PyMuPDF document for a PDF, parsed once while the file is unchanged."""
+        pdf_path = Path(pdf_path)
+        key = (str(pdf_path.resolve()), pdf_path.stat().st_mtime_ns)
+        if key not in self._documents:
+            self._documents[key] = self._fitz.open(pdf_path)
+        return self._documents[key]
+
+    def close(self):
+        """Close cached PyMuPDF documents and the shared Tesseract handle."""
+        for doc in self._documents.values():
+            doc.close()
+        self._documents.clear()
+        self._end_tesseract()
+
+    def _load_index(self, cache_entry: Path) -> dict:
+        """Load a cache entry's index of completed pages and image sets."""
+        index_file = cache_entry / "index.json"
+        if index_file.exists():
+            try:
+                return json.loads(index_file.read_text())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable image cache index {index_file}: {e}")
+        return {'pages': {}, 'images': {}}
+
+    def _save_index(self, cache_entry: Path, index: dict):
+        """Write a cache entry's index."""
+        cache_entry.mkdir(parents=True, exist_ok=True)
+        (cache_entry / "index.json").write_text(json.dumps(index, indent=2))
+
+    @staticmethod
+    def _link(src: Path, dst: Path) -> Path:
+        """Hard-link src to dst (replacing dst), copying where links are unsupported."""
+        if dst.exists():
+            dst.unlink()
         try:
-            subprocess.run(
-                ['which', cmd],
-                capture_output=True,
-                check=True
-            )
-            return True
-        except subprocess.CalledProcessError:
-            return False
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+        return dst
 
     def extract_images_from_pdf(
         self,
         pdf_path: Path,
         prefix: str = "img",
-        pages: Optional[tuple] = None
+        pages: Optional[tuple] = None,
+        min_size: int = 50_000
     ) -> List[Path]:
         """
         Extract all images from a PDF file.
@@ -69,6 +219,8 @@ class ImageExtractor:
             pdf_path: Path to PDF file
             prefix: Prefix for output filenames
             pages: Optional (start, end) page range (1-indexed)
+            min_size: Skip embedded images with fewer pixels than this
+                (PyMuPDF only; pdfimages and pdftoppm output is unfiltered)
 
         Returns:
             List of paths to extracted images
@@ -81,14 +233,34 @@ class ImageExtractor:
         pdf_images_dir = self.output_dir / pdf_path.stem
         pdf_images_dir.mkdir(exist_ok=True)
 
+        cache_entry = self.cache_dir / self._pdf_hash(pdf_path)
+        key = f"{prefix}-{pages[0]}-{pages[1]}" if pages else f"{prefix}-all"
+        if self.has_pymupdf and not self.has_pdfimages:
+            key = f"{key}-min{min_size}"
+        index = self._load_index(cache_entry)
+        cached = index['images'].get(key)
+        if cached and all((cache_entry / key / name).exists() for name in cached):
+            logger.info(f"Using {len(cached)} cached images for {pdf_path.name}")
+            return [self._link(cache_entry / key / name, pdf_images_dir / name) for name in cached]
+
         if self.has_pdfimages:
-            return self._extract_with_pdfimages(pdf_path, pdf_images_dir, prefix, pages)
+            images = self._extract_with_pdfimages(pdf_path, pdf_images_dir, prefix, pages)
         elif self.has_pymupdf:
-            return self._extract_with_pymupdf(pdf_path, pdf_images_dir, prefix, pages)
+            images = self._extract_with_pymupdf(pdf_path, pdf_images_dir, prefix, pages, min_size)
         elif self.has_pdftoppm:
-            return self._extract_with_pdftoppm(pdf_path, pdf_images_dir, prefix, pages)
+            images = self._extract_with_pdftoppm(pdf_path, pdf_images_dir, prefix, pages)
+        else:
+            images = []
+
+        # Failed runs also come back empty, so only results are cached
+        if images:
+            (cache_entry / key).mkdir(parents=True, exist_ok=True)
+            for image in images:
+                self._link(image, cache_entry / key / image.name)
+            index['images'][key] = [image.name for image in images]
+            self._save_index(cache_entry, index)
 
-        return []
+        return images
 
     def _extract_with_pdfimages(
         self,
@@ -121,33 +293,26 @@ class ImageExtractor:
         pdf_path: Path,
         output_dir: Path,
         prefix: str,
-        pages: Optional[tuple]
+        pages: Optional[tuple],
+        min_size: int = 0
     ) -> List[Path]:
-        """Extract images using PyMuPDF (fitz)."""
-        import fitz
-
-        doc = fitz.open(pdf_path)
-        images = []
-
-        start_page = (pages[0] - 1) if pages else 0
-        end_page = pages[1] if pages else len(doc)
+        """Extract images of at least min_size pixels using PyMuPDF (fitz), one page chunk per CPU."""
+        start_page = pages[0] if pages else 1
+        end_page = pages[1] if pages else self._page_count(pdf_path)
+
+        chunks = _page_chunks(start_page, end_page, os.cpu_count() or 1)
+        if len(chunks) == 1:
+            images = _extract_page_images(str(pdf_path), output_dir, prefix, *chunks[0], min_size)
+        else:
+            # MuPDF holds the GIL, so pages are split across processes
+            firsts, lasts = zip(*chunks)
+            # Each worker imports fitz once, up front
+            with ProcessPoolExecutor(max_workers=len(chunks), initializer=_import_fitz) as pool:
+                images = list(chain.from_iterable(pool.map(
+                    _extract_page_images,
+                    repeat(str(pdf_path)), repeat(output_dir), repeat(prefix), firsts, lasts, repeat(min_size)
+                )))
 
-        for page_num in range(start_page, end_page):
-            page = doc[page_num]
-            image_list = page.get_images(full=True)
-
-            for img_idx, img in enumerate(image_list):
-                xref = img[0]
-                base_image = doc.extract_image(xref)
-                image_bytes = base_image["image"]
-                image_ext = base_image["ext"]
-
-                image_path = output_dir / f"{prefix}-p{page_num + 1}-{img_idx}.{image_ext}"
-                with open(image_path, "wb") as f:
-                    f.write(image_bytes)
-                images.append(image_path)
-
-        doc.close()
         logger.info(f"Extracted {len(images)} images with PyMuPDF")
         return images
 
@@ -159,15 +324,17 @@ class ImageExtractor:
         pages: Optional[tuple]
     ) -> List[Path]:
         """Convert PDF pages to images using pdftoppm (for scanned PDFs)."""
-        cmd = ['pdftoppm', '-png', '-r', '150']  # 150 DPI
-
-        if pages:
-            cmd.extend(['-f', str(pages[0]), '-l', str(pages[1])])
-
-        cmd.extend([str(pdf_path), str(output_dir / prefix)])
+        if not pages:
+            page_count = self._page_count(pdf_path)
+            pages = (1, page_count) if page_count else None
 
         try:
-            subprocess.run(cmd, capture_output=True, check=True)
+            if pages:
+                self._render_pages_parallel(pdf_path, output_dir, prefix, *pages)
+            else:
+                # Page count unknown, so render the whole file in one run
+                cmd = [*self._pdftoppm_prefix, '-r', '150', str(pdf_path), str(output_dir / prefix)]
+                subprocess.run(cmd, capture_output=True, check=True)
         except subprocess.CalledProcessError as e:
             logger.error(f"pdftoppm failed: {e.stderr}")
             return []
@@ -177,6 +344,50 @@ class ImageExtractor:
         logger.info(f"Converted {len(images)} pages to images with pdftoppm")
         return sorted(images)
 
+    def _render_pages_parallel(
+        self,
+        pdf_path: Path,
+        output_dir: Path,
+        prefix: str,
+        start: int,
+        end: int,
+        dpi: int = 150
+    ):
+        """
+        Render pages [start, end] with one pdftoppm process per page chunk.
+
+        Rasterization is CPU-bound inside pdftoppm, so the chunks run as
+        concurrent subprocesses; threads are enough to wait on them. Output
+        names carry the page number, so the chunks never collide.
+
+        Raises:
+            subprocess.CalledProcessError: If any pdftoppm run fails
+        """
+        def render(chunk: Tuple[int, int]):
+            cmd = [
+                *self._pdftoppm_prefix, '-r', str(dpi),
+                '-f', str(chunk[0]), '-l', str(chunk[1]),
+                str(pdf_path), str(output_dir / prefix)
+            ]
+            subprocess.run(cmd, capture_output=True, check=True)
+
+        chunks = _page_chunks(start, end, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+            list(pool.map(render, chunks))
+
+    def _page_count(self, pdf_path: Path) -> Optional[int]:
+        """Get the number of pages in a PDF, or None if no tool can tell."""
+        if self.has_pymupdf:
+            return len(self._open_document(pdf_path))
+
+        if _probe_tool('pdfinfo'):
+            result = subprocess.run(['pdfinfo', str(pdf_path)], capture_output=True, text=True)
+            for line in result.stdout.splitlines():
+                if line.startswith('Pages:'):
+                    return int(line.split()[1])
+
+        return None
+
     def page_to_image(
         self,
         pdf_path: Path,
@@ -198,36 +409,98 @@ class ImageExtractor:
         output_dir = self.output_dir / pdf_path.stem
         output_dir.mkdir(exist_ok=True)
 
+        cache_entry = self.cache_dir / self._pdf_hash(pdf_path)
+        cached = cache_entry / f"page-{page_num}-{dpi}.png"
+        if cached.exists():
+            return self._link(cached, output_dir / f"page-{page_num:03d}.png")
+
+        image = self._render_page(pdf_path, output_dir, page_num, dpi)
+        if image is not None:
+            cache_entry.mkdir(parents=True, exist_ok=True)
+            self._link(image, cached)
+            index = self._load_index(cache_entry)
+            index['pages'][f"{page_num}-{dpi}"] = cached.name
+            self._save_index(cache_entry, index)
+
+        return image
+
+    def _render_page(self, pdf_path: Path, output_dir: Path, page_num: int, dpi: int) -> Optional[Path]:
+        """Render one page into output_dir with pdftoppm or PyMuPDF."""
         output_prefix = output_dir / f"page-{page_num:03d}"
 
         if self.has_pdftoppm:
+            # -singlefile drops pdftoppm's page number suffix, so a fresh
+            # render gets the same page-NNN.png name as a cache hit
+            page = str(page_num)
             cmd = [
-                'pdftoppm', '-png', '-r', str(dpi),
-                '-f', str(page_num), '-l', str(page_num),
+                *self._pdftoppm_prefix, '-r', str(dpi), '-f', page, '-l', page, '-singlefile',
                 str(pdf_path), str(output_prefix)
             ]
             try:
                 subprocess.run(cmd, capture_output=True, check=True)
-                # pdftoppm adds page number suffix
-                images = list(output_dir.glob(f"page-{page_num:03d}*.png"))
-                if images:
-                    return images[0]
+                image = output_prefix.with_suffix('.png')
+                if image.exists():
+                    return image
             except subprocess.CalledProcessError as e:
                 logger.error(f"pdftoppm failed: {e.stderr}")
 
         elif self.has_pymupdf:
-            import fitz
-            doc = fitz.open(pdf_path)
-            page = doc[page_num - 1]
-            mat = fitz.Matrix(dpi / 72, dpi / 72)
+            page = self._open_document(pdf_path)[page_num - 1]
+            mat = self._fitz.Matrix(dpi / 72, dpi / 72)
             pix = page.get_pixmap(matrix=mat)
             output_path = output_dir / f"page-{page_num:03d}.png"
             pix.save(str(output_path))
-            doc.close()
             return output_path
 
         return None
 
+    def _page_text_lengths(self, pdf_path: Path) -> List[int]:
+        """
+        Get the stripped text length of every page.
+
+        PyMuPDF reads the text in-process from the cached document. Without
+        it (or with HOA_TEXT_ENGINE=pdftotext) a single pdftotext run over
+        the whole file is split on the form feed ending each page, instead
+        of launching it once per page. The result is memoized by PDF content
+        hash; a failed pdftotext run gives no pages.
+        """
+        pdf_path = Path(pdf_path)
+        pdf_hash = self._pdf_hash(pdf_path)
+        if pdf_hash in self._text_lengths:
+            return self._text_lengths[pdf_hash]
+
+        if self.has_pymupdf and os.environ.get('HOA_TEXT_ENGINE', '').strip().lower() != 'pdftotext':
+            self._text_lengths[pdf_hash] = [
+                len(page.get_text("text").strip()) for page in self._open_document(pdf_path)
+            ]
+        else:
+            result = subprocess.run(
+                ['pdftotext', str(pdf_path), '-'],
+                capture_output=True,
+                text=True
+            )
+            # Drop what follows the last page's form feed
+            pages = result.stdout.split('\f')[:-1] if result.returncode == 0 else []
+            self._text_lengths[pdf_hash] = [len(text.strip()) for text in pages]
+        return self._text_lengths[pdf_hash]
+
+    def scanned_pages(self, pdf_path: Path, text_threshold: int = 50) -> set:
+        """
+        Find the pages of a PDF that are likely scanned images (need OCR).
+
+        Args:
+            pdf_path: Path to PDF file
+            text_threshold: Minimum chars to consider as text PDF
+
+        Returns:
+            Set of 1-indexed page numbers with little extractable text
+        """
+        return {
+            page_num
+            for page_num, length in enumerate(self._page_text_lengths(pdf_path), 1)
+            if length < text_threshold
+        }
+
     def is_page_scanned(
         self,
         pdf_path: Path,
@@ -245,18 +518,12 @@ class ImageExtractor:
         Returns:
             True if page appears to be scanned (little extractable text)
         """
-        try:
-            result = subprocess.run(
-                ['pdftotext', '-f', str(page_num), '-l', str(page_num),
-                 str(pdf_path), '-'],
-                capture_output=True,
-                text=True
-            )
-            text = result.stdout.strip()
-            # If very little text extracted, likely scanned
-            return len(text) < text_threshold
-        except subprocess.CalledProcessError:
-            return True  # Assume scanned if extraction fails
+        lengths = self._page_text_lengths(pdf_path)
+        # Assume scanned if extraction failed or the page is missing
+        if page_num > len(lengths):
+            return True
+        # If very little text extracted, likely scanned
+        return lengths[page_num - 1] < text_threshold
 
     def ocr_image(self, image_path: Path) -> str:
         """
@@ -272,20 +539,220 @@ class ImageExtractor:
         if not image_path.exists():
             raise FileNotFoundError(f"Image not found: {image_path}")
 
+        return self._run_tesseract(str(image_path), label=str(image_path))
+
+    def ocr_bytes(self, image_bytes: bytes) -> str:
+        """
+        Run OCR on encoded image bytes (e.g. PNG) piped to Tesseract's stdin.
+
+        Args:
+            image_bytes: Encoded image data
+
+        Returns:
+            Extracted text
+        """
+        return self._run_tesseract('stdin', image_bytes=image_bytes, label="in-memory image")
+
+    def _render_png(self, pdf_path: Path, page_num: int, dpi: int) -> bytes:
+        """
+        Render one PDF page to PNG bytes with PyMuPDF.
+
+        The document is opened for this page only and closed again rather
+        than kept in the document cache: OCR walks one single-page PDF per
+        scanned page, and caching each would hold a file open per page.
+        """
+        with self._fitz.open(pdf_path) as doc:
+            pix = doc[page_num - 1].get_pixmap(matrix=self._fitz.Matrix(dpi / 72, dpi / 72))
+            return pix.tobytes("png")
+
+    def ocr_page(self, pdf_path: Path, page_num: int, dpi: int = 200) -> str:
+        """
+        Render a PDF page and OCR it without writing the image to disk.
+
+        Without tesserocr, the pdftoppm renderer is piped directly into the
+        tesseract CLI.
+
+        Args:
+            pdf_path: Path to PDF file
+            page_num: Page number (1-indexed)
+            dpi: Resolution for rendering
+
+        Returns:
+            Extracted text
+
+        Raises:
+            RuntimeError: If the page cannot be rendered
+        """
+        pdf_path = Path(pdf_path)
+
+        if self.has_pymupdf:
+            return self.ocr_bytes(self._render_png(pdf_path, page_num, dpi))
+
+        if self.has_pdftoppm:
+            # With no output root, pdftoppm writes the single page to stdout
+            page = str(page_num)
+            cmd = [*self._pdftoppm_prefix, '-r', str(dpi), '-f', page, '-l', page, '-singlefile', str(pdf_path)]
+            if tesserocr is None:
+                return self._ocr_pipeline(cmd)
+            result = subprocess.run(cmd, capture_output=True)
+            if result.returncode != 0:
+                raise RuntimeError(f"pdftoppm failed: {result.stderr.decode('utf-8', errors='replace')}")
+            return self.ocr_bytes(result.stdout)
+
+        raise RuntimeError("No PDF renderer available. Install poppler-utils or PyMuPDF.")
+
+    def ocr_pages(self, pages: Iterable[Tuple[Path, int]], dpi: int = 200) -> Iterator[Future]:
+        """
+        OCR many PDF pages, overlapping rendering with recognition.
+
+        PyMuPDF is not thread-safe, so with it each page is rendered here and
+        only Tesseract runs in the worker threads; the next page renders while
+        earlier ones are recognized. With pdftoppm, the whole render-and-OCR
+        pipeline of each page runs in a worker.
+
+        Args:
+            pages: (pdf_path, page_num) pairs, page numbers 1-indexed
+            dpi: Resolution for rendering
+
+        Yields:
+            One future per page, in input order, resolving to the extracted
+            text or raising the page's error
+        """
+        if not (self.has_pymupdf or self.has_pdftoppm):
+            raise RuntimeError("No PDF renderer available. Install poppler-utils or PyMuPDF.")
+
+        workers = os.cpu_count() or 1
+        pending = deque()
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for pdf_path, page_num in pages:
+                    if self.has_pymupdf:
+                        try:
+                            png = self._render_png(Path(pdf_path), page_num, dpi)
+                        except Exception as e:
+                            failed = Future()
+                            failed.set_exception(e)
+                            pending.append(failed)
+                        else:
+                            pending.append(pool.submit(self.ocr_bytes, png))
+                    else:
+                        pending.append(pool.submit(self.ocr_page, pdf_path, page_num, dpi))
+
+                    # Keep at most one page per worker in flight ahead of the caller
+                    if len(pending) > workers:
+                        yield pending.popleft()
+
+                while pending:
+                    yield pending.popleft()
+        finally:
+            # The workers' libtesseract handles end with the pool
+            self._end_tesseract()
+
+    def _ocr_pipeline(self, render_cmd: List[str]) -> str:
+        """
+        Pipe a pdftoppm render straight into the tesseract CLI.
+
+        The PNG streams from pdftoppm's stdout to tesseract's stdin without
+        passing through this process or touching disk. A failed render
+        raises RuntimeError, so the page is not taken as blank.
+        """
+        render = subprocess.Popen(render_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            ocr = subprocess.Popen(
+                ['tesseract', 'stdin', 'stdout', '-l', 'eng'],
+                stdin=render.stdout,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+        except FileNotFoundError:
+            render.kill()
+            render.wait()
+            logger.error("Tesseract not installed")
+            return ""
+        finally:
+            # Only tesseract holds the pipe now, so pdftoppm sees it close if tesseract exits
+            render.stdout.close()
+
+        try:
+            stdout, stderr = ocr.communicate(timeout=60)
+        except subprocess.TimeoutExpired:
+            ocr.kill()
+            render.kill()
+            ocr.communicate()
+            render.wait()
+            logger.warning(f"Tesseract timeout for {render_cmd[-1]}")
+            return ""
+
+        render_stderr = render.stderr.read()
+        render.stderr.close()
+        if render.wait() != 0:
+            raise RuntimeError(f"pdftoppm failed: {render_stderr.decode('utf-8', errors='replace')}")
+        if ocr.returncode != 0:
+            logger.warning(f"Tesseract error: {stderr.decode('utf-8', errors='replace')}")
+            return ""
+        return stdout.decode('utf-8', errors='replace').strip()
+
+    def _tesseract_api(self):
+        """
+        Get this thread's libtesseract handle, loading the English model on first use.
+
+        An API object keeps per-image state, so each thread gets its own and
+        OCR workers recognize pages in parallel instead of queueing on one.
+        """
+        api = getattr(self._tess_local, 'api', None)
+        if api is None:
+            api = tesserocr.PyTessBaseAPI(lang='eng')
+            with self._tess_lock:
+                if not self._tess_apis:
+                    atexit.register(self._end_tesseract)
+                self._tess_apis.append(api)
+            self._tess_local.api = api
+        return api
+
+    def _end_tesseract(self):
+        """Release every libtesseract handle created so far."""
+        with self._tess_lock:
+            for api in self._tess_apis:
+                api.End()
+            if self._tess_apis:
+                atexit.unregister(self._end_tesseract)
+            self._tess_apis = []
+            # Threads that OCR again get a fresh handle
+            self._tess_local = threading.local()
+
+    def _run_tesseract(self, source: str, image_bytes: Optional[bytes] = None, label: str = "") -> str:
+        """
+        Run Tesseract on a file path, or on image_bytes when source is 'stdin'.
+
+        With tesserocr installed, one in-process libtesseract handle is reused
+        for every image, so the language model is loaded once instead of per
+        page. Otherwise (or if tesserocr fails) the tesseract CLI is spawned.
+        """
+        if tesserocr is not None:
+            try:
+                api = self._tesseract_api()
+                if image_bytes is None:
+                    api.SetImageFile(source)
+                else:
+                    api.SetImage(Image.open(io.BytesIO(image_bytes)))
+                return api.GetUTF8Text().strip()
+            except (RuntimeError, OSError) as e:
+                logger.warning(f"tesserocr failed for {label}, using tesseract CLI: {e}")
+
         try:
             result = subprocess.run(
-                ['tesseract', str(image_path), 'stdout', '-l', 'eng'],
+                ['tesseract', source, 'stdout', '-l', 'eng'],
+                input=image_bytes,
                 capture_output=True,
-                text=True,
                 timeout=60
             )
             if result.returncode == 0:
-                return result.stdout.strip()
+                return result.stdout.decode('utf-8', errors='replace').strip()
             else:
-                logger.warning(f"Tesseract error: {result.stderr}")
+                logger.warning(f"Tesseract error: {result.stderr.decode('utf-8', errors='replace')}")
                 return ""
         except subprocess.TimeoutExpired:
-            logger.warning(f"Tesseract timeout for {image_path}")
+            logger.warning(f"Tesseract timeout for {label}")
             return ""
         except FileNotFoundError:
             logger.error("Tesseract not installed")
@@ -1,12 +1,78 @@
 """Generate LLM-optimized markdown summary of HOA financials."""
 
+import heapq
+import io
+from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple
 from datetime import datetime
 import logging
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 logger = logging.getLogger(__name__)
 
+# Keep the summary small enough for an LLM context window
+MAX_LINES = 400
+
+# Accounts listed in the month-over-month section
+MOM_CHANGE_ROWS = 10
+
+# "Generated" timestamp in the executive summary
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M'
+
+# Pipe-table separator cell for each column alignment (default left)
+_ALIGN_MARKERS = {'r': "---:", 'c': ":---:"}
+
+
+def _top_k_indices(magnitudes, k: int):
+    """
+    Indices of the k largest magnitudes, in index order.
+
+    Uses a partition instead of a full sort. Ties at the cutoff go to the
+    earlier index, as with heapq.nlargest.
+    """
+    n = magnitudes.size
+    if n <= k:
+        return np.arange(n)
+    kth = np.partition(magnitudes, n - k)[n - k]
+    above = np.flatnonzero(magnitudes > kth)
+    at = np.flatnonzero(magnitudes == kth)[:k - above.size]
+    return np.sort(np.concatenate([above, at]))
+
+
+class _LineLimitReached(Exception):
+    """Raised by _add_line to stop generation once MAX_LINES is reached."""
+
+
+@dataclass(slots=True)
+class _ExpenseTrendColumns:
+    """Expense trend line items (totals dropped) as parallel columns."""
+
+    account: List[str] = field(default_factory=list)
+    full_year_actual: List[float] = field(default_factory=list)
+    total_budget: List[float] = field(default_factory=list)
+    oct: List[float] = field(default_factory=list)
+    nov: List[float] = field(default_factory=list)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> '_ExpenseTrendColumns':
+        """Read each record's fields once, with missing amounts as 0."""
+        columns = cls()
+        for record in records:
+            if record.get('is_total'):
+                continue  # Skip totals, look at line items
+            columns.account.append(f"{record.get('account_code', '')} - {record.get('account_name', '')}")
+            columns.full_year_actual.append(record.get('full_year_actual', 0) or 0)
+            columns.total_budget.append(record.get('total_budget', 0) or 0)
+            columns.oct.append(record.get('oct', 0) or 0)
+            columns.nov.append(record.get('nov', 0) or 0)
+        return columns
+
 
 class MarkdownWriter:
     """Generate markdown summary optimized for LLM context consumption."""
@@ -20,7 +86,9 @@ class MarkdownWriter:
         """
         self.output_path = Path(output_path)
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
-        self.lines = []
+        self._buf = io.StringIO()
+        self._line_count = 0
+        self._truncated = False
 
     def _fmt_currency(self, value: float) -> str:
         """Format value as currency with commas."""
@@ -37,8 +105,12 @@ class MarkdownWriter:
         return f"{value:,.1f}%"
 
     def _add_line(self, line: str = ""):
-        """Add a line to the output."""
-        self.lines.append(line)
+        """Add a line to the output, stopping generation past MAX_LINES."""
+        if self._line_count >= MAX_LINES:
+            raise _LineLimitReached
+        self._buf.write(line)
+        self._buf.write("\n")
+        self._line_count += 1
 
     def _add_table(self, headers: List[str], rows: List[List[str]], align: Optional[List[str]] = None):
         """Add a pipe table."""
@@ -54,19 +126,12 @@ class MarkdownWriter:
         self._add_line("| " + " | ".join(headers) + " |")
 
         # Separator with alignment
-        sep_parts = []
-        for a in align:
-            if a == 'r':
-                sep_parts.append("---:")
-            elif a == 'c':
-                sep_parts.append(":---:")
-            else:
-                sep_parts.append("---")
-        self._add_line("| " + " | ".join(sep_parts) + " |")
+        self._add_line("| " + " | ".join([_ALIGN_MARKERS.get(a, "---") for a in align]) + " |")
 
-        # Data rows
+        # Data rows; cells are mostly preformatted strings, so str() is a C-level no-op
+        add_line = self._add_line
         for row in rows:
-            self._add_line("| " + " | ".join(str(c) for c in row) + " |")
+            add_line("| " + " | ".join(map(str, row)) + " |")
 
     def generate(
         self,
@@ -77,7 +142,8 @@ class MarkdownWriter:
         income_statement_data: List[Dict],
         accounts_receivable_data: List[Dict],
         bank_reconciliation_data: List[Dict],
-        report_date: str = None
+        report_date: str = None,
+        generated_at: Optional[datetime] = None
     ):
         """
         Generate the full markdown summary.
@@ -91,38 +157,49 @@ class MarkdownWriter:
             accounts_receivable_data: AR records
             bank_reconciliation_data: Bank reconciliation records
             report_date: Report period string
+            generated_at: Timestamp to report as the generation time, so a
+                batch of reports can share one; defaults to now
         """
-        self.lines = []
+        self._buf = io.StringIO()
+        self._line_count = 0
+        self._truncated = False
 
-        # Title
-        self._add_line("# HOA Financial Summary")
-        self._add_line()
+        # Alerts and month-over-month changes both come from one scan
+        trend_alerts, mom_changes = self._scan_expense_trend(_ExpenseTrendColumns.from_records(expense_trend_data))
+
+        try:
+            # Title
+            self._add_line("# HOA Financial Summary")
+            self._add_line()
 
-        # 1. Executive Summary
-        self._generate_executive_summary(summary, report_date)
+            # 1. Executive Summary
+            self._generate_executive_summary(summary, report_date, generated_at or datetime.now())
 
-        # 2. Alerts & Variances
-        self._generate_alerts(expense_trend_data, income_statement_data)
+            # 2. Alerts & Variances
+            self._generate_alerts(trend_alerts, income_statement_data)
 
-        # 3. Accounts Receivable - Delinquent
-        self._generate_ar_delinquent(accounts_receivable_data)
+            # 3. Accounts Receivable - Delinquent
+            self._generate_ar_delinquent(accounts_receivable_data)
 
-        # 4. Bank Reconciliation
-        self._generate_bank_reconciliation(bank_reconciliation_data)
+            # 4. Bank Reconciliation
+            self._generate_bank_reconciliation(bank_reconciliation_data)
 
-        # 5. Cash Position
-        self._generate_cash_position(balance_sheet_data)
+            # 5. Cash Position
+            self._generate_cash_position(balance_sheet_data)
 
-        # 6. Month-over-Month Changes
-        self._generate_mom_changes(expense_trend_data)
+            # 6. Month-over-Month Changes
+            self._generate_mom_changes(mom_changes)
 
-        # 7. Notable Transactions
-        self._generate_notable_transactions(disbursement_data)
+            # 7. Notable Transactions
+            self._generate_notable_transactions(disbursement_data)
+        except _LineLimitReached:
+            # Nothing past the limit would be kept, so skip formatting it
+            self._truncated = True
 
         # Write to file
         self._write()
 
-    def _generate_executive_summary(self, summary: Dict[str, Any], report_date: str = None):
+    def _generate_executive_summary(self, summary: Dict[str, Any], report_date: str, generated_at: datetime):
         """Section 1: Executive Summary."""
         self._add_line("## 1. Executive Summary")
         self._add_line()
@@ -130,7 +207,7 @@ class MarkdownWriter:
         # Report period
         if report_date:
             self._add_line(f"**Report Period:** {report_date}")
-        self._add_line(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+        self._add_line(f"**Generated:** {generated_at.strftime(TIMESTAMP_FORMAT)}")
         self._add_line()
 
         # Key metrics table
@@ -148,42 +225,110 @@ class MarkdownWriter:
         self._add_table(["Metric", "Value"], metrics, ['l', 'r'])
         self._add_line()
 
-    def _generate_alerts(self, expense_trend_data: List[Dict], income_statement_data: List[Dict]):
-        """Section 2: Alerts & Variances - flag significant budget variances."""
-        self._add_line("## 2. Alerts & Variances")
-        self._add_line()
+    def _scan_expense_trend(self, columns: _ExpenseTrendColumns):
+        """
+        Collect budget variance alerts and Oct-to-Nov changes in one pass.
 
-        alerts = []
+        With numpy the columns are scanned as arrays, and only the
+        MOM_CHANGE_ROWS largest changes are kept.
 
-        # Check expense trend data for variances
-        for record in expense_trend_data:
-            if record.get('is_total'):
-                continue  # Skip totals, look at line items
+        Returns:
+            Tuple of (alerts as (account, actual, budget, variance,
+            variance %) tuples, month-over-month changes), each in record order
+        """
+        if np is not None and columns.account:
+            try:
+                return self._scan_expense_trend_arrays(columns)
+            except (TypeError, ValueError):
+                pass
 
-            actual = record.get('full_year_actual', 0) or 0
-            budget = record.get('total_budget', 0) or 0
+        alerts = []
+        changes = []
 
-            if budget == 0:
-                continue
+        for account, actual, budget, oct_val, nov_val in zip(
+            columns.account, columns.full_year_actual, columns.total_budget, columns.oct, columns.nov
+        ):
+            if budget != 0:
+                variance = budget - actual
+                variance_pct = variance / budget * 100
 
-            variance = budget - actual
-            variance_pct = (variance / budget * 100) if budget else 0
+                # Flag if variance > 20% AND > $500, OR absolute variance > $2000
+                if (abs(variance_pct) > 20 and abs(variance) > 500) or abs(variance) > 2000:
+                    alerts.append((account, actual, budget, variance, variance_pct))
 
-            # Flag if variance > 20% AND > $500, OR absolute variance > $2000
-            if (abs(variance_pct) > 20 and abs(variance) > 500) or abs(variance) > 2000:
-                alerts.append({
-                    'account': f"{record.get('account_code', '')} - {record.get('account_name', '')}",
-                    'actual': actual,
-                    'budget': budget,
-                    'variance': variance,
-                    'variance_pct': variance_pct
+            change = nov_val - oct_val
+            if change != 0:
+                changes.append({
+                    'account': account,
+                    'oct': oct_val,
+                    'nov': nov_val,
+                    'change': change
                 })
 
-        # Also check income statement data
+        return alerts, changes
+
+    def _scan_expense_trend_arrays(self, columns: _ExpenseTrendColumns):
+        """
+        Vectorized _scan_expense_trend.
+
+        Raises:
+            ValueError: If an amount is NaN or not numeric, so the caller
+                falls back to the per-record scan
+        """
+        actual = np.array(columns.full_year_actual, dtype=float)
+        budget = np.array(columns.total_budget, dtype=float)
+        oct_vals = np.array(columns.oct, dtype=float)
+        nov_vals = np.array(columns.nov, dtype=float)
+        if np.isnan(actual).any() or np.isnan(budget).any() or np.isnan(oct_vals).any() or np.isnan(nov_vals).any():
+            raise ValueError("NaN amount in expense trend")
+
+        variance = budget - actual
+        budgeted = budget != 0
+        variance_pct = np.zeros_like(variance)
+        np.divide(variance, budget, out=variance_pct, where=budgeted)
+        variance_pct *= 100
+
+        # Flag if variance > 20% AND > $500, OR absolute variance > $2000
+        abs_variance = np.abs(variance)
+        flagged = budgeted & (((np.abs(variance_pct) > 20) & (abs_variance > 500)) | (abs_variance > 2000))
+        alerts = [
+            (columns.account[i], columns.full_year_actual[i], columns.total_budget[i], var, pct)
+            for i, var, pct in zip(
+                np.flatnonzero(flagged).tolist(), variance[flagged].tolist(), variance_pct[flagged].tolist()
+            )
+        ]
+
+        change = nov_vals - oct_vals
+        changed = np.flatnonzero(change != 0)
+        top = changed[_top_k_indices(np.abs(change[changed]), MOM_CHANGE_ROWS)]
+        changes = [
+            {
+                'account': columns.account[i],
+                'oct': columns.oct[i],
+                'nov': columns.nov[i],
+                'change': value
+            }
+            for i, value in zip(top.tolist(), change[top].tolist())
+        ]
+
+        return alerts, changes
+
+    def _income_statement_alerts(self, income_statement_data: List[Dict], seen: Set[str]) -> Iterator[Tuple]:
+        """
+        Yield (account, actual, budget, variance, variance %) alert tuples.
+
+        Accounts in seen are skipped, and each yielded account is added to
+        it, so an account is only alerted on once.
+        """
         for record in income_statement_data:
             if record.get('is_total'):
                 continue
 
+            # Avoid duplicates from expense trend
+            account_key = f"{record.get('account_code', '')} - {record.get('account_name', '')}"
+            if account_key in seen:
+                continue
+
             actual = record.get('ytd_actual', 0) or 0
             budget = record.get('ytd_budget', 0) or 0
 
@@ -195,31 +340,36 @@ class MarkdownWriter:
 
             # Flag if variance > 20% AND > $500, OR absolute variance > $2000
             if (abs(variance_pct) > 20 and abs(variance) > 500) or abs(variance) > 2000:
-                # Avoid duplicates from expense trend
-                account_key = f"{record.get('account_code', '')} - {record.get('account_name', '')}"
-                if not any(a['account'] == account_key for a in alerts):
-                    alerts.append({
-                        'account': account_key,
-                        'actual': actual,
-                        'budget': budget,
-                        'variance': variance,
-                        'variance_pct': variance_pct
-                    })
-
-        # Sort by absolute variance descending
-        alerts.sort(key=lambda x: abs(x['variance']), reverse=True)
+                seen.add(account_key)
+                yield (account_key, actual, budget, variance, variance_pct)
+
+    def _generate_alerts(self, trend_alerts: List[Tuple], income_statement_data: List[Dict]):
+        """Section 2: Alerts & Variances - flag significant budget variances."""
+        self._add_line("## 2. Alerts & Variances")
+        self._add_line()
+
+        # Accounts already alerted on, so income statement rows don't repeat them
+        seen = {alert[0] for alert in trend_alerts}
+
+        # Top 15 by absolute variance, streamed from the expense trend
+        # alerts and then the income statement, without building a list
+        alerts = heapq.nlargest(
+            15,
+            chain(trend_alerts, self._income_statement_alerts(income_statement_data, seen)),
+            key=lambda alert: abs(alert[3])
+        )
 
         if not alerts:
             self._add_line("*No significant variances detected*")
         else:
             rows = []
-            for a in alerts[:15]:  # Limit to top 15
+            for account, actual, budget, variance, variance_pct in alerts:
                 rows.append([
-                    a['account'][:40],  # Truncate long names
-                    self._fmt_currency(a['actual']),
-                    self._fmt_currency(a['budget']),
-                    self._fmt_currency(a['variance']),
-                    self._fmt_pct(a['variance_pct'])
+                    account[:40],  # Truncate long names
+                    self._fmt_currency(actual),
+                    self._fmt_currency(budget),
+                    self._fmt_currency(variance),
+                    self._fmt_pct(variance_pct)
                 ])
 
             self._add_table(
@@ -317,16 +467,21 @@ class MarkdownWriter:
         reserve_total = 0.0
 
         for record in balance_sheet_data:
-            category = record.get('category', '').lower()
-            if 'asset' not in category:
+            # The parser flags accounts up front; older records are classified here
+            is_asset = record.get('is_asset')
+            if is_asset is None:
+                is_asset = 'asset' in record.get('category', '').lower()
+            if not is_asset:
                 continue
 
             balance = record.get('current_balance', 0) or 0
-            account_name = record.get('account_name', '').lower()
-            subcategory = record.get('subcategory', '').lower()
+            is_reserve = record.get('is_reserve')
+            if is_reserve is None:
+                is_reserve = ('reserve' in record.get('account_name', '').lower()
+                              or 'reserve' in record.get('subcategory', '').lower())
 
             # Classify as operating or reserve
-            if 'reserve' in account_name or 'reserve' in subcategory:
+            if is_reserve:
                 reserve_total += balance
             else:
                 operating_total += balance
@@ -342,38 +497,19 @@ class MarkdownWriter:
         self._add_table(["Account Type", "Balance"], rows, ['l', 'r'])
         self._add_line()
 
-    def _generate_mom_changes(self, expense_trend_data: List[Dict]):
+    def _generate_mom_changes(self, changes: List[Dict]):
         """Section 6: Month-over-Month expense changes."""
         self._add_line("## 6. Month-over-Month Changes (Oct to Nov)")
         self._add_line()
 
-        # Compare Oct to Nov for expense categories
-        changes = []
-
-        for record in expense_trend_data:
-            if record.get('is_total'):
-                continue
-
-            oct_val = record.get('oct', 0) or 0
-            nov_val = record.get('nov', 0) or 0
-            change = nov_val - oct_val
-
-            if change != 0:
-                changes.append({
-                    'account': f"{record.get('account_code', '')} - {record.get('account_name', '')}",
-                    'oct': oct_val,
-                    'nov': nov_val,
-                    'change': change
-                })
-
-        # Sort by absolute change descending
-        changes.sort(key=lambda x: abs(x['change']), reverse=True)
+        # Top accounts by absolute change, without sorting every account
+        changes = heapq.nlargest(MOM_CHANGE_ROWS, changes, key=lambda x: abs(x['change']))
 
         if not changes:
             self._add_line("*No month-over-month data available*")
         else:
             rows = []
-            for c in changes[:10]:  # Top 10
+            for c in changes:
                 rows.append([
                     c['account'][:40],
                     self._fmt_currency(c['oct']),
@@ -405,14 +541,14 @@ class MarkdownWriter:
                     'check': record.get('check_number', '')
                 })
 
-        # Sort by amount descending
-        notable.sort(key=lambda x: x['amount'], reverse=True)
+        # Top 15 by amount, without sorting every transaction
+        notable = heapq.nlargest(15, notable, key=lambda x: x['amount'])
 
         if not notable:
             self._add_line("*No transactions over $2,000*")
         else:
             rows = []
-            for n in notable[:15]:  # Limit to 15
+            for n in notable:
                 rows.append([
                     n['vendor'][:30],
                     self._fmt_currency(n['amount']),
@@ -430,15 +566,15 @@ class MarkdownWriter:
 
     def _write(self):
         """Write lines to file."""
-        content = "\n".join(self.lines)
+        # Drop the newline after the last line
+        content = self._buf.getvalue()[:-1]
 
-        # Ensure under 400 lines
-        if len(self.lines) > 400:
-            logger.warning(f"Markdown has {len(self.lines)} lines, truncating to 400")
-            content = "\n".join(self.lines[:400])
+        # Ensure under MAX_LINES lines
+        if self._truncated:
+            logger.warning(f"Markdown exceeds {MAX_LINES} lines, truncating")
             content += "\n\n*[Truncated for context efficiency]*"
 
         with open(self.output_path, 'w') as f:
             f.write(content)
 
-        logger.info(f"Saved markdown summary ({len(self.lines)} lines) to {self.output_path}")
+        logger.info(f"Saved markdown summary ({self._line_count} lines) to {self.output_path}")
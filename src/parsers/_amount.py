@@ -0,0 +1,43 @@
+"""Amount string parsing shared by the report parsers."""
+
+
+def parse_amount(amount_str: str) -> float:
+    """
+    Parse an amount string such as "1,234.56", "-4.40" or "(1,403.60)" to float.
+
+    Args:
+        amount_str: Amount text from a report
+
+    Returns:
+        Parsed value, negative when parenthesized or prefixed with '-';
+        0.0 for empty input
+
+    Raises:
+        ValueError: If what remains after stripping is not a number
+    """
+    if not amount_str:
+        return 0.0
+    if '$' not in amount_str:
+        # Plain amounts ("1,234.56", "-4.40") only need their commas dropped;
+        # float() already takes the sign and surrounding whitespace
+        if '(' not in amount_str:
+            try:
+                return float(amount_str.replace(',', ''))
+            except ValueError:
+                pass
+        # Parenthesized negatives ("(1,403.60)") need the same inside them
+        elif amount_str[0] == '(' and amount_str[-1] == ')':
+            try:
+                value = float(amount_str[1:-1].replace(',', ''))
+            except ValueError:
+                pass
+            else:
+                return -value if value > 0 else value
+    # Handle parentheses for negative numbers
+    negative = '(' in amount_str or amount_str.strip().startswith('-')
+    # Drop parentheses, commas and dollar signs, then any whitespace
+    cleaned = ''.join(
+        amount_str.replace('(', '').replace(')', '').replace(',', '').replace('$', '').split()
+    )
+    value = float(cleaned) if cleaned else 0.0
+    return -value if negative and value > 0 else value
@@ -0,0 +1,61 @@
+"""Compile parser line patterns, optionally with RE2."""
+
+import os
+import re
+import logging
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+logger = logging.getLogger(__name__)
+
+# re flags RE2 understands, as inline flag letters
+_RE2_FLAGS = {re.IGNORECASE: 'i', re.MULTILINE: 'm', re.DOTALL: 's'}
+
+
+def _use_re2() -> bool:
+    """Check whether HOA_REGEX_ENGINE asks for RE2 and it is installed."""
+    if os.environ.get('HOA_REGEX_ENGINE', '').strip().lower() != 're2':
+        return False
+    if re2 is None:
+        logger.warning("HOA_REGEX_ENGINE=re2 but google-re2 is not installed; using re")
+        return False
+    return True
+
+
+_USE_RE2 = _use_re2()
+
+
+def compile_pattern(pattern: str, flags: int = 0):
+    """
+    Compile a report line pattern.
+
+    With HOA_REGEX_ENGINE=re2 the pattern goes to RE2, which matches in
+    linear time, so a misaligned line cannot send the lazy multi-group
+    patterns into catastrophic backtracking. RE2 is opt-in because its \\s
+    and \\d are ASCII-only. Patterns or flags RE2 does not support fall
+    back to re.
+
+    Args:
+        pattern: Regular expression source
+        flags: re module flags
+
+    Returns:
+        Compiled pattern with the re.Pattern matching API
+    """
+    if _USE_RE2:
+        letters = ''
+        remaining = flags
+        for flag, letter in _RE2_FLAGS.items():
+            if remaining & flag:
+                letters += letter
+                remaining &= ~flag
+        if not remaining:
+            try:
+                return re2.compile(f"(?{letters}){pattern}" if letters else pattern)
+            except re2.error as e:
+                logger.debug(f"RE2 rejected pattern, using re: {e}")
+
+    return re.compile(pattern, flags)
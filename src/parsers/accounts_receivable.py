@@ -4,8 +4,38 @@ import re
 from typing import List, Dict, Any, Optional
 import logging
 
+from ._amount import parse_amount
+from ._regex import compile_pattern
+
 logger = logging.getLogger(__name__)
 
+# Pattern for account lines
+# Account Id      Name                 Address              Legal   30 day  31-60   61-90  91-120  120+   Total
+_ACCT_PATTERN = compile_pattern(
+    r'^(\d{5}-\d{4})\s+'  # Account ID (XXXXX-XXXX)
+    r'(.+?)\s{2,}'        # Name
+    r'(\d+\s+\w+.+?)\s{2,}'  # Address
+    r'(-?[\d,.]+)\s+'     # 30 day
+    r'(-?[\d,.]+)\s+'     # 31-60 day
+    r'(-?[\d,.]+)\s+'     # 61-90 day
+    r'(-?[\d,.]+)\s+'     # 91-120 day
+    r'(-?[\d,.]+)\s+'     # 120+ day
+    r'(-?[\d,.]+)'        # Total Balance
+)
+
+# Simpler pattern that's more flexible with spacing
+_SIMPLE_PATTERN = compile_pattern(
+    r'^(\d{5}-\d{4})\s+(.+?)(?:\s{2,}|\t)(.+?)(?:\s{2,}|\t)\s*'
+    r'(-?[\d,]+\.?\d*)\s+(-?[\d,]+\.?\d*)\s+(-?[\d,]+\.?\d*)\s+'
+    r'(-?[\d,]+\.?\d*)\s+(-?[\d,]+\.?\d*)\s+(-?[\d,]+\.?\d*)\s*$'
+)
+
+# Account ID at the start of a whitespace-split line
+_ACCT_ID_PREFIX = re.compile(r'\d{5}-\d{4}')
+
+# Name followed by an address, which usually starts with a number
+_NAME_ADDR_PATTERN = re.compile(r'^(.+?)\s+(\d+\s+.+)$')
+
 
 class AccountsReceivableParser:
     """Parse Delinquency and Prepaid Report into structured data."""
@@ -40,29 +70,7 @@ class AccountsReceivableParser:
         # Determine which section we're in
         current_section = None
 
-        # Pattern for account lines
-        # Account Id      Name                 Address              Legal   30 day  31-60   61-90  91-120  120+   Total
-        account_pattern = re.compile(
-            r'^(\d{5}-\d{4})\s+'  # Account ID (XXXXX-XXXX)
-            r'(.+?)\s{2,}'        # Name
-            r'(\d+\s+\w+.+?)\s{2,}'  # Address
-            r'(-?[\d,.]+)\s+'     # 30 day
-            r'(-?[\d,.]+)\s+'     # 31-60 day
-            r'(-?[\d,.]+)\s+'     # 61-90 day
-            r'(-?[\d,.]+)\s+'     # 91-120 day
-            r'(-?[\d,.]+)\s+'     # 120+ day
-            r'(-?[\d,.]+)'        # Total Balance
-        )
-
-        # Simpler pattern that's more flexible with spacing
-        simple_pattern = re.compile(
-            r'^(\d{5}-\d{4})\s+(.+?)(?:\s{2,}|\t)(.+?)(?:\s{2,}|\t)\s*'
-            r'(-?[\d,]+\.?\d*)\s+(-?[\d,]+\.?\d*)\s+(-?[\d,]+\.?\d*)\s+'
-            r'(-?[\d,]+\.?\d*)\s+(-?[\d,]+\.?\d*)\s+(-?[\d,]+\.?\d*)\s*$'
-        )
-
-        lines = text.split('\n')
-        for i, line in enumerate(lines):
+        for line in text.split('\n'):
             # Track section
             if 'Outstanding Balances' in line:
                 current_section = 'delinquent'
@@ -71,20 +79,24 @@ class AccountsReceivableParser:
                 current_section = 'prepaid'
                 continue
 
-            # Skip headers, totals, and empty lines
-            if not line.strip() or 'Account Id' in line or 'Total Accounts' in line:
+            # Account rows start with an XXXXX-XXXX ID, possibly indented;
+            # this also drops empty lines and most headers in one slice
+            if line.lstrip()[5:6] != '-':
                 continue
-            if 'Outstanding Balance:' in line or 'Prepaid Balance:' in line:
+
+            # Skip headers and totals ('Balance:' also covers the
+            # "Outstanding Balance:" and "Prepaid Balance:" summary lines)
+            if 'Account Id' in line or 'Total Accounts' in line:
                 continue
             if 'Percentage' in line or 'Balance:' in line:
                 continue
 
             # Try to match account line
-            match = simple_pattern.match(line)
+            match = _SIMPLE_PATTERN.match(line)
             if not match:
                 # Try more flexible parsing
                 parts = line.split()
-                if len(parts) >= 8 and re.match(r'\d{5}-\d{4}', parts[0]):
+                if len(parts) >= 8 and _ACCT_ID_PREFIX.match(parts[0]):
                     try:
                         # Account ID is first
                         account_id = parts[0]
@@ -95,7 +107,7 @@ class AccountsReceivableParser:
 
                         # Try to split name and address
                         # Usually address starts with a number
-                        name_match = re.match(r'^(.+?)\s+(\d+\s+.+)$', name_addr)
+                        name_match = _NAME_ADDR_PATTERN.match(name_addr)
                         if name_match:
                             name = name_match.group(1)
                             address = name_match.group(2)
@@ -108,12 +120,12 @@ class AccountsReceivableParser:
                             'name': name.strip(),
                             'address': address.strip(),
                             'section': current_section or 'unknown',
-                            'day_30': self._parse_amount(amounts[0]),
-                            'day_31_60': self._parse_amount(amounts[1]),
-                            'day_61_90': self._parse_amount(amounts[2]),
-                            'day_91_120': self._parse_amount(amounts[3]),
-                            'day_120_plus': self._parse_amount(amounts[4]),
-                            'total_balance': self._parse_amount(amounts[5])
+                            'day_30': parse_amount(amounts[0]),
+                            'day_31_60': parse_amount(amounts[1]),
+                            'day_61_90': parse_amount(amounts[2]),
+                            'day_91_120': parse_amount(amounts[3]),
+                            'day_120_plus': parse_amount(amounts[4]),
+                            'total_balance': parse_amount(amounts[5])
                         })
                     except (IndexError, ValueError) as e:
                         logger.debug(f"Could not parse line: {line} - {e}")
@@ -125,27 +137,17 @@ class AccountsReceivableParser:
                 'name': match.group(2).strip(),
                 'address': match.group(3).strip(),
                 'section': current_section or 'unknown',
-                'day_30': self._parse_amount(match.group(4)),
-                'day_31_60': self._parse_amount(match.group(5)),
-                'day_61_90': self._parse_amount(match.group(6)),
-                'day_91_120': self._parse_amount(match.group(7)),
-                'day_120_plus': self._parse_amount(match.group(8)),
-                'total_balance': self._parse_amount(match.group(9))
+                'day_30': parse_amount(match.group(4)),
+                'day_31_60': parse_amount(match.group(5)),
+                'day_61_90': parse_amount(match.group(6)),
+                'day_91_120': parse_amount(match.group(7)),
+                'day_120_plus': parse_amount(match.group(8)),
+                'total_balance': parse_amount(match.group(9))
             })
 
         logger.info(f"Parsed {len(records)} accounts receivable records with regex")
         return records
 
-    def _parse_amount(self, amount_str: str) -> float:
-        """Parse amount string to float."""
-        if not amount_str:
-            return 0.0
-        # Handle parentheses for negative numbers
-        negative = '(' in amount_str or amount_str.strip().startswith('-')
-        cleaned = re.sub(r'[(),\s$]', '', amount_str)
-        value = float(cleaned) if cleaned else 0.0
-        return -value if negative and value > 0 else value
-
     def _parse_with_claude(self, text: str) -> List[Dict[str, Any]]:
         """Parse using Claude for complex reports."""
         schema = """
@@ -212,21 +214,24 @@ class AccountsReceivableParser:
         Returns:
             Dictionary with totals and counts by section
         """
-        summary = {
-            'delinquent_count': 0,
-            'delinquent_total': 0.0,
-            'prepaid_count': 0,
-            'prepaid_total': 0.0,
-            'net_balance': 0.0
-        }
+        # Accumulate in locals; dict item updates per record cost about
+        # as much as the rest of the loop
+        delinquent_count = prepaid_count = 0
+        delinquent_total = prepaid_total = 0.0
 
         for record in records:
-            if record.get('section') == 'delinquent':
-                summary['delinquent_count'] += 1
-                summary['delinquent_total'] += record.get('total_balance', 0)
-            elif record.get('section') == 'prepaid':
-                summary['prepaid_count'] += 1
-                summary['prepaid_total'] += record.get('total_balance', 0)
-
-        summary['net_balance'] = summary['delinquent_total'] + summary['prepaid_total']
-        return summary
+            section = record.get('section')
+            if section == 'delinquent':
+                delinquent_count += 1
+                delinquent_total += record.get('total_balance', 0)
+            elif section == 'prepaid':
+                prepaid_count += 1
+                prepaid_total += record.get('total_balance', 0)
+
+        return {
+            'delinquent_count': delinquent_count,
+            'delinquent_total': delinquent_total,
+            'prepaid_count': prepaid_count,
+            'prepaid_total': prepaid_total,
+            'net_balance': delinquent_total + prepaid_total
+        }
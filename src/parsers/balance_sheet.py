@@ -4,8 +4,43 @@ import re
 from typing import List, Dict, Any, Optional
 import logging
 
+from ._amount import parse_amount
+from ._regex import compile_pattern
+
 logger = logging.getLogger(__name__)
 
+# One pass per line over everything the parse loop looks for; which
+# leading group matched tells the line kind. Category headers match
+# case-insensitively, subcategories are indented and capitalized, and
+# account lines carry a 4-digit code,
+# e.g. "1001 - PPB #3118 Builder Bond    21,398.80    21,394.40    4.40"
+_LINE_PATTERN = compile_pattern(
+    r'^\s*(?P<category>(?i:Assets|Liabilities|Owners\' Equity))\s*$'
+    r'|^\s{2,10}(?P<subcategory>[A-Z][a-zA-Z\s]+)\s*$'
+    r'|^\s*(?P<account_code>\d{4})\s*-\s*(?P<account_name>.+?)\s+'
+    r'(?P<current>-?[\d,]+\.?\d*)\s+'
+    r'(?P<prior>-?[\d,]+\.?\d*)\s+'
+    r'(?P<change>-?[\d,]+\.?\d*)?\s*$'
+)
+
+# Pattern for total lines
+_TOTAL_PATTERN = re.compile(r'^\s*Total\s+', re.IGNORECASE)
+
+# Report totals picked out by extract_totals, found in one scan of the
+# text; each alternative's group is named after the totals key it fills.
+# The shared "Total" prefix is factored out so the scan tests it once.
+_TOTALS_PATTERN = re.compile(
+    r'Total\s+(?:'
+    r'Assets\s+(?P<total_assets>-?[\d,]+\.?\d*)'
+    r'|Liabilities\s+(?P<total_liabilities>-?[\d,]+\.?\d*)'
+    r'|(?:Owners\'?\s+)?Equity\s+(?P<total_equity>-?[\d,]+\.?\d*)'
+    r'|Operating\s+Funds\s+(?P<operating_funds>-?[\d,]+\.?\d*)'
+    r'|Reserve\s+Funds\s+(?P<reserve_funds>-?[\d,]+\.?\d*)'
+    r')'
+    r'|Net\s+Income\s*/?\s*\(?\s*Loss\s*\)?\s+(?P<net_income>-?[\d,]+\.?\d*)',
+    re.IGNORECASE
+)
+
 
 class BalanceSheetParser:
     """Parse Balance Sheet report text into structured data."""
@@ -39,76 +74,62 @@ class BalanceSheetParser:
         current_category = None
         current_subcategory = None
 
-        # Pattern for account lines with numbers
-        # e.g., "1001 - PPB #3118 Builder Bond    21,398.80    21,394.40    4.40"
-        account_pattern = re.compile(
-            r'^\s*(\d{4})\s*-\s*(.+?)\s+'
-            r'(-?[\d,]+\.?\d*)\s+'
-            r'(-?[\d,]+\.?\d*)\s+'
-            r'(-?[\d,]+\.?\d*)?\s*$'
-        )
-
-        # Pattern for category headers
-        category_pattern = re.compile(r'^\s*(Assets|Liabilities|Owners\' Equity)\s*$', re.IGNORECASE)
-
-        # Pattern for subcategory (e.g., "Operating Funds", "Reserve Funds")
-        subcategory_pattern = re.compile(r'^\s{2,10}([A-Z][a-zA-Z\s]+)\s*$')
-
-        # Pattern for total lines
-        total_pattern = re.compile(r'^\s*Total\s+', re.IGNORECASE)
-
         for line in text.split('\n'):
             # Skip empty lines and page markers
             if not line.strip() or 'Printed by' in line or 'Page ' in line:
                 continue
 
-            # Check for main category
-            cat_match = category_pattern.match(line)
-            if cat_match:
-                current_category = cat_match.group(1)
+            match = _LINE_PATTERN.match(line)
+            if match is None:
                 continue
+            (category, subcategory, account_code, account_name,
+             current_str, prior_str, change_str) = match.groups()
 
-            # Check for subcategory
-            sub_match = subcategory_pattern.match(line)
-            if sub_match and not total_pattern.match(line):
-                potential_sub = sub_match.group(1).strip()
-                # Avoid picking up account names as subcategories
-                if not re.match(r'^\d{4}', potential_sub):
-                    current_subcategory = potential_sub
+            # Main category header
+            if category:
+                current_category = category
                 continue
 
-            # Check for account line
-            acct_match = account_pattern.match(line)
-            if acct_match:
-                try:
-                    current = self._parse_amount(acct_match.group(3))
-                    prior = self._parse_amount(acct_match.group(4))
-                    change = self._parse_amount(acct_match.group(5)) if acct_match.group(5) else current - prior
-
-                    records.append({
-                        'account_code': acct_match.group(1),
-                        'account_name': acct_match.group(2).strip(),
-                        'category': current_category or 'Unknown',
-                        'subcategory': current_subcategory or 'Unknown',
-                        'current_balance': current,
-                        'prior_balance': prior,
-                        'change': change
-                    })
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"Could not parse line: {line} - {e}")
+            # Subcategory (always indented), ignoring indented total lines
+            if subcategory:
+                if not _TOTAL_PATTERN.match(line):
+                    current_subcategory = subcategory.strip()
+                continue
+
+            # Account line
+            try:
+                current = parse_amount(current_str)
+                prior = parse_amount(prior_str)
+                change = parse_amount(change_str) if change_str else current - prior
+
+                records.append(self._classify({
+                    'account_code': account_code,
+                    'account_name': account_name.strip(),
+                    'category': current_category or 'Unknown',
+                    'subcategory': current_subcategory or 'Unknown',
+                    'current_balance': current,
+                    'prior_balance': prior,
+                    'change': change
+                }))
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Could not parse line: {line} - {e}")
 
         logger.info(f"Parsed {len(records)} balance sheet records with regex")
         return records
 
-    def _parse_amount(self, amount_str: str) -> float:
-        """Parse amount string to float."""
-        if not amount_str:
-            return 0.0
-        # Handle parentheses for negative numbers
-        negative = '(' in amount_str or amount_str.strip().startswith('-')
-        cleaned = re.sub(r'[(),\s$]', '', amount_str)
-        value = float(cleaned) if cleaned else 0.0
-        return -value if negative and value > 0 else value
+    @staticmethod
+    def _classify(record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Flag asset and reserve accounts on a record.
+
+        Done once at parse time so report writers can test is_asset and
+        is_reserve instead of lowercasing and scanning names on every pass.
+        """
+        account_name = (record.get('account_name') or '').lower()
+        subcategory = (record.get('subcategory') or '').lower()
+        record['is_asset'] = 'asset' in (record.get('category') or '').lower()
+        record['is_reserve'] = 'reserve' in account_name or 'reserve' in subcategory
+        return record
 
     def _parse_with_claude(self, text: str) -> List[Dict[str, Any]]:
         """Parse using Claude for complex or malformed reports."""
@@ -143,7 +164,7 @@ class BalanceSheetParser:
             result = self.claude.parse_text_to_json(text, schema, example)
             if isinstance(result, list):
                 logger.info(f"Parsed {len(result)} balance sheet records with Claude")
-                return result
+                return [self._classify(r) if isinstance(r, dict) else r for r in result]
             return []
         except Exception as e:
             logger.error(f"Claude parsing failed: {e}")
@@ -159,18 +180,10 @@ class BalanceSheetParser:
         """
         totals = {}
 
-        patterns = {
-            'total_assets': r'Total\s+Assets\s+(-?[\d,]+\.?\d*)',
-            'total_liabilities': r'Total\s+Liabilities\s+(-?[\d,]+\.?\d*)',
-            'total_equity': r'Total\s+(?:Owners\'?\s+)?Equity\s+(-?[\d,]+\.?\d*)',
-            'net_income': r'Net\s+Income\s*/?\s*\(?\s*Loss\s*\)?\s+(-?[\d,]+\.?\d*)',
-            'operating_funds': r'Total\s+Operating\s+Funds\s+(-?[\d,]+\.?\d*)',
-            'reserve_funds': r'Total\s+Reserve\s+Funds\s+(-?[\d,]+\.?\d*)',
-        }
-
-        for key, pattern in patterns.items():
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                totals[key] = self._parse_amount(match.group(1))
+        for match in _TOTALS_PATTERN.finditer(text):
+            key = match.lastgroup
+            # Keep the first occurrence of each total
+            if key not in totals:
+                totals[key] = parse_amount(match.group(key))
 
         return totals
@@ -4,8 +4,46 @@ import re
 from typing import List, Dict, Any, Optional
 import logging
 
+from ._amount import parse_amount
+from ._regex import compile_pattern
+
 logger = logging.getLogger(__name__)
 
+# Pattern: "Account: XXXX -- Name -- Type"
+_ACCOUNT_PATTERN = re.compile(
+    r'Account:\s*(\d{4})\s*--\s*(.+?)\s*--\s*(\w+)',
+    re.IGNORECASE
+)
+
+# Page footer the report is split on, one account per page
+_PAGE_SPLIT = re.compile(r'Page \d+ of \d+')
+
+# Balance and total lines, found in one scan of the page; each
+# alternative's group is named after the record field it fills
+_AMOUNT_FIELDS = compile_pattern(
+    r'Balance per Bank:\s*(?P<balance_per_bank>[\d,.-]+)'
+    r'|Ending balance General Ledger:\s*(?P<ending_balance_gl>[\d,.-]+)'
+    r'|Difference:\s*(?P<difference>[\d,.-]+)'
+    r'|Total deposits and outstanding debits:\s*(?P<total_outstanding_deposits>[\d,.-]+)'
+    r'|Total outstanding checks:\s*\(?(?P<total_outstanding_checks>[\d,.-]+)\)?'
+)
+
+# Outstanding item sections
+_DEPOSITS_SECTION = re.compile(
+    r'Plus deposits and outstanding debits:(.*?)Total deposits',
+    re.DOTALL | re.IGNORECASE
+)
+_CHECKS_SECTION = re.compile(
+    r'Less outstanding checks:(.*?)Total outstanding checks',
+    re.DOTALL | re.IGNORECASE
+)
+
+# Pattern for outstanding items:
+# Batch    Date       Description            Reference        Amount
+_ITEM_PATTERN = compile_pattern(
+    r'(\d+)\s+(\d{2}/\d{2}/\d{4})\s+(.+?)\s{2,}(\S+)\s+([\d,.-]+)'
+)
+
 
 class BankReconciliationParser:
     """Parse Bank Reconciliation report text into structured data."""
@@ -37,22 +75,19 @@ class BankReconciliationParser:
         """Parse using regex patterns."""
         records = []
 
-        # Split by account sections
-        # Pattern: "Account: XXXX -- Name -- Type"
-        account_pattern = re.compile(
-            r'Account:\s*(\d{4})\s*--\s*(.+?)\s*--\s*(\w+)',
-            re.IGNORECASE
-        )
-
         # Split text into pages/sections
-        pages = re.split(r'Page \d+ of \d+', text)
+        pages = _PAGE_SPLIT.split(text)
 
         for page in pages:
             if not page.strip():
                 continue
 
-            # Find account info
-            acct_match = account_pattern.search(page)
+            # Find account info. The case-insensitive search scans a page
+            # without a header several times slower than a lowercase
+            # substring test, so rule those pages out first
+            if 'account:' not in page.lower():
+                continue
+            acct_match = _ACCOUNT_PATTERN.search(page)
             if not acct_match:
                 continue
 
@@ -60,33 +95,24 @@ class BankReconciliationParser:
             account_name = acct_match.group(2).strip()
             account_type = acct_match.group(3).strip()
 
-            # Extract balances
-            bank_balance = self._extract_amount(page, r'Balance per Bank:\s*([\d,.-]+)')
-            gl_balance = self._extract_amount(page, r'Ending balance General Ledger:\s*([\d,.-]+)')
-            difference = self._extract_amount(page, r'Difference:\s*([\d,.-]+)')
+            # Extract balances and totals
+            amounts = self._extract_amounts(page)
+            difference = amounts.get('difference')
 
             # Extract outstanding items
             outstanding_deposits = self._extract_outstanding_items(page, 'deposits')
             outstanding_checks = self._extract_outstanding_items(page, 'checks')
 
-            # Calculate totals
-            total_deposits = self._extract_amount(
-                page, r'Total deposits and outstanding debits:\s*([\d,.-]+)'
-            )
-            total_checks = self._extract_amount(
-                page, r'Total outstanding checks:\s*\(?([\d,.-]+)\)?'
-            )
-
             records.append({
                 'account_code': account_code,
                 'account_name': account_name,
                 'account_type': account_type,
-                'balance_per_bank': bank_balance,
+                'balance_per_bank': amounts.get('balance_per_bank'),
                 'outstanding_deposits': outstanding_deposits,
-                'total_outstanding_deposits': total_deposits,
+                'total_outstanding_deposits': amounts.get('total_outstanding_deposits'),
                 'outstanding_checks': outstanding_checks,
-                'total_outstanding_checks': total_checks,
-                'ending_balance_gl': gl_balance,
+                'total_outstanding_checks': amounts.get('total_outstanding_checks'),
+                'ending_balance_gl': amounts.get('ending_balance_gl'),
                 'difference': difference,
                 'is_reconciled': abs(difference) < 0.01 if difference is not None else None
             })
@@ -94,22 +120,20 @@ class BankReconciliationParser:
         logger.info(f"Parsed {len(records)} bank reconciliation records with regex")
         return records
 
-    def _extract_amount(self, text: str, pattern: str) -> Optional[float]:
-        """Extract a single amount using pattern."""
-        match = re.search(pattern, text)
-        if match:
-            return self._parse_amount(match.group(1))
-        return None
-
-    def _parse_amount(self, amount_str: str) -> float:
-        """Parse amount string to float."""
-        if not amount_str:
-            return 0.0
-        # Handle parentheses for negative numbers
-        negative = '(' in amount_str or amount_str.strip().startswith('-')
-        cleaned = re.sub(r'[(),\s$]', '', amount_str)
-        value = float(cleaned) if cleaned else 0.0
-        return -value if negative and value > 0 else value
+    def _extract_amounts(self, text: str) -> Dict[str, float]:
+        """
+        Extract the balance and total amounts from one page in a single pass.
+
+        Returns:
+            Record field name -> amount, using the first occurrence of each
+            label; labels missing from the page are left out
+        """
+        amounts = {}
+        for match in _AMOUNT_FIELDS.finditer(text):
+            field = match.lastgroup
+            if field not in amounts:
+                amounts[field] = parse_amount(match.group(field))
+        return amounts
 
     def _extract_outstanding_items(self, text: str, item_type: str) -> List[Dict[str, Any]]:
         """Extract outstanding deposit or check items."""
@@ -117,42 +141,32 @@ class BankReconciliationParser:
 
         if item_type == 'deposits':
             # Find section between "Plus deposits" and "Total deposits"
-            section_match = re.search(
-                r'Plus deposits and outstanding debits:(.*?)Total deposits',
-                text, re.DOTALL | re.IGNORECASE
-            )
+            section_match = _DEPOSITS_SECTION.search(text)
         else:  # checks
             # Find section between "Less outstanding checks" and "Total outstanding checks"
-            section_match = re.search(
-                r'Less outstanding checks:(.*?)Total outstanding checks',
-                text, re.DOTALL | re.IGNORECASE
-            )
+            section_match = _CHECKS_SECTION.search(text)
 
         if not section_match:
             return items
 
         section = section_match.group(1)
 
-        # Skip "No outstanding" messages
-        if 'No outstanding' in section:
+        # Skip "No outstanding" messages, and sections without the MM/DD/YYYY dates every item has
+        if 'No outstanding' in section or '/' not in section:
             return items
 
-        # Pattern for outstanding items:
-        # Batch    Date       Description            Reference        Amount
-        item_pattern = re.compile(
-            r'(\d+)\s+(\d{2}/\d{2}/\d{4})\s+(.+?)\s{2,}(\S+)\s+([\d,.-]+)'
-        )
-
-        for match in item_pattern.finditer(section):
-            items.append({
-                'batch': match.group(1),
-                'date': match.group(2),
-                'description': match.group(3).strip(),
-                'reference': match.group(4),
-                'amount': self._parse_amount(match.group(5))
-            })
-
-        return items
+        # findall hands back each item's fields as one tuple, rather than
+        # a match object read through five group() calls
+        return [
+            {
+                'batch': batch,
+                'date': date,
+                'description': description.strip(),
+                'reference': reference,
+                'amount': parse_amount(amount)
+            }
+            for batch, date, description, reference, amount in _ITEM_PATTERN.findall(section)
+        ]
 
     def _parse_with_claude(self, text: str) -> List[Dict[str, Any]]:
         """Parse using Claude for complex reports."""
@@ -1,12 +1,42 @@
 """Parser for Check Disbursement reports."""
 
 import re
+from collections import defaultdict
 from typing import List, Dict, Any
 from datetime import datetime
 import logging
 
+from ._amount import parse_amount
+from ._regex import compile_pattern
+
 logger = logging.getLogger(__name__)
 
+# Pattern for vendor header
+# e.g., "Associa Hill Country (11810) - The Enclave at Canyon Lake"
+_VENDOR_PATTERN = re.compile(r'^([A-Za-z][^(]+)\s*\(\d+\)')
+
+# Pattern for check line
+# e.g., "Bank: Harmony Bank Operating      Check Number: 00200284        Check Date: 11/03/2025   Check Amount: 805.00"
+_CHECK_PATTERN = re.compile(
+    r'Check\s+Number:\s*(\d+)\s+'
+    r'Check\s+Date:\s*(\d{1,2}/\d{1,2}/\d{4})\s+'
+    r'Check\s+Amount:\s*([\d,]+\.?\d*)'
+)
+
+# Pattern for transaction line
+# e.g., "123 - 7040 - Management Fees    11/01/2025   Management Fee    805.00"
+_TRANS_PATTERN = compile_pattern(
+    r'^\s*(\d+)\s*-\s*(\d+)\s*-\s*([^0-9]+?)\s+'
+    r'(\d{1,2}/\d{1,2}/\d{4})\s+'
+    r'(.+?)\s+'
+    r'(-?[\d,]+\.?\d*)$'
+)
+
+# Simplified pattern for lines with just account and amount
+_SIMPLE_TRANS_PATTERN = compile_pattern(
+    r'^\s*\d+\s*-\s*(\d+)\s*-\s*(.+?)\s+(\d{1,2}/\d{1,2}/\d{4})\s+(.+?)\s+([\d,]+\.?\d*)\s*$'
+)
+
 
 class DisbursementsParser:
     """Parse Check Disbursement reports into structured data."""
@@ -42,32 +72,6 @@ class DisbursementsParser:
         current_check_date = None
         current_check_amount = None
 
-        # Pattern for vendor header
-        # e.g., "Associa Hill Country (11810) - The Enclave at Canyon Lake"
-        vendor_pattern = re.compile(r'^([A-Za-z][^(]+)\s*\(\d+\)')
-
-        # Pattern for check line
-        # e.g., "Bank: Harmony Bank Operating      Check Number: 00200284        Check Date: 11/03/2025   Check Amount: 805.00"
-        check_pattern = re.compile(
-            r'Check\s+Number:\s*(\d+)\s+'
-            r'Check\s+Date:\s*(\d{1,2}/\d{1,2}/\d{4})\s+'
-            r'Check\s+Amount:\s*([\d,]+\.?\d*)'
-        )
-
-        # Pattern for transaction line
-        # e.g., "123 - 7040 - Management Fees    11/01/2025   Management Fee    805.00"
-        trans_pattern = re.compile(
-            r'^\s*(\d+)\s*-\s*(\d+)\s*-\s*([^0-9]+?)\s+'
-            r'(\d{1,2}/\d{1,2}/\d{4})\s+'
-            r'(.+?)\s+'
-            r'(-?[\d,]+\.?\d*)$'
-        )
-
-        # Simplified pattern for lines with just account and amount
-        simple_trans_pattern = re.compile(
-            r'^\s*\d+\s*-\s*(\d+)\s*-\s*(.+?)\s+(\d{1,2}/\d{1,2}/\d{4})\s+(.+?)\s+([\d,]+\.?\d*)\s*$'
-        )
-
         for line in text.split('\n'):
             line = line.rstrip()
 
@@ -75,36 +79,39 @@ class DisbursementsParser:
             if not line.strip() or 'Printed by' in line or 'Page ' in line:
                 continue
 
-            # Check for vendor
-            vendor_match = vendor_pattern.match(line)
-            if vendor_match:
-                current_vendor = vendor_match.group(1).strip()
-                continue
+            # Check for vendor (headers carry a parenthesized vendor ID;
+            # without one the pattern would backtrack over the whole line)
+            if '(' in line:
+                vendor_match = _VENDOR_PATTERN.match(line)
+                if vendor_match:
+                    current_vendor = vendor_match.group(1).strip()
+                    continue
 
             # Check for check header
-            check_match = check_pattern.search(line)
+            check_match = _CHECK_PATTERN.search(line)
             if check_match:
                 current_check = check_match.group(1)
                 current_check_date = self._parse_date(check_match.group(2))
-                current_check_amount = self._parse_amount(check_match.group(3))
+                current_check_amount = parse_amount(check_match.group(3))
+                continue
+
+            # Transaction lines always carry a MM/DD/YYYY date
+            if '/' not in line:
                 continue
 
             # Try to match transaction line
-            trans_match = trans_pattern.match(line)
+            trans_match = _TRANS_PATTERN.match(line)
             if not trans_match:
-                trans_match = simple_trans_pattern.match(line)
+                trans_match = _SIMPLE_TRANS_PATTERN.match(line)
 
             if trans_match:
                 try:
                     # Handle both pattern formats
-                    if len(trans_match.groups()) == 6:
-                        dept, account, account_name, date, desc, amount = trans_match.groups()
+                    groups = trans_match.groups()
+                    if len(groups) == 6:
+                        dept, account, account_name, date, desc, amount = groups
                     else:
-                        account = trans_match.group(1)
-                        account_name = trans_match.group(2).strip()
-                        date = trans_match.group(3)
-                        desc = trans_match.group(4).strip()
-                        amount = trans_match.group(5)
+                        account, account_name, date, desc, amount = groups
 
                     records.append({
                         'check_number': current_check or '',
@@ -115,7 +122,7 @@ class DisbursementsParser:
                         'account_name': account_name.strip(),
                         'trans_date': self._parse_date(date),
                         'description': desc.strip(),
-                        'amount': self._parse_amount(amount),
+                        'amount': parse_amount(amount),
                         'category': ''  # Will be filled by categorization
                     })
                 except (ValueError, IndexError) as e:
@@ -124,13 +131,6 @@ class DisbursementsParser:
         logger.info(f"Parsed {len(records)} disbursement records with regex")
         return records
 
-    def _parse_amount(self, amount_str: str) -> float:
-        """Parse amount string to float."""
-        if not amount_str:
-            return 0.0
-        cleaned = re.sub(r'[,\s$]', '', amount_str)
-        return float(cleaned) if cleaned else 0.0
-
     def _parse_date(self, date_str: str) -> str:
         """Parse date string to ISO format."""
         if not date_str:
@@ -186,18 +186,15 @@ class DisbursementsParser:
 
     def summarize_by_vendor(self, records: List[Dict[str, Any]]) -> Dict[str, float]:
         """Summarize total spending by vendor."""
-        vendor_totals = {}
+        vendor_totals = defaultdict(int)
         for rec in records:
-            vendor = rec.get('vendor', 'Unknown')
-            amount = rec.get('amount', 0)
-            vendor_totals[vendor] = vendor_totals.get(vendor, 0) + amount
+            vendor_totals[rec.get('vendor', 'Unknown')] += rec.get('amount', 0)
         return dict(sorted(vendor_totals.items(), key=lambda x: -x[1]))
 
     def summarize_by_account(self, records: List[Dict[str, Any]]) -> Dict[str, float]:
         """Summarize total spending by account."""
-        account_totals = {}
+        account_totals = defaultdict(int)
         for rec in records:
             key = f"{rec.get('account_code', '')} - {rec.get('account_name', '')}"
-            amount = rec.get('amount', 0)
-            account_totals[key] = account_totals.get(key, 0) + amount
+            account_totals[key] += rec.get('amount', 0)
         return dict(sorted(account_totals.items(), key=lambda x: -x[1]))
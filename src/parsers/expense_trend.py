@@ -4,8 +4,28 @@ import re
 from typing import List, Dict, Any, Optional
 import logging
 
+from ._amount import parse_amount
+
 logger = logging.getLogger(__name__)
 
+# Account line prefix; the monthly amounts after it are found separately
+# Account Code - Name   Jan  Feb  Mar  Apr  May  Jun  Jul  Aug  Sep  Oct  Nov  Dec  FullYear  Budget
+_SIMPLE_PATTERN = re.compile(
+    r'^\s*(\d{4})\s*-\s*([A-Za-z].*?)\s{2,}'
+)
+
+# Amounts in the rest of a line, plain or parenthesized
+_AMOUNT_TOKEN = re.compile(r'-?[\d,]+\.?\d*|\([\d,]+\.?\d*\)')
+
+# Category name at the start of a stripped Total line
+_TOTAL_NAME_PATTERN = re.compile(r'Total\s+(.+?)\s{2,}')
+
+# Stripped lines that cannot be category headers: account codes, totals,
+# column headings, and anything naming a month or Actual/Budget column
+_NOT_CATEGORY_PATTERN = re.compile(
+    r'\d|Total|Account|.*?(?:Jan|Feb|Mar|Actual|Budget)', re.DOTALL
+)
+
 
 class ExpenseTrendParser:
     """Parse Income and Expense Trend Report into structured data."""
@@ -39,79 +59,49 @@ class ExpenseTrendParser:
         current_section = None  # Income or Expense category
         current_category = None
 
-        # Pattern for account lines with monthly amounts
-        # Account Code - Name   Jan  Feb  Mar  Apr  May  Jun  Jul  Aug  Sep  Oct  Nov  Dec  FullYear  Budget
-        account_pattern = re.compile(
-            r'^\s*(\d{4})\s*-\s*(.+?)\s+'
-            r'(-?[\d,().]+)\s+'  # Jan
-            r'(-?[\d,().]+)\s+'  # Feb
-            r'(-?[\d,().]+)\s+'  # Mar
-            r'(-?[\d,().]+)\s+'  # Apr
-            r'(-?[\d,().]+)\s+'  # May
-            r'(-?[\d,().]+)\s+'  # Jun
-            r'(-?[\d,().]+)\s+'  # Jul
-            r'(-?[\d,().]+)\s+'  # Aug
-            r'(-?[\d,().]+)\s+'  # Sep
-            r'(-?[\d,().]+)\s+'  # Oct
-            r'(-?[\d,().]+)\s+'  # Nov
-            r'(-?[\d,().]*)\s*'  # Dec (might be empty/budget)
-            r'(-?[\d,().]+)\s+'  # Full Year Actual
-            r'(-?[\d,().]+)\s*$'  # Total Budget
-        )
-
-        # Simpler pattern - just grab account and try to parse amounts
-        simple_pattern = re.compile(
-            r'^\s*(\d{4})\s*-\s*([A-Za-z].*?)\s{2,}'
-        )
-
         for line in text.split('\n'):
+            stripped = line.strip()
+
             # Skip empty lines and headers
-            if not line.strip() or 'Printed by' in line or 'Page ' in line:
+            if not stripped or 'Printed by' in line or 'Page ' in line:
                 continue
 
-            # Track categories
-            stripped = line.strip()
-
             # Check for category headers (lines without account codes)
-            if (stripped and
-                not stripped[0].isdigit() and
-                not stripped.startswith('Total') and
-                not stripped.startswith('Account') and
-                not any(month in stripped for month in ['Jan', 'Feb', 'Mar', 'Actual', 'Budget']) and
-                len(stripped) < 40):
+            if len(stripped) < 40 and not _NOT_CATEGORY_PATTERN.match(stripped):
                 current_category = stripped
                 continue
 
             # Try to match account line
-            simple_match = simple_pattern.match(line)
+            simple_match = _SIMPLE_PATTERN.match(line)
             if simple_match:
                 account_code = simple_match.group(1)
                 account_name = simple_match.group(2).strip()
 
                 # Extract all numbers from the rest of the line
                 rest_of_line = line[simple_match.end():]
-                amounts = re.findall(r'-?[\d,]+\.?\d*|\([\d,]+\.?\d*\)', rest_of_line)
+                amounts = _AMOUNT_TOKEN.findall(rest_of_line)
 
                 if len(amounts) >= 12:
                     try:
+                        # At least 12 amounts, so every column is present
                         record = {
                             'account_code': account_code,
                             'account_name': account_name,
                             'category': current_category or 'Unknown',
                             'is_total': False,
-                            'jan': self._parse_amount(amounts[0]) if len(amounts) > 0 else 0,
-                            'feb': self._parse_amount(amounts[1]) if len(amounts) > 1 else 0,
-                            'mar': self._parse_amount(amounts[2]) if len(amounts) > 2 else 0,
-                            'apr': self._parse_amount(amounts[3]) if len(amounts) > 3 else 0,
-                            'may': self._parse_amount(amounts[4]) if len(amounts) > 4 else 0,
-                            'jun': self._parse_amount(amounts[5]) if len(amounts) > 5 else 0,
-                            'jul': self._parse_amount(amounts[6]) if len(amounts) > 6 else 0,
-                            'aug': self._parse_amount(amounts[7]) if len(amounts) > 7 else 0,
-                            'sep': self._parse_amount(amounts[8]) if len(amounts) > 8 else 0,
-                            'oct': self._parse_amount(amounts[9]) if len(amounts) > 9 else 0,
-                            'nov': self._parse_amount(amounts[10]) if len(amounts) > 10 else 0,
-                            'full_year_actual': self._parse_amount(amounts[-2]) if len(amounts) > 1 else 0,
-                            'total_budget': self._parse_amount(amounts[-1]) if len(amounts) > 0 else 0,
+                            'jan': parse_amount(amounts[0]),
+                            'feb': parse_amount(amounts[1]),
+                            'mar': parse_amount(amounts[2]),
+                            'apr': parse_amount(amounts[3]),
+                            'may': parse_amount(amounts[4]),
+                            'jun': parse_amount(amounts[5]),
+                            'jul': parse_amount(amounts[6]),
+                            'aug': parse_amount(amounts[7]),
+                            'sep': parse_amount(amounts[8]),
+                            'oct': parse_amount(amounts[9]),
+                            'nov': parse_amount(amounts[10]),
+                            'full_year_actual': parse_amount(amounts[-2]),
+                            'total_budget': parse_amount(amounts[-1]),
                         }
                         records.append(record)
                     except (ValueError, IndexError) as e:
@@ -119,10 +109,10 @@ class ExpenseTrendParser:
 
             # Check for Total lines
             if stripped.startswith('Total '):
-                total_match = re.match(r'Total\s+(.+?)\s{2,}', stripped)
+                total_match = _TOTAL_NAME_PATTERN.match(stripped)
                 if total_match:
                     category_name = total_match.group(1).strip()
-                    amounts = re.findall(r'-?[\d,]+\.?\d*|\([\d,]+\.?\d*\)', line)
+                    amounts = _AMOUNT_TOKEN.findall(line)
 
                     if len(amounts) >= 2:
                         records.append({
@@ -130,34 +120,24 @@ class ExpenseTrendParser:
                             'account_name': f'Total {category_name}',
                             'category': category_name,
                             'is_total': True,
-                            'jan': self._parse_amount(amounts[0]) if len(amounts) > 0 else 0,
-                            'feb': self._parse_amount(amounts[1]) if len(amounts) > 1 else 0,
-                            'mar': self._parse_amount(amounts[2]) if len(amounts) > 2 else 0,
-                            'apr': self._parse_amount(amounts[3]) if len(amounts) > 3 else 0,
-                            'may': self._parse_amount(amounts[4]) if len(amounts) > 4 else 0,
-                            'jun': self._parse_amount(amounts[5]) if len(amounts) > 5 else 0,
-                            'jul': self._parse_amount(amounts[6]) if len(amounts) > 6 else 0,
-                            'aug': self._parse_amount(amounts[7]) if len(amounts) > 7 else 0,
-                            'sep': self._parse_amount(amounts[8]) if len(amounts) > 8 else 0,
-                            'oct': self._parse_amount(amounts[9]) if len(amounts) > 9 else 0,
-                            'nov': self._parse_amount(amounts[10]) if len(amounts) > 10 else 0,
-                            'full_year_actual': self._parse_amount(amounts[-2]) if len(amounts) > 1 else 0,
-                            'total_budget': self._parse_amount(amounts[-1]) if len(amounts) > 0 else 0,
+                            'jan': parse_amount(amounts[0]) if len(amounts) > 0 else 0,
+                            'feb': parse_amount(amounts[1]) if len(amounts) > 1 else 0,
+                            'mar': parse_amount(amounts[2]) if len(amounts) > 2 else 0,
+                            'apr': parse_amount(amounts[3]) if len(amounts) > 3 else 0,
+                            'may': parse_amount(amounts[4]) if len(amounts) > 4 else 0,
+                            'jun': parse_amount(amounts[5]) if len(amounts) > 5 else 0,
+                            'jul': parse_amount(amounts[6]) if len(amounts) > 6 else 0,
+                            'aug': parse_amount(amounts[7]) if len(amounts) > 7 else 0,
+                            'sep': parse_amount(amounts[8]) if len(amounts) > 8 else 0,
+                            'oct': parse_amount(amounts[9]) if len(amounts) > 9 else 0,
+                            'nov': parse_amount(amounts[10]) if len(amounts) > 10 else 0,
+                            'full_year_actual': parse_amount(amounts[-2]) if len(amounts) > 1 else 0,
+                            'total_budget': parse_amount(amounts[-1]) if len(amounts) > 0 else 0,
                         })
 
         logger.info(f"Parsed {len(records)} expense trend records with regex")
         return records
 
-    def _parse_amount(self, amount_str: str) -> float:
-        """Parse amount string to float."""
-        if not amount_str:
-            return 0.0
-        # Handle parentheses for negative numbers
-        negative = '(' in amount_str
-        cleaned = re.sub(r'[(),\s$]', '', amount_str)
-        value = float(cleaned) if cleaned else 0.0
-        return -value if negative else value
-
     def _parse_with_claude(self, text: str) -> List[Dict[str, Any]]:
         """Parse using Claude for complex reports."""
         schema = """
@@ -265,8 +245,7 @@ class ExpenseTrendParser:
                     'variance': budget - actual
                 }
 
-        # Calculate totals from Total Income and Total Expense if present
-        for record in records:
+            # Calculate totals from Total Income and Total Expense if present
             name = record.get('account_name', '').lower()
             if 'total income' in name:
                 summary['total_income'] = record.get('full_year_actual', 0)
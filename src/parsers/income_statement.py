@@ -4,8 +4,32 @@ import re
 from typing import List, Dict, Any, Optional
 import logging
 
+from ._amount import parse_amount
+from ._regex import compile_pattern
+
 logger = logging.getLogger(__name__)
 
+# Pattern for account lines with 8 numeric columns
+# Account Code - Name    Actual Budget Variance   Actual Budget Variance   AnnualBudget Remaining
+_ACCOUNT_PATTERN = compile_pattern(
+    r'^\s*(\d{4})\s*-\s*(.+?)\s+'
+    r'(-?[\d,().]+)\s+(-?[\d,().]+)\s+(-?[\d,().]+)\s+'  # Current Period
+    r'(-?[\d,().]+)\s+(-?[\d,().]+)\s+(-?[\d,().]+)\s+'  # YTD
+    r'(-?[\d,().]+)\s+(-?[\d,().]+)\s*$'                  # Annual Budget, Remaining
+)
+
+# Pattern for Total lines
+_TOTAL_PATTERN = compile_pattern(
+    r'^\s*Total\s+(.+?)\s+'
+    r'(-?[\d,().]+)\s+(-?[\d,().]+)\s+(-?[\d,().]+)\s+'
+    r'(-?[\d,().]+)\s+(-?[\d,().]+)\s+(-?[\d,().]+)\s+'
+    r'(-?[\d,().]+)\s+(-?[\d,().]+)\s*$'
+)
+
+# Stripped lines that cannot be category headers: totals, column
+# headings, and anything with a digit in its first 10 characters
+_NOT_CATEGORY_PATTERN = re.compile(r'Total|Current|Actual|.{0,9}\d', re.DOTALL)
+
 
 class IncomeStatementParser:
     """Parse Income Statement report text into structured data."""
@@ -39,45 +63,23 @@ class IncomeStatementParser:
         current_section = None  # Income or Expense
         current_category = None  # e.g., Assessment Income, Administrative
 
-        # Pattern for account lines with 8 numeric columns
-        # Account Code - Name    Actual Budget Variance   Actual Budget Variance   AnnualBudget Remaining
-        account_pattern = re.compile(
-            r'^\s*(\d{4})\s*-\s*(.+?)\s+'
-            r'(-?[\d,().]+)\s+(-?[\d,().]+)\s+(-?[\d,().]+)\s+'  # Current Period
-            r'(-?[\d,().]+)\s+(-?[\d,().]+)\s+(-?[\d,().]+)\s+'  # YTD
-            r'(-?[\d,().]+)\s+(-?[\d,().]+)\s*$'                  # Annual Budget, Remaining
-        )
-
-        # Pattern for Total lines
-        total_pattern = re.compile(
-            r'^\s*Total\s+(.+?)\s+'
-            r'(-?[\d,().]+)\s+(-?[\d,().]+)\s+(-?[\d,().]+)\s+'
-            r'(-?[\d,().]+)\s+(-?[\d,().]+)\s+(-?[\d,().]+)\s+'
-            r'(-?[\d,().]+)\s+(-?[\d,().]+)\s*$'
-        )
-
         for line in text.split('\n'):
+            stripped = line.strip()
+
             # Skip empty lines and page markers
-            if not line.strip() or 'Printed by' in line or 'Page ' in line:
+            if not stripped or 'Printed by' in line or 'Page ' in line:
                 continue
 
             # Track main sections
-            if line.strip() == 'Income':
+            if stripped == 'Income':
                 current_section = 'Income'
                 continue
-            elif line.strip() == 'Expense':
+            elif stripped == 'Expense':
                 current_section = 'Expense'
                 continue
 
             # Track categories (lines that don't start with numbers and aren't totals)
-            stripped = line.strip()
-            if (stripped and
-                not stripped[0].isdigit() and
-                not stripped.startswith('Total') and
-                not stripped.startswith('Current') and
-                not stripped.startswith('Actual') and
-                not any(c.isdigit() for c in stripped[:10]) and
-                len(stripped) < 50):
+            if len(stripped) < 50 and not _NOT_CATEGORY_PATTERN.match(stripped):
                 # This might be a category header
                 potential_cat = stripped
                 if potential_cat not in ['Income', 'Expense', 'Operating', 'Reserves']:
@@ -85,47 +87,53 @@ class IncomeStatementParser:
                 continue
 
             # Try to match account line
-            acct_match = account_pattern.match(line)
+            acct_match = _ACCOUNT_PATTERN.match(line)
             if acct_match:
+                (account_code, account_name, current_actual, current_budget,
+                 current_variance, ytd_actual, ytd_budget, ytd_variance,
+                 annual_budget, budget_remaining) = acct_match.groups()
                 try:
                     records.append({
-                        'account_code': acct_match.group(1),
-                        'account_name': acct_match.group(2).strip(),
+                        'account_code': account_code,
+                        'account_name': account_name.strip(),
                         'section': current_section or 'Unknown',
                         'category': current_category or 'Unknown',
                         'is_total': False,
-                        'current_actual': self._parse_amount(acct_match.group(3)),
-                        'current_budget': self._parse_amount(acct_match.group(4)),
-                        'current_variance': self._parse_amount(acct_match.group(5)),
-                        'ytd_actual': self._parse_amount(acct_match.group(6)),
-                        'ytd_budget': self._parse_amount(acct_match.group(7)),
-                        'ytd_variance': self._parse_amount(acct_match.group(8)),
-                        'annual_budget': self._parse_amount(acct_match.group(9)),
-                        'budget_remaining': self._parse_amount(acct_match.group(10))
+                        'current_actual': parse_amount(current_actual),
+                        'current_budget': parse_amount(current_budget),
+                        'current_variance': parse_amount(current_variance),
+                        'ytd_actual': parse_amount(ytd_actual),
+                        'ytd_budget': parse_amount(ytd_budget),
+                        'ytd_variance': parse_amount(ytd_variance),
+                        'annual_budget': parse_amount(annual_budget),
+                        'budget_remaining': parse_amount(budget_remaining)
                     })
                 except (ValueError, TypeError) as e:
                     logger.debug(f"Could not parse account line: {line} - {e}")
                 continue
 
             # Try to match total line
-            total_match = total_pattern.match(line)
+            total_match = _TOTAL_PATTERN.match(line)
             if total_match:
+                (total_name, current_actual, current_budget, current_variance,
+                 ytd_actual, ytd_budget, ytd_variance,
+                 annual_budget, budget_remaining) = total_match.groups()
                 try:
-                    total_name = total_match.group(1).strip()
+                    total_name = total_name.strip()
                     records.append({
                         'account_code': '',
                         'account_name': f"Total {total_name}",
                         'section': current_section or 'Unknown',
                         'category': total_name,
                         'is_total': True,
-                        'current_actual': self._parse_amount(total_match.group(2)),
-                        'current_budget': self._parse_amount(total_match.group(3)),
-                        'current_variance': self._parse_amount(total_match.group(4)),
-                        'ytd_actual': self._parse_amount(total_match.group(5)),
-                        'ytd_budget': self._parse_amount(total_match.group(6)),
-                        'ytd_variance': self._parse_amount(total_match.group(7)),
-                        'annual_budget': self._parse_amount(total_match.group(8)),
-                        'budget_remaining': self._parse_amount(total_match.group(9))
+                        'current_actual': parse_amount(current_actual),
+                        'current_budget': parse_amount(current_budget),
+                        'current_variance': parse_amount(current_variance),
+                        'ytd_actual': parse_amount(ytd_actual),
+                        'ytd_budget': parse_amount(ytd_budget),
+                        'ytd_variance': parse_amount(ytd_variance),
+                        'annual_budget': parse_amount(annual_budget),
+                        'budget_remaining': parse_amount(budget_remaining)
                     })
                 except (ValueError, TypeError) as e:
                     logger.debug(f"Could not parse total line: {line} - {e}")
@@ -133,16 +141,6 @@ class IncomeStatementParser:
         logger.info(f"Parsed {len(records)} income statement records with regex")
         return records
 
-    def _parse_amount(self, amount_str: str) -> float:
-        """Parse amount string to float."""
-        if not amount_str:
-            return 0.0
-        # Handle parentheses for negative numbers
-        negative = '(' in amount_str
-        cleaned = re.sub(r'[(),\s$]', '', amount_str)
-        value = float(cleaned) if cleaned else 0.0
-        return -value if negative else value
-
     def _parse_with_claude(self, text: str) -> List[Dict[str, Any]]:
         """Parse using Claude for complex reports."""
         schema = """
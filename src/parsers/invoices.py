@@ -6,6 +6,8 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 import logging
 
+from ._amount import parse_amount
+
 logger = logging.getLogger(__name__)
 
 
@@ -130,7 +132,7 @@ class InvoiceParser:
         for pattern in amount_patterns:
             amount_match = re.search(pattern, text, re.IGNORECASE)
             if amount_match:
-                invoice['amount'] = self._parse_amount(amount_match.group(1))
+                invoice['amount'] = parse_amount(amount_match.group(1))
                 break
 
         # Vendor - look for company names at top
@@ -164,16 +166,6 @@ class InvoiceParser:
 
         return invoice
 
-    def _parse_amount(self, amount_str: str) -> float:
-        """Parse amount string to float."""
-        if not amount_str:
-            return 0.0
-        cleaned = re.sub(r'[,\s$]', '', amount_str)
-        try:
-            return float(cleaned)
-        except ValueError:
-            return 0.0
-
     def _parse_date(self, date_str: str) -> str:
         """Parse date string to ISO format."""
         if not date_str:
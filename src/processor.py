@@ -8,11 +8,12 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime
 import logging
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 from .checkpoint import CheckpointManager
 from .claude_client import ClaudeClient, TokenLimitError
 from .image_extractor import ImageExtractor
-from .excel_writer import ExcelWriter
+from .excel_writer import create_excel_writer
 from .markdown_writer import MarkdownWriter
 from .parsers import (
     BalanceSheetParser, DisbursementsParser, InvoiceParser,
@@ -22,6 +23,9 @@ from .parsers import (
 
 logger = logging.getLogger(__name__)
 
+# Page groups parsed concurrently; each parse mostly waits on the Claude CLI
+PARSE_WORKERS = 4
+
 
 class FinancialProcessor:
     """Orchestrates the processing of HOA financial PDF packages."""
@@ -75,7 +79,7 @@ class FinancialProcessor:
     def _init_claude(self):
         """Initialize Claude client on demand."""
         if self.claude is None:
-            self.claude = ClaudeClient()
+            self.claude = ClaudeClient(cache_dir=self.checkpoint_dir / "claude_cache")
 
     def _init_image_extractor(self):
         """Initialize image extractor on demand."""
@@ -225,6 +229,8 @@ class FinancialProcessor:
         logger.info("Step 3: Parsing page groups...")
 
         self._init_claude()
+        # On resume, keep the records of groups parsed before the interruption
+        self._load_parsed_data()
 
         # Load page groups from detection step
         page_groups = self.checkpoint.get_data('page_groups', [])
@@ -242,93 +248,100 @@ class FinancialProcessor:
         income_parser = IncomeStatementParser(self.claude)
         expense_trend_parser = ExpenseTrendParser(self.claude)
 
-        for group_idx, group in enumerate(page_groups):
-            report_type = group['type']
-            pages = group['pages']
-            group_id = f"group_{group_idx:02d}_{report_type}"
-
-            # Check if already parsed
-            parsed_key = f'parsed_{group_id}'
-            if self.checkpoint.get_data(parsed_key):
-                logger.info(f"  {group_id}: already parsed, skipping")
-                continue
-
-            page_range = f"{pages[0]}-{pages[-1]}" if len(pages) > 1 else pages[0]
-            logger.info(f"  Parsing {group_id} ({page_range}, {len(pages)} pages)...")
-
-            # Combine text from all pages in this group
-            combined_text = ""
-            for page_id in pages:
-                # Convert page_001 back to page-001 for filename
-                txt_file = text_dir / f"{page_id.replace('_', '-')}.txt"
-                if txt_file.exists():
-                    with open(txt_file, 'r') as f:
-                        combined_text += f"\n\n--- {page_id} ---\n\n"
-                        combined_text += f.read()
-
-            try:
-                records = []
-
-                if report_type == 'balance_sheet':
-                    records = balance_parser.parse(combined_text)
-                    self.balance_sheet_data.extend(records)
-
-                elif report_type == 'disbursements':
-                    records = disb_parser.parse(combined_text)
-                    self.disbursement_data.extend(records)
-
-                elif report_type == 'invoice':
-                    records = invoice_parser.parse_text_invoice(combined_text)
-                    self.invoice_data.extend(records)
-
-                elif report_type == 'investment_listing':
-                    # Use balance sheet parser for now
-                    records = balance_parser.parse(combined_text)
-                    self.investment_data.extend(records)
-
-                elif report_type == 'bank_reconciliation':
-                    records = bank_recon_parser.parse(combined_text)
-                    self.bank_reconciliation_data.extend(records)
-
-                elif report_type == 'accounts_receivable':
-                    records = ar_parser.parse(combined_text)
-                    self.accounts_receivable_data.extend(records)
-
-                elif report_type == 'income_statement':
-                    records = income_parser.parse(combined_text)
-                    self.income_statement_data.extend(records)
-
-                elif report_type == 'expense_trend':
-                    records = expense_trend_parser.parse(combined_text)
-                    self.expense_trend_data.extend(records)
-
-                elif report_type == 'scanned_image':
-                    # Mark for OCR processing
-                    logger.info(f"    Scanned pages - will process in OCR step")
-                    records = [{'page_id': p, 'needs_ocr': True} for p in pages]
+        # Parse call, destination list and its checkpoint key for each report type
+        handlers = {
+            'balance_sheet': (balance_parser.parse, self.balance_sheet_data, 'balance_sheet_data'),
+            'disbursements': (disb_parser.parse, self.disbursement_data, 'disbursement_data'),
+            'invoice': (invoice_parser.parse_text_invoice, self.invoice_data, 'invoice_data'),
+            # Use balance sheet parser for now
+            'investment_listing': (balance_parser.parse, self.investment_data, 'investment_data'),
+            'bank_reconciliation': (
+                bank_recon_parser.parse, self.bank_reconciliation_data, 'bank_reconciliation_data'
+            ),
+            'accounts_receivable': (
+                ar_parser.parse, self.accounts_receivable_data, 'accounts_receivable_data'
+            ),
+            'income_statement': (income_parser.parse, self.income_statement_data, 'income_statement_data'),
+            'expense_trend': (expense_trend_parser.parse, self.expense_trend_data, 'expense_trend_data'),
+        }
 
-                else:
-                    logger.warning(f"    Unknown type, skipping")
-
-                # Save per-group results for debugging
-                group_results_dir = self.split_dir / "parsed" / "per_group"
-                group_results_dir.mkdir(parents=True, exist_ok=True)
-                group_json = group_results_dir / f"{group_id}.json"
-                with open(group_json, 'w') as f:
-                    json.dump({
-                        'group_id': group_id,
-                        'detected_type': report_type,
-                        'record_count': len(records),
-                        'records': records
-                    }, f, indent=2, default=str)
-                logger.info(f"    Saved {len(records)} records to {group_json.name}")
-
-                self.checkpoint.set_data(parsed_key, True)
+        # Each Claude parse spends seconds waiting on the CLI, so groups are
+        # parsed concurrently; results are collected in group order so
+        # records and checkpoints come out as they did sequentially
+        pool = ThreadPoolExecutor(max_workers=PARSE_WORKERS)
+        try:
+            pending = []
+            for group_idx, group in enumerate(page_groups):
+                report_type = group['type']
+                pages = group['pages']
+                group_id = f"group_{group_idx:02d}_{report_type}"
+
+                # Check if already parsed
+                parsed_key = f'parsed_{group_id}'
+                if self.checkpoint.get_data(parsed_key):
+                    logger.info(f"  {group_id}: already parsed, skipping")
+                    continue
+
+                page_range = f"{pages[0]}-{pages[-1]}" if len(pages) > 1 else pages[0]
+                logger.info(f"  Parsing {group_id} ({page_range}, {len(pages)} pages)...")
+
+                # Combine text from all pages in this group
+                combined_text = ""
+                for page_id in pages:
+                    # Convert page_001 back to page-001 for filename
+                    txt_file = text_dir / f"{page_id.replace('_', '-')}.txt"
+                    if txt_file.exists():
+                        with open(txt_file, 'r') as f:
+                            combined_text += f"\n\n--- {page_id} ---\n\n"
+                            combined_text += f.read()
+
+                handler = handlers.get(report_type)
+                future = pool.submit(handler[0], combined_text) if handler else None
+                pending.append((group_id, report_type, pages, future))
+
+            for group_id, report_type, pages, future in pending:
+                try:
+                    records = []
+                    done = {f'parsed_{group_id}': True}
+
+                    if future is not None:
+                        records = future.result()
+                        _, data, data_key = handlers[report_type]
+                        data.extend(records)
+                        # Journal the grown list with the mark, so a resume
+                        # that skips this group still has its records
+                        done[data_key] = data
+
+                    elif report_type == 'scanned_image':
+                        # Mark for OCR processing
+                        logger.info(f"    Scanned pages - will process in OCR step")
+                        records = [{'page_id': p, 'needs_ocr': True} for p in pages]
 
-            except TokenLimitError:
-                # Save progress and re-raise
-                self._save_parsed_data()
-                raise
+                    else:
+                        logger.warning(f"    Unknown type, skipping")
+
+                    # Save per-group results for debugging
+                    group_results_dir = self.split_dir / "parsed" / "per_group"
+                    group_results_dir.mkdir(parents=True, exist_ok=True)
+                    group_json = group_results_dir / f"{group_id}.json"
+                    with open(group_json, 'w') as f:
+                        json.dump({
+                            'group_id': group_id,
+                            'detected_type': report_type,
+                            'record_count': len(records),
+                            'records': records
+                        }, f, indent=2, default=str)
+                    logger.info(f"    Saved {len(records)} records to {group_json.name}")
+
+                    self.checkpoint.update_data(done)
+
+                except TokenLimitError:
+                    # Save progress and re-raise
+                    self._save_parsed_data()
+                    raise
+        finally:
+            # Drop parses still queued if a group failed
+            pool.shutdown(cancel_futures=True)
 
         self._save_parsed_data()
         self.checkpoint.complete_step('parse')
@@ -401,12 +414,11 @@ class FinancialProcessor:
 
         # Individual page PDFs directory
         pages_dir = self.split_dir / "pages"
-        images_dir = self.split_dir / "images" / "ocr"
-        images_dir.mkdir(parents=True, exist_ok=True)
 
         invoice_parser = InvoiceParser(self.claude)
         ocr_results = []
 
+        to_ocr = []
         for page_id in scanned_pages:
             # Convert page_045 to page number 45
             page_num = int(page_id.replace('page_', ''))
@@ -422,55 +434,48 @@ class FinancialProcessor:
                 logger.warning(f"    {page_id}: PDF not found at {page_pdf}")
                 continue
 
+            to_ocr.append((page_id, page_num, page_pdf))
+
+        # Pages render and OCR ahead in the background; results come back in page order
+        ocr_futures = self.image_extractor.ocr_pages(((page_pdf, 1) for _, _, page_pdf in to_ocr), dpi=200)
+
+        for (page_id, page_num, page_pdf), ocr_future in zip(to_ocr, ocr_futures):
             logger.info(f"  OCR {page_id}...")
 
             try:
-                # Convert page PDF to image
-                image_path = images_dir / f"page-{page_num:03d}.png"
-
-                if not image_path.exists():
-                    # Use pdftoppm to convert single-page PDF to PNG
-                    import subprocess
-                    result = subprocess.run(
-                        ['pdftoppm', '-png', '-r', '200', '-singlefile',
-                         str(page_pdf), str(images_dir / f"page-{page_num:03d}")],
-                        capture_output=True,
-                        text=True
-                    )
-                    if result.returncode != 0:
-                        logger.error(f"    pdftoppm failed: {result.stderr}")
-                        continue
-
-                if image_path.exists():
-                    # Use Tesseract for fast OCR
-                    ocr_text = self.image_extractor.ocr_image(image_path)
-
-                    if ocr_text:
-                        # Parse OCR text into invoice structure
-                        invoice = invoice_parser._extract_invoice_fields(ocr_text)
-                        invoice['source_page'] = page_num
-                        invoice['source_image'] = str(image_path)
-                        invoice['ocr_text'] = ocr_text
-
-                        # Add to invoice data if we got meaningful content
-                        if invoice.get('amount') or invoice.get('vendor') or invoice.get('invoice_id'):
-                            self.invoice_data.append(invoice)
-                            logger.info(f"    Extracted: {invoice.get('vendor', 'Unknown')} - ${invoice.get('amount', 0):.2f}")
-                        else:
-                            # Store raw OCR text for review
-                            ocr_results.append({
-                                'page_id': page_id,
-                                'page_num': page_num,
-                                'ocr_text': ocr_text[:500],  # First 500 chars for review
-                                'image_path': str(image_path)
-                            })
-                            logger.info(f"    OCR'd {len(ocr_text)} chars - no structured data extracted")
+                # Rendered straight into Tesseract; no PNG is written
+                ocr_text = ocr_future.result()
+
+                if ocr_text:
+                    # Parse OCR text into invoice structure
+                    invoice = invoice_parser._extract_invoice_fields(ocr_text)
+                    invoice['source_page'] = page_num
+                    # Same key InvoiceParser.parse_image uses; here it is the page PDF
+                    invoice['source_image'] = str(page_pdf)
+                    invoice['ocr_text'] = ocr_text
+
+                    # Add to invoice data if we got meaningful content
+                    if invoice.get('amount') or invoice.get('vendor') or invoice.get('invoice_id'):
+                        self.invoice_data.append(invoice)
+                        logger.info(f"    Extracted: {invoice.get('vendor', 'Unknown')} - ${invoice.get('amount', 0):.2f}")
                     else:
-                        logger.info(f"    No text extracted from image")
+                        # Store raw OCR text for review
+                        ocr_results.append({
+                            'page_id': page_id,
+                            'page_num': page_num,
+                            'ocr_text': ocr_text[:500],  # First 500 chars for review
+                            'source_pdf': str(page_pdf)
+                        })
+                        logger.info(f"    OCR'd {len(ocr_text)} chars - no structured data extracted")
+                else:
+                    logger.info(f"    No text extracted from page")
 
-                self.checkpoint.set_data(ocr_key, True)
+                # Journal any appended invoice with the mark, so a resume
+                # that skips this page still has it
+                self.checkpoint.update_data({'invoice_data': self.invoice_data, f'ocr_{page_id}': True})
 
             except TokenLimitError:
+                ocr_futures.close()
                 self._save_parsed_data()
                 raise
             except Exception as e:
@@ -513,7 +518,7 @@ class FinancialProcessor:
                 )
                 disb['category'] = category.get('category', '')
                 disb['subcategory'] = category.get('subcategory', '')
-                self.checkpoint.set_data(cat_key, True)
+                self.checkpoint.update_data({'disbursement_data': self.disbursement_data, cat_key: True})
 
             except TokenLimitError:
                 self._save_parsed_data()
@@ -532,7 +537,7 @@ class FinancialProcessor:
         # Generate output filename with date
         output_file = self.output_dir / f"{self.job_id}.xlsx"
 
-        excel = ExcelWriter(output_file)
+        excel = create_excel_writer(output_file)
 
         # Add summary sheet
         summary = self._generate_summary()
@@ -563,22 +568,26 @@ class FinancialProcessor:
         if self.expense_trend_data:
             excel.add_expense_trend(self.expense_trend_data)
 
-        excel.save()
-        excel.close()
-
-        # Generate LLM-optimized markdown summary
-        md_file = self.output_dir / f"{self.job_id}_SUMMARY.md"
-        markdown = MarkdownWriter(md_file)
-        markdown.generate(
-            summary=summary,
-            balance_sheet_data=self.balance_sheet_data,
-            disbursement_data=self.disbursement_data,
-            expense_trend_data=self.expense_trend_data,
-            income_statement_data=self.income_statement_data,
-            accounts_receivable_data=self.accounts_receivable_data,
-            bank_reconciliation_data=self.bank_reconciliation_data,
-            report_date=summary.get('report_date')
-        )
+        # Compress the workbook while the markdown summary is written
+        excel.save_async()
+
+        try:
+            # Generate LLM-optimized markdown summary
+            md_file = self.output_dir / f"{self.job_id}_SUMMARY.md"
+            markdown = MarkdownWriter(md_file)
+            markdown.generate(
+                summary=summary,
+                balance_sheet_data=self.balance_sheet_data,
+                disbursement_data=self.disbursement_data,
+                expense_trend_data=self.expense_trend_data,
+                income_statement_data=self.income_statement_data,
+                accounts_receivable_data=self.accounts_receivable_data,
+                bank_reconciliation_data=self.bank_reconciliation_data,
+                report_date=summary.get('report_date')
+            )
+        finally:
+            excel.wait_saved()
+            excel.close()
 
         self.checkpoint.complete_step('excel', {
             'output_file': str(output_file),
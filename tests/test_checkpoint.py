@@ -0,0 +1,85 @@
+"""Tests for checkpoint journaling and resume."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.checkpoint import CheckpointManager
+
+
+class CheckpointResumeTest(unittest.TestCase):
+    """A reloaded checkpoint must match what was marked done."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+        self._managers = []
+
+    def tearDown(self):
+        for checkpoint in self._managers:
+            checkpoint._close_journal()
+        self._tmp.cleanup()
+
+    def _reload(self, compact_every: int = 50) -> CheckpointManager:
+        checkpoint = CheckpointManager(self.dir, 'job', compact_every=compact_every, flush_interval=0)
+        self._managers.append(checkpoint)
+        return checkpoint
+
+    def _append_then_mark(self, compact_every: int) -> CheckpointManager:
+        """The processor's pattern: append a record, then mark its page done."""
+        checkpoint = self._reload(compact_every)
+        invoices = []
+        checkpoint.set_data('invoice_data', invoices)
+        for page in range(3):
+            invoices.append({'page': page})
+            checkpoint.update_data({'invoice_data': invoices, f'ocr_page_{page:03d}': True})
+        checkpoint.flush()
+        return self._reload(compact_every)
+
+    def test_append_then_mark_survives_journal_replay(self):
+        reloaded = self._append_then_mark(compact_every=50)
+        self.assertEqual(reloaded.get_data('invoice_data'), [{'page': 0}, {'page': 1}, {'page': 2}])
+        self.assertTrue(all(reloaded.get_data(f'ocr_page_{p:03d}') for p in range(3)))
+
+    def test_append_then_mark_survives_compaction(self):
+        reloaded = self._append_then_mark(compact_every=2)
+        self.assertEqual(reloaded.get_data('invoice_data'), [{'page': 0}, {'page': 1}, {'page': 2}])
+        self.assertTrue(all(reloaded.get_data(f'ocr_page_{p:03d}') for p in range(3)))
+
+    def test_snapshot_writes_in_place_changes(self):
+        checkpoint = self._reload(compact_every=2)
+        invoices = []
+        checkpoint.set_data('invoice_data', invoices)
+        for page in range(3):
+            invoices.append({'page': page})
+            checkpoint.set_data(f'ocr_page_{page:03d}', True)
+        checkpoint.save()
+        self.assertEqual(self._reload().get_data('invoice_data'), [{'page': 0}, {'page': 1}, {'page': 2}])
+
+    def test_torn_mutation_is_dropped_whole(self):
+        checkpoint = self._reload()
+        checkpoint.set_data('invoice_data', [])
+        checkpoint.update_data({'invoice_data': [{'page': 0}], 'ocr_page_000': True})
+        checkpoint.flush()
+        checkpoint._close_journal()
+
+        # Cut the last mutation short, after its first op line
+        lines = checkpoint.journal_file.read_bytes().splitlines(keepends=True)
+        checkpoint.journal_file.write_bytes(b''.join(lines[:-2]))
+
+        reloaded = self._reload()
+        self.assertEqual(reloaded.get_data('invoice_data'), [])
+        self.assertIsNone(reloaded.get_data('ocr_page_000'))
+        self.assertEqual(reloaded._pending_mutations, 0)
+
+    def test_replay_counts_mutations_not_lines(self):
+        checkpoint = self._reload()
+        checkpoint.set_data('first', 0)  # Writes the initial snapshot
+        for i in range(4):
+            checkpoint.update_data({f'a{i}': i, f'b{i}': i})
+        checkpoint.flush()
+        self.assertEqual(self._reload()._pending_mutations, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()